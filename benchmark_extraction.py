@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Offline Extraction Benchmark for Wuzzuf Scraper
+Runs each extraction backend over the recorded search pages in benchmark_pages/
+and reports cards/sec, time per field, peak memory and differences from the
+golden JSON saved next to each page. The golden JSON is the parser's reviewed
+output (--update-golden), so the parser is checked against its own past output
+and the browser backends against the parser.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from wuzzuf_http import RecordedPageServer
+from wuzzuf_parser import (
+    HTML_PARSER, DEFAULT_BASE_URL,
+    parse_jobs_html, find_job_cards, safe_extract, extract_experience, extract_skills,
+)
+from wuzzuf_selectors import (
+    TITLE_SELECTORS, COMPANY_SELECTORS, LOCATION_SELECTORS, JOB_TYPE_SELECTORS,
+    POSTING_DATE_SELECTORS, APPLICATION_LINK_SELECTORS, JOB_URL_SELECTORS,
+)
+
+CORPUS_DIR = Path(__file__).parent / "benchmark_pages"
+GOLDEN_SUFFIX = ".golden.json"
+BACKENDS = ("parser", "selenium", "javascript", "html")  # parser runs offline, the rest in Chrome
+IGNORED_FIELDS = ('scraped_at',)  # Differs on every run
+
+
+def load_corpus(directory=CORPUS_DIR):
+    """Return [(page number, path, html)] for every search_page_N.html, in page order"""
+    pages = []
+    for path in Path(directory).glob("search_page_*.html"):
+        try:
+            page = int(path.stem.rsplit('_', 1)[1])
+        except ValueError:
+            continue
+        pages.append((page, path, path.read_text(encoding='utf-8')))
+    return sorted(pages)
+
+
+def golden_path(page_path):
+    return page_path.with_name(page_path.stem + GOLDEN_SUFFIX)
+
+
+def normalize_job(job, base_url=DEFAULT_BASE_URL):
+    """Job without run-specific fields, with links rewritten to wuzzuf.net"""
+    job = {field: value for field, value in job.items() if field not in IGNORED_FIELDS}
+    for field in ('application_link', 'job_url'):
+        link = job.get(field, '')
+        if base_url != DEFAULT_BASE_URL and link.startswith(base_url):
+            job[field] = DEFAULT_BASE_URL + link[len(base_url):]
+    return job
+
+
+def compare_jobs(page, jobs, golden):
+    """Describe every difference between a page's jobs and its golden jobs"""
+    if golden is None:
+        return [f"page {page}: no golden file (run with --update-golden)"]
+    differences = []
+    if len(jobs) != len(golden):
+        differences.append(f"page {page}: {len(jobs)} jobs, golden has {len(golden)}")
+    for index, (job, expected) in enumerate(zip(jobs, golden)):
+        for field in sorted(set(job) | set(expected)):
+            if job.get(field) != expected.get(field):
+                differences.append(
+                    f"page {page} job {index + 1} {field}: {job.get(field)!r} != {expected.get(field)!r}"
+                )
+    return differences
+
+
+def load_golden(page_path):
+    path = golden_path(page_path)
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def parser_fields():
+    """Field name -> function reading it from a BeautifulSoup card"""
+    return {
+        'title': lambda card: safe_extract(card, TITLE_SELECTORS),
+        'company': lambda card: safe_extract(card, COMPANY_SELECTORS),
+        'location': lambda card: safe_extract(card, LOCATION_SELECTORS),
+        'job_type': lambda card: safe_extract(card, JOB_TYPE_SELECTORS),
+        'experience_level': extract_experience,
+        'skills': extract_skills,
+        'posting_date': lambda card: safe_extract(card, POSTING_DATE_SELECTORS),
+        'application_link': lambda card: safe_extract(card, APPLICATION_LINK_SELECTORS, extract_href=True),
+        'job_url': lambda card: safe_extract(card, JOB_URL_SELECTORS, extract_href=True),
+    }
+
+
+def selenium_fields(scraper):
+    """Field name -> function reading it from a WebElement card, as extract_single_job does"""
+    return {
+        'title': lambda card: scraper.safe_extract(card, TITLE_SELECTORS),
+        'company': lambda card: scraper.safe_extract(card, COMPANY_SELECTORS),
+        'location': lambda card: scraper.safe_extract(card, LOCATION_SELECTORS),
+        'job_type': lambda card: scraper.safe_extract(card, JOB_TYPE_SELECTORS),
+        'experience_level': scraper.extract_experience_smart,
+        'skills': scraper.extract_skills_comprehensive,
+        'posting_date': lambda card: scraper.safe_extract(card, POSTING_DATE_SELECTORS),
+        'application_link': lambda card: scraper.safe_extract(card, APPLICATION_LINK_SELECTORS, extract_href=True),
+        'job_url': lambda card: scraper.safe_extract(card, JOB_URL_SELECTORS, extract_href=True),
+    }
+
+
+def time_fields(fields, cards, field_seconds):
+    """Add the time each field takes over all cards to field_seconds"""
+    for field, read in fields.items():
+        started = time.perf_counter()
+        for card in cards:
+            read(card)
+        field_seconds[field] = field_seconds.get(field, 0.0) + time.perf_counter() - started
+
+
+def new_result(backend):
+    return {
+        'backend': backend, 'pages': 0, 'cards': 0, 'seconds': 0.0,
+        'field_seconds': {}, 'peak_python_kb': None, 'browser_mb': None, 'differences': [],
+    }
+
+
+def run_parser(corpus, repeat=3):
+    """Benchmark wuzzuf_parser on the raw HTML, no browser involved"""
+    result = new_result("parser")
+    fields = parser_fields()
+
+    for _ in range(repeat):
+        for page, path, html in corpus:
+            started = time.perf_counter()
+            jobs = parse_jobs_html(html)
+            result['seconds'] += time.perf_counter() - started
+            result['pages'] += 1
+            result['cards'] += len(jobs)
+
+            cards = find_job_cards(BeautifulSoup(html, HTML_PARSER))
+            time_fields(fields, cards, result['field_seconds'])
+
+    # Memory in a separate pass, tracemalloc slows everything down
+    tracemalloc.start()
+    for page, path, html in corpus:
+        jobs = [normalize_job(job) for job in parse_jobs_html(html)]
+        result['differences'] += compare_jobs(page, jobs, load_golden(path))
+    result['peak_python_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return result
+
+
+def run_browser(extraction_mode, corpus, corpus_dir=CORPUS_DIR, repeat=3):
+    """Benchmark a SimpleWuzzufScraper extraction mode in headless Chrome
+
+    Pages are served by RecordedPageServer and loaded once per repeat; only the
+    extraction itself is timed, not page loads.
+    """
+    from simple_wuzzuf_scraper import SimpleWuzzufScraper
+    from wuzzuf_driver import browser_memory_mb
+
+    result = new_result(extraction_mode)
+    with RecordedPageServer(corpus_dir) as server:
+        scraper = SimpleWuzzufScraper(
+            headless=True,
+            extraction_mode=extraction_mode,
+            base_url=server.url,
+            close_after_search=False,
+            browser_profile="lean",
+            output_formats=(),
+            seen_index=False,
+            enricher=False,
+            page_cache=False
+        )
+        fields = selenium_fields(scraper) if extraction_mode == "selenium" else {}
+        try:
+            scraper.ensure_driver()  # A browser that can't start skips the backend
+            scraper.current_keyword = "benchmark"
+            tracemalloc.start()
+            for run in range(repeat):
+                for page, path, html in corpus:
+                    if not scraper.go_to_page(page):
+                        result['differences'].append(f"page {page}: could not be loaded")
+                        continue
+                    job_cards, card_selector = scraper.find_job_cards()
+
+                    started = time.perf_counter()
+                    jobs = scraper.extract_page_jobs(job_cards, card_selector)
+                    result['seconds'] += time.perf_counter() - started
+                    result['pages'] += 1
+                    result['cards'] += len(jobs)
+
+                    time_fields(fields, job_cards, result['field_seconds'])
+                    if run == 0:
+                        jobs = [normalize_job(job, scraper.base_url) for job in jobs]
+                        result['differences'] += compare_jobs(page, jobs, load_golden(path))
+            result['peak_python_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+            result['browser_mb'] = browser_memory_mb(scraper.driver)
+        finally:
+            tracemalloc.stop()
+            scraper.close()
+    return result
+
+
+def update_golden(corpus):
+    """Write the parser's current output as the golden JSON of every page"""
+    for page, path, html in corpus:
+        jobs = [normalize_job(job) for job in parse_jobs_html(html)]
+        golden_path(path).write_text(json.dumps(jobs, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"✅ {golden_path(path).name}: {len(jobs)} jobs")
+
+
+def print_report(results):
+    """Print one summary line per backend, then the field timings and differences"""
+    print("\n📊 Extraction benchmark")
+    print(f"{'backend':<12}{'pages':>7}{'cards':>8}{'cards/sec':>12}{'peak py KB':>12}{'chrome MB':>11}{'diffs':>7}")
+    for result in results:
+        rate = result['cards'] / result['seconds'] if result['seconds'] else 0.0
+        peak = f"{result['peak_python_kb']:.0f}" if result['peak_python_kb'] is not None else "-"
+        browser = f"{result['browser_mb']:.0f}" if result['browser_mb'] is not None else "-"
+        print(f"{result['backend']:<12}{result['pages']:>7}{result['cards']:>8}{rate:>12.0f}"
+              f"{peak:>12}{browser:>11}{len(result['differences']):>7}")
+
+    for result in results:
+        if result['field_seconds'] and result['cards']:
+            print(f"\n⏱️ {result['backend']} time per card by field:")
+            for field, seconds in sorted(result['field_seconds'].items(), key=lambda item: -item[1]):
+                print(f"   {field:<18}{seconds / result['cards'] * 1e6:>10.1f} µs")
+        if result['differences']:
+            print(f"\n⚠️ {result['backend']} differs from the golden output:")
+            for difference in result['differences'][:20]:
+                print(f"   {difference}")
+            if len(result['differences']) > 20:
+                print(f"   ... and {len(result['differences']) - 20} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Wuzzuf extraction backends on recorded pages")
+    parser.add_argument("--backends", default="parser,selenium,javascript",
+                        help=f"Comma-separated backends to run, any of {', '.join(BACKENDS)}")
+    parser.add_argument("--corpus", default=str(CORPUS_DIR), help="Directory with search_page_N.html files")
+    parser.add_argument("--repeat", type=int, default=3, help="Times each page is extracted")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--update-golden", action="store_true",
+                        help="Save the parser's current output as the golden JSON and exit")
+    args = parser.parse_args()
+
+    corpus_dir = Path(args.corpus)
+    corpus = load_corpus(corpus_dir)
+    if not corpus:
+        print(f"❌ No search_page_N.html files in {corpus_dir}")
+        return 1
+    if args.update_golden:
+        update_golden(corpus)
+        return 0
+
+    backends = [backend.strip() for backend in args.backends.split(',') if backend.strip()]
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        print(f"❌ Unknown backends: {sorted(unknown)} (expected any of {BACKENDS})")
+        return 1
+
+    print(f"📂 {len(corpus)} recorded pages from {corpus_dir}")
+    results = []
+    skipped = []
+    for backend in backends:
+        print(f"🏃 Running {backend}...")
+        try:
+            if backend == "parser":
+                results.append(run_parser(corpus, args.repeat))
+            else:
+                results.append(run_browser(backend, corpus, corpus_dir, args.repeat))
+        except Exception as e:
+            print(f"⚠️ Skipping {backend}: {e}")
+            skipped.append(backend)
+
+    print_report(results)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"\n💾 Results saved to {args.json}")
+    if skipped:
+        print(f"\n❌ Could not run: {', '.join(skipped)}")
+    # Non-zero exit when any backend drifted from the golden output or could not run
+    return 1 if skipped or any(result['differences'] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,54 @@ Easy way to run the scraper with different settings
 import os
 import sys
 from simple_wuzzuf_scraper import SimpleWuzzufScraper
+from wuzzuf_campaign import CampaignRunner, campaign_from_fields
+from wuzzuf_driver import DriverPool
+from wuzzuf_sinks import recover_partial_files
+
+# Browsers shared by every menu entry, one pool per headless setting
+driver_pools = {}
+
+def get_driver_pool(headless=False):
+    """Return the shared driver pool, starting it on first use"""
+    if headless not in driver_pools:
+        try:
+            from simple_config import DRIVER_POOL_SIZE, DRIVER_MAX_PAGES, DRIVER_MAX_MEMORY_MB, BROWSER_PROFILE
+        except ImportError:
+            DRIVER_POOL_SIZE, DRIVER_MAX_PAGES, DRIVER_MAX_MEMORY_MB, BROWSER_PROFILE = 2, 50, 1500, "default"
+        driver_pools[headless] = DriverPool(
+            size=DRIVER_POOL_SIZE,
+            headless=headless,
+            max_pages_per_driver=DRIVER_MAX_PAGES,
+            max_memory_mb=DRIVER_MAX_MEMORY_MB,
+            profile=BROWSER_PROFILE
+        )
+    return driver_pools[headless]
+
+def shutdown_driver_pools():
+    """Quit every shared browser"""
+    for pool in driver_pools.values():
+        pool.shutdown()
+    driver_pools.clear()
+
+def run_search(scraper, keyword, location, max_pages, filename_prefix):
+    """Run a search that streams jobs to disk, so Ctrl-C keeps everything scraped so far"""
+    try:
+        from simple_config import STREAM_BATCH_SIZE
+    except ImportError:
+        STREAM_BATCH_SIZE = 25
+    
+    sinks = scraper.open_stream(filename_prefix, batch_size=STREAM_BATCH_SIZE)
+    try:
+        scraper.search_jobs(
+            keyword=keyword,
+            location=location,
+            max_pages=max_pages,
+            sinks=sinks
+        )
+    except KeyboardInterrupt:
+        print("\n⏹️ Search interrupted, keeping the jobs scraped so far")
+    finally:
+        scraper.close_stream()
 
 def show_menu():
     """Show the main menu"""
@@ -18,7 +66,8 @@ def show_menu():
     print("3. 🔧 Custom Search")
     print("4. 📊 Show Current Data")
     print("5. ⚙️  Show Current Config")
-    print("6. 🚪 Exit")
+    print("6. 🚀 Campaign (all engineering fields)")
+    print("7. 🚪 Exit")
     print("=" * 50)
 
 def quick_search():
@@ -26,15 +75,10 @@ def quick_search():
     print("\n🔍 Quick Search: Software Engineering")
     print("-" * 40)
     
-    scraper = SimpleWuzzufScraper(headless=False)
+    scraper = SimpleWuzzufScraper(pool=get_driver_pool(False))
     
     try:
-        scraper.search_jobs(
-            keyword="software engineering",
-            location="",
-            max_pages=2
-        )
-        scraper.save_data("quick_search")
+        run_search(scraper, "software engineering", "", 2, "quick_search")
         print("✅ Quick search completed!")
         
     except Exception as e:
@@ -45,15 +89,10 @@ def location_search():
     print("\n🏢 Location Search: Cairo")
     print("-" * 40)
     
-    scraper = SimpleWuzzufScraper(headless=False)
+    scraper = SimpleWuzzufScraper(pool=get_driver_pool(False))
     
     try:
-        scraper.search_jobs(
-            keyword="engineering",
-            location="Cairo",
-            max_pages=2
-        )
-        scraper.save_data("cairo_search")
+        run_search(scraper, "engineering", "Cairo", 2, "cairo_search")
         print("✅ Cairo search completed!")
         
     except Exception as e:
@@ -82,20 +121,40 @@ def custom_search():
     
     print(f"\n🔍 Searching: {keyword} in {location or 'All locations'} ({max_pages} pages)")
     
-    scraper = SimpleWuzzufScraper(headless=headless)
+    scraper = SimpleWuzzufScraper(headless=headless, pool=get_driver_pool(headless))
     
     try:
-        scraper.search_jobs(
-            keyword=keyword,
-            location=location,
-            max_pages=max_pages
-        )
-        scraper.save_data("custom_search")
+        run_search(scraper, keyword, location, max_pages, "custom_search")
         print("✅ Custom search completed!")
         
     except Exception as e:
         print(f"❌ Error: {e}")
 
+def campaign_search():
+    """Run every engineering field from the config as one campaign"""
+    print("\n🚀 Campaign: All Engineering Fields")
+    print("-" * 40)
+    
+    try:
+        from simple_config import ENGINEERING_FIELDS, LOCATION, MAX_PAGES, CAMPAIGN_WORKERS
+    except ImportError:
+        print("⚠️ Configuration file not found")
+        return
+    
+    runner = CampaignRunner(
+        campaign_from_fields(ENGINEERING_FIELDS, LOCATION, MAX_PAGES),
+        workers=CAMPAIGN_WORKERS,
+        pool=get_driver_pool(True)
+    )
+    
+    try:
+        runner.run()
+        runner.save()
+        print("✅ Campaign completed!")
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
 def show_config():
     """Show current configuration"""
     print("\n⚙️  Current Configuration")
@@ -148,11 +207,20 @@ def show_current_data():
 
 def main():
     """Main launcher function"""
+    # Finish the files of runs that crashed before closing their streams
+    recover_partial_files("Data")
+    try:
+        run_menu()
+    finally:
+        shutdown_driver_pools()
+
+def run_menu():
+    """Show the menu until the user exits"""
     while True:
         show_menu()
         
         try:
-            choice = input("\nEnter your choice (1-6): ").strip()
+            choice = input("\nEnter your choice (1-7): ").strip()
             
             if choice == "1":
                 quick_search()
@@ -165,12 +233,14 @@ def main():
             elif choice == "5":
                 show_config()
             elif choice == "6":
+                campaign_search()
+            elif choice == "7":
                 print("\n👋 Goodbye!")
                 break
             else:
-                print("❌ Invalid choice. Please enter 1-6.")
+                print("❌ Invalid choice. Please enter 1-7.")
             
-            if choice in ["1", "2", "3", "4"]:
+            if choice in ["1", "2", "3", "4", "6"]:
                 input("\nPress Enter to continue...")
                 
         except KeyboardInterrupt:
@@ -7,12 +7,53 @@ MAX_PAGES = 3  # Number of pages to scrape
 
 # Scraping Settings
 HEADLESS_MODE = False  # Set to True to run without browser window
+BROWSER_PROFILE = "default"  # "default" or "lean" (blocks images, fonts, CSS and trackers to save bandwidth/RAM)
 DELAY_BETWEEN_PAGES = (2, 4)  # Random delay range in seconds
+READY_TIMEOUT = 10  # Max seconds to wait for job cards after loading a page
+NETWORK_IDLE_TIMEOUT = 5  # Max seconds to wait for the network to go idle
+PAGE_RETRIES = 2  # Reloads of a page that only repeats jobs already scraped before giving up
+RETRY_BACKOFF = 1.0  # Seconds before the first reload, doubled for each further reload
+PARALLEL_WORKERS = 1  # Workers splitting the pages of one search (1 = sequential)
+MAX_CONCURRENT_PER_HOST = 2  # Max simultaneous requests to wuzzuf.net across workers
+PAGINATION = "url"  # "url" (load page N by its URL) or "button" (click the next arrow)
+FETCH_MODE = "browser"  # "browser" (Chrome for every page) or "http" (plain HTTP, Chrome only as a fallback)
+EXTRACTION_MODE = "selenium"  # "selenium" (one WebDriver call per field), "javascript" (one call per page) or "html" (parse page source offline)
+
+# Page Cache Settings (wuzzuf_cache.py)
+PAGE_CACHE_MODE = "off"  # "off", "readwrite" (reuse pages fetched recently) or "replay" (serve only cached pages, fully offline)
+PAGE_CACHE_DIR = "Data/page_cache"  # Where cached pages are kept (gzip-compressed)
+PAGE_CACHE_TTL_HOURS = 24  # Refetch pages older than this (ignored in replay mode, 0 = never expire)
+PAGE_CACHE_MAX_MB = 200  # Delete least recently used pages above this size (0 = no limit)
+CACHE_DETAIL_PAGES = True  # Always cache job detail pages so enrichment re-runs skip them
+
+# Job Detail Settings (wuzzuf_enrichment.py)
+ENRICH_DETAILS = False  # Open every job's page to add description, requirements, salary and vacancies
+DETAIL_WORKERS = 4  # Detail pages fetched at the same time (still limited by MAX_CONCURRENT_PER_HOST)
+DETAIL_FETCH_MODE = "http"  # "http" (pooled HTTP sessions) or "browser" (headless Chrome from a small driver pool)
 
 # Output Settings
 OUTPUT_PREFIX = "wuzzuf_jobs"  # Prefix for output files
 SAVE_CSV = True  # Save to CSV
 SAVE_JSON = True  # Save to JSON
+SAVE_PARQUET = False  # Save to typed Parquet (needs pyarrow), much smaller and faster to load for analytics
+SAVE_SQLITE = True  # Upsert every job into the shared SQLite job store below
+JOB_STORE_PATH = "Data/wuzzuf_jobs.db"  # One database with every job ever scraped (see wuzzuf_store.py)
+SEARCH_INDEX = True  # Keep a full-text search index of the job store up to date after every save (see wuzzuf_index.py)
+TRACK_SEEN_JOBS = True  # Remember every job link in the job store's seen-job index
+ONLY_NEW_JOBS = False  # Skip jobs seen in earlier runs and stop at the first page with nothing new
+STREAM_BATCH_SIZE = 25  # Jobs written between fsyncs when streaming results to disk (also synced after every page)
+
+# ChromeDriver Settings
+CHROMEDRIVER_PATH = ""  # Pin a chromedriver binary (skips version lookup entirely)
+OFFLINE_DRIVER = False  # Never contact the network for ChromeDriver, use the cached or pinned binary
+
+# Driver Pool Settings (browsers shared across runs)
+DRIVER_POOL_SIZE = 2  # Max browsers kept alive at once
+DRIVER_MAX_PAGES = 50  # Restart a browser after this many pages
+DRIVER_MAX_MEMORY_MB = 1500  # Restart a browser above this memory use (needs psutil)
+
+# Campaign Settings (run_scraper.py option 6 / wuzzuf_campaign.py)
+CAMPAIGN_WORKERS = 2  # Searches running at the same time, each with its own reused browser
 
 # Engineering Fields (examples)
 ENGINEERING_FIELDS = [
@@ -4,97 +4,458 @@ Simple Wuzzuf Engineering Job Scraper
 Extracts job listings from Wuzzuf.net using Selenium
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 import json
 import csv
 from datetime import datetime
 import random
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
 
+from wuzzuf_selectors import (
+    JOB_CARD_SELECTOR, JOB_CARD_FALLBACK_SELECTOR,
+    TITLE_SELECTORS, COMPANY_SELECTORS, LOCATION_SELECTORS, JOB_TYPE_SELECTORS,
+    POSTING_DATE_SELECTORS, APPLICATION_LINK_SELECTORS, JOB_URL_SELECTORS,
+    EXPERIENCE_SPAN_SELECTOR, EXPERIENCE_ANCHOR_SELECTOR, EXPERIENCE_KEYWORDS,
+    PRIMARY_SKILL_SELECTOR, SECONDARY_SKILL_SELECTOR, SKILL_MAX_LENGTH,
+    SKILL_EXCLUDES, SKILL_CATEGORY_EXCLUDES, DEFAULT_TEXT, DEFAULT_LINK,
+    NEXT_PAGE_ARROW_PATH,
+)
+from wuzzuf_parser import parse_jobs_html, card_job_url, job_key, job_url_key
+from wuzzuf_http import WuzzufHttpClient, HostThrottle, needs_browser
+from wuzzuf_readiness import PageReadiness
+from wuzzuf_driver import create_chrome_driver, BROWSER_PROFILES, POOL_ACQUIRE_TIMEOUT
+from wuzzuf_cache import configured_page_cache
+from wuzzuf_enrichment import configured_enricher
+from wuzzuf_index import configured_search_index, update_search_index
+from wuzzuf_sinks import ListSink, CsvSink, JsonLinesSink, ParquetSink
+from wuzzuf_store import (
+    JobStore, SqliteSink, configured_store_path, configured_only_new, configured_seen_index,
+)
+
+# Extraction modes
+EXTRACTION_MODES = ("selenium", "javascript", "html")
+
+# Fetch modes
+FETCH_MODES = ("browser", "http")
+
+# Pagination strategies
+PAGINATION_MODES = ("url", "button")
+
+# Output formats
+OUTPUT_FORMATS = ("csv", "json", "parquet", "sqlite")  # sqlite is the shared job store, not a session file
+
+
+def configured_output_formats():
+    """Output formats switched on by SAVE_CSV / SAVE_JSON / SAVE_PARQUET / SAVE_SQLITE in simple_config"""
+    try:
+        from simple_config import SAVE_CSV, SAVE_JSON, SAVE_PARQUET, SAVE_SQLITE
+    except ImportError:
+        return ("csv", "json")
+    enabled = {"csv": SAVE_CSV, "json": SAVE_JSON, "parquet": SAVE_PARQUET, "sqlite": SAVE_SQLITE}
+    return tuple(name for name in OUTPUT_FORMATS if enabled[name])
+
+
+# Extracts every job card on the page in one WebDriver round trip.
+# Mirrors extract_single_job: same selector order, same filters, same defaults.
+EXTRACT_JOBS_SCRIPT = """
+const cardSelector = arguments[0];
+const cfg = arguments[1];
+const linksOnly = arguments[2];  // Only return each card's job URL
+const wanted = arguments[3];     // Positions of the cards to extract, null for all
+
+function visibleText(el) {
+    if (!el) return "";
+    const style = window.getComputedStyle(el);
+    if (style.display === "none" || style.visibility === "hidden") return "";
+    return (el.innerText || "").replace(/\u00a0/g, " ").trim();
+}
+
+function safeExtract(card, selectors, extractHref) {
+    for (const selector of selectors) {
+        let found = null;
+        try { found = card.querySelector(selector); } catch (e) { continue; }
+        if (!found) continue;
+        if (extractHref) {
+            const href = found.href || found.getAttribute("href");
+            if (href && href.trim()) return href.trim();
+        } else {
+            const text = visibleText(found);
+            if (text) return text;
+        }
+    }
+    return extractHref ? cfg.defaultLink : cfg.defaultText;
+}
+
+function extractExperience(card) {
+    for (const span of card.querySelectorAll(cfg.experienceSpan)) {
+        const text = visibleText(span);
+        if (text && cfg.experienceKeywords.some(k => text.toLowerCase().includes(k))) return text;
+    }
+    const anchors = card.querySelectorAll(cfg.experienceAnchor);
+    if (anchors.length >= 2) {
+        const text = visibleText(anchors[1]);
+        if (text) return text;
+    }
+    return cfg.defaultText;
+}
+
+function extractSkills(card) {
+    const skills = [];
+    const isSkill = (text, excludes) => text.length < cfg.skillMaxLength &&
+        !excludes.some(e => text.toLowerCase().includes(e));
+    for (const elem of card.querySelectorAll(cfg.primarySkill)) {
+        const text = visibleText(elem);
+        if (text && !skills.includes(text) && isSkill(text, cfg.skillExcludes)) skills.push(text);
+    }
+    for (const elem of card.querySelectorAll(cfg.secondarySkill)) {
+        const text = visibleText(elem);
+        if (text && !skills.includes(text) && isSkill(text, cfg.skillExcludes) &&
+            isSkill(text, cfg.skillCategoryExcludes)) skills.push(text);
+    }
+    return skills;
+}
+
+const cards = Array.from(document.querySelectorAll(cardSelector));
+if (linksOnly) return cards.map(card => safeExtract(card, cfg.jobUrl, true));
+return (wanted ? wanted.map(i => cards[i]).filter(Boolean) : cards).map(card => ({
+    title: safeExtract(card, cfg.title, false),
+    company: safeExtract(card, cfg.company, false),
+    location: safeExtract(card, cfg.location, false),
+    job_type: safeExtract(card, cfg.jobType, false),
+    experience_level: extractExperience(card),
+    skills: extractSkills(card),
+    posting_date: safeExtract(card, cfg.postingDate, false),
+    application_link: safeExtract(card, cfg.applicationLink, true),
+    job_url: safeExtract(card, cfg.jobUrl, true)
+}));
+"""
+
+# Selector configuration passed to EXTRACT_JOBS_SCRIPT
+EXTRACT_JOBS_CONFIG = {
+    'title': TITLE_SELECTORS,
+    'company': COMPANY_SELECTORS,
+    'location': LOCATION_SELECTORS,
+    'jobType': JOB_TYPE_SELECTORS,
+    'postingDate': POSTING_DATE_SELECTORS,
+    'applicationLink': APPLICATION_LINK_SELECTORS,
+    'jobUrl': JOB_URL_SELECTORS,
+    'experienceSpan': EXPERIENCE_SPAN_SELECTOR,
+    'experienceAnchor': EXPERIENCE_ANCHOR_SELECTOR,
+    'experienceKeywords': EXPERIENCE_KEYWORDS,
+    'primarySkill': PRIMARY_SKILL_SELECTOR,
+    'secondarySkill': SECONDARY_SKILL_SELECTOR,
+    'skillMaxLength': SKILL_MAX_LENGTH,
+    'skillExcludes': SKILL_EXCLUDES,
+    'skillCategoryExcludes': SKILL_CATEGORY_EXCLUDES,
+    'defaultText': DEFAULT_TEXT,
+    'defaultLink': DEFAULT_LINK,
+}
+
 class SimpleWuzzufScraper:
-    def __init__(self, headless=False):
-        """Initialize the scraper"""
-        self.base_url = "https://wuzzuf.net"
+    def __init__(self, headless=None, extraction_mode="selenium", fetch_mode="browser",
+                 base_url="https://wuzzuf.net", browser_fallback=True,
+                 ready_timeout=10, network_idle_timeout=5, pagination="url",
+                 delay_range=(2, 4), workers=1, max_per_host=2, close_after_search=True,
+                 pool=None, browser_profile="default", keep_jobs=True, output_formats=None,
+                 store_path=None, only_new=None, seen_index=None, page_retries=2, retry_backoff=1.0,
+                 enricher=None, page_cache=None):
+        """Initialize the scraper
+
+        extraction_mode: "selenium" reads each field with its own WebDriver call,
+        "javascript" reads every card on the page with a single execute_script call,
+        "html" reads driver.page_source once and parses it offline with wuzzuf_parser
+        
+        fetch_mode: "browser" drives Chrome for every page, "http" fetches pages over a
+        pooled HTTP session and only starts Chrome (if browser_fallback) for pages
+        that need client-side rendering
+        
+        ready_timeout / network_idle_timeout: upper bounds in seconds for the
+        condition-based page readiness waits
+        
+        pagination: "url" loads page N straight from its search URL and only clicks
+        the next button as a fallback, "button" always clicks the next button
+        
+        workers: number of parallel workers (headless drivers or HTTP sessions) that
+        split the pages of one search, with at most max_per_host requests to the same
+        host at once and the delay_range politeness delay applied per worker
+        
+        close_after_search: quit the browser when a search finishes; set to False to
+        reuse the same browser for several searches and call close() when done
+        
+        pool: optional wuzzuf_driver.DriverPool; the scraper borrows a driver from it
+        when it first needs a browser and returns it instead of quitting Chrome
+        
+        browser_profile: "default", or "lean" to block images, fonts, CSS and
+        third-party trackers; headless defaults to True for the lean profile
+        
+        keep_jobs: collect every job in jobs_data; set to False when results only
+        go to sinks (search_jobs(sinks=...)) or iter_jobs, so memory stays flat
+        
+        output_formats: files written by save_data/open_stream, any of "csv", "json"
+        and "parquet", plus "sqlite" to upsert into the job store at store_path;
+        both default to the simple_config settings
+        
+        only_new: skip cards already in the seen-job index without extracting them,
+        and stop paginating at the first page with only known jobs. seen_index is
+        the wuzzuf_store.SeenJobIndex to check and update (None for the one set up
+        by ONLY_NEW_JOBS / TRACK_SEEN_JOBS in simple_config, False for none)
+        
+        page_retries / retry_backoff: how many times a page that only repeats jobs
+        from this run is reloaded before the search stops, waiting retry_backoff
+        seconds before the first reload and doubling each time
+        
+        enricher: wuzzuf_enrichment.JobEnricher that adds detail page fields
+        (description, requirements, salary, vacancies) to each page's jobs before
+        they are yielded (None for the one set up by ENRICH_DETAILS in simple_config,
+        False for none)
+        
+        page_cache: wuzzuf_cache.PageCache for results pages (None for the one set
+        up by PAGE_CACHE_MODE in simple_config, False for none). With a cache, pages
+        are loaded one by one by URL and cached pages are parsed offline; in replay
+        mode no page is ever fetched and Chrome/HTTP sessions are not started
+        """
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction_mode} (expected one of {EXTRACTION_MODES})")
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode} (expected one of {FETCH_MODES})")
+        if pagination not in PAGINATION_MODES:
+            raise ValueError(f"Unknown pagination mode: {pagination} (expected one of {PAGINATION_MODES})")
+        if browser_profile not in BROWSER_PROFILES:
+            raise ValueError(f"Unknown browser profile: {browser_profile} (expected one of {BROWSER_PROFILES})")
+        if headless is None:
+            headless = browser_profile == "lean"
+        if output_formats is None:
+            output_formats = configured_output_formats()
+        unknown_formats = set(output_formats) - set(OUTPUT_FORMATS)
+        if unknown_formats:
+            raise ValueError(f"Unknown output formats: {sorted(unknown_formats)} (expected any of {OUTPUT_FORMATS})")
+        self.base_url = base_url.rstrip('/')
+        self.extraction_mode = extraction_mode
+        self.fetch_mode = fetch_mode
+        self.browser_fallback = browser_fallback
+        self.pagination = pagination
+        self.delay_range = delay_range
+        self.workers = workers
+        self.max_per_host = max_per_host
+        self.close_after_search = close_after_search
+        self.pool = pool
+        self.browser_profile = browser_profile
+        self.headless = headless
+        self.ready_timeout = ready_timeout
+        self.network_idle_timeout = network_idle_timeout
+        self.keep_jobs = keep_jobs
+        self.output_formats = tuple(output_formats)
+        self.store_path = configured_store_path() if store_path is None else store_path
+        self.only_new = configured_only_new() if only_new is None else only_new
+        if seen_index is None:
+            seen_index = configured_seen_index(self.only_new)
+        self.seen_index = seen_index or None
+        self.skipped_known = 0  # Cards skipped because they were already seen
+        self.page_retries = page_retries
+        self.retry_backoff = retry_backoff
+        if page_cache is None:
+            page_cache = configured_page_cache()
+        self.page_cache = page_cache or None
+        if enricher is None:
+            enricher = configured_enricher(max_per_host=max_per_host, cache=self.page_cache)
+        self.enricher = enricher or None
+        self.seen_keys = set()  # job_key of every job yielded in this run
+        self.page_dedup_stats = {}  # page number -> new and duplicate job counts
         self.jobs_data = []
-        self.setup_driver(headless)
+        self.page_wait_times = {}  # page number -> seconds spent waiting for it to be ready
+        self.page_network_stats = {}  # page number -> requests/bytes loaded and blocked (bytes blocked estimated)
+        self.current_keyword = ""
+        self.current_location = ""
+        self.current_page = 1
+        self.last_page_cached = False  # Whether fetch_page_jobs served the last page from the page cache
+        self.driver = None
+        self.driver_startup_seconds = None  # How long the last Chrome cold start took
+        self.readiness = None
+        self.http = None
+        self.stream = None  # Session folder and sinks of the current open_stream()
+        self.stream_lock = threading.Lock()  # close_stream() may race with a GUI stop
+        
+        # Chrome starts on first use (ensure_driver), parallel runs only start the workers' browsers
+        if self.page_cache is not None and self.page_cache.replay:
+            pass  # Everything comes from the cache
+        elif fetch_mode == "http":
+            self.http = WuzzufHttpClient()
     
     def setup_driver(self, headless):
         """Setup Chrome driver"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-logging")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--log-level=3")
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
         try:
-            # Auto-install ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 10)
+            self.attach_driver(create_chrome_driver(headless, profile=self.browser_profile))
+            self.driver_startup_seconds = self.driver.startup_times['total_seconds']
             print("✅ Chrome driver setup successful")
         except Exception as e:
             print(f"❌ Error setting up Chrome driver: {e}")
             raise
     
-    def search_jobs(self, keyword="engineering", location="", max_pages=3):
-        """Search for jobs with pagination"""
-        search_url = f"{self.base_url}/search/jobs?q={keyword.replace(' ', '+')}"
-        if location:
-            search_url += f"&l={location.replace(' ', '+')}"
+    def attach_driver(self, driver):
+        """Use an already running driver for the following pages"""
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, self.ready_timeout)
+        self.readiness = PageReadiness(
+            self.driver,
+            timeout=self.ready_timeout,
+            network_idle_timeout=self.network_idle_timeout
+        )
+        self.readiness.network.reset()  # Drop events left over from a previous borrower
+    
+    def ensure_driver(self):
+        """Make sure a browser is available, borrowing from the pool or starting Chrome"""
+        if self.driver is not None:
+            return
+        if self.pool is not None:
+            self.attach_driver(self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT))
+        else:
+            self.setup_driver(self.headless)
+    
+    def build_search_url(self, keyword, location="", page=1):
+        """Build the search results URL for a given page (1-based)"""
+        return build_search_url(self.base_url, keyword, location, page)
+    
+    def search_jobs(self, keyword="engineering", location="", max_pages=3, sinks=()):
+        """Search for jobs with pagination
+        
+        Each job goes to jobs_data (when keep_jobs is set) and to every sink as soon
+        as it is extracted; sinks are flushed after every page and left open for
+        the caller to close.
+        """
+        sinks = list(sinks)
+        if self.keep_jobs:
+            sinks.insert(0, ListSink(self.jobs_data))
+        
+        with closing(self.iter_pages(keyword, location, max_pages)) as pages:
+            for page, jobs in pages:
+                for job in jobs:
+                    for sink in sinks:
+                        sink.write(job)
+                    print(f"📋 {job['title'][:50]}...")
+                for sink in sinks:
+                    sink.flush()
+    
+    def iter_jobs(self, keyword="engineering", location="", max_pages=3):
+        """Yield each job as it is extracted, without collecting them in jobs_data"""
+        with closing(self.iter_pages(keyword, location, max_pages)) as pages:
+            for page, jobs in pages:
+                yield from jobs
+    
+    def iter_pages(self, keyword="engineering", location="", max_pages=3):
+        """Yield (page number, jobs) for each results page with the configured fetch mode
+        
+        Jobs are added to the seen-job index once the consumer has handled their page.
+        """
+        if self.workers > 1 and max_pages > 1:
+            pages = self.iter_pages_parallel(keyword, location, max_pages)
+        elif self.fetch_mode == "http" or self.page_cache is not None:
+            pages = self.iter_pages_http(keyword, location, max_pages)
+        else:
+            pages = self.iter_pages_browser(keyword, location, max_pages)
+        
+        try:
+            with closing(pages):
+                for page, jobs in pages:
+                    if self.enricher is not None:
+                        jobs = self.enricher.enrich(jobs)
+                    yield page, jobs
+                    if self.seen_index is not None:
+                        self.seen_index.add(jobs)
+        finally:
+            # Also when the consumer stops early (break, close() or an exception)
+            self.report_duplicates()
+    
+    def split_new_jobs(self, page, jobs):
+        """Return the jobs not already seen in this run and record the page's new/duplicate counts"""
+        new_jobs = []
+        for job in jobs:
+            key = job_key(job)
+            if key not in self.seen_keys:
+                self.seen_keys.add(key)
+                new_jobs.append(job)
+        
+        duplicates = len(jobs) - len(new_jobs)
+        # A reloaded page replaces its earlier attempt
+        self.page_dedup_stats[page] = {'new': len(new_jobs), 'duplicates': duplicates}
+        if duplicates:
+            print(f"🔁 Page {page}: {len(new_jobs)} new, {duplicates} duplicates")
+        return new_jobs
+    
+    def duplicate_ratio(self):
+        """Share of extracted jobs in this run that were duplicates"""
+        new = sum(stats['new'] for stats in self.page_dedup_stats.values())
+        duplicates = sum(stats['duplicates'] for stats in self.page_dedup_stats.values())
+        total = new + duplicates
+        return duplicates / total if total else 0.0
+    
+    def report_duplicates(self):
+        """Print the run's duplicate ratio, a high ratio means pagination is failing"""
+        if not self.page_dedup_stats:
+            return
+        new = sum(stats['new'] for stats in self.page_dedup_stats.values())
+        duplicates = sum(stats['duplicates'] for stats in self.page_dedup_stats.values())
+        print(f"🔁 Duplicates: {duplicates} of {new + duplicates} extracted jobs "
+              f"({self.duplicate_ratio():.0%}) across {len(self.page_dedup_stats)} pages")
+    
+    def iter_pages_browser(self, keyword="engineering", location="", max_pages=3):
+        """Yield the jobs on each results page, clicking through them in Chrome"""
+        search_url = self.build_search_url(keyword, location)
+        self.current_keyword = keyword
+        self.current_location = location
         
         print(f"🔍 Searching: {keyword} in {location or 'All locations'}")
         print(f"📡 URL: {search_url}")
         
         try:
-            self.driver.get(search_url)
+            self.ensure_driver()
+            self.readiness.navigate(search_url)
             print("⏳ Waiting for page to load...")
             
-            # Wait for dynamic content to load
-            time.sleep(5)  # Increased wait time for dynamic content
+            # Wait for job cards and dynamic content to load
+            self.readiness.wait_for_page()
             
             # Try to scroll down to trigger lazy loading
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            self.readiness.wait_for_network_idle()
             
             page = 1
-            total_jobs_before = 0
             
             while page <= max_pages:
                 print(f"📄 Scraping page {page}...")
+                self.current_page = page
+                self.record_page_wait(page)
+                
+                # Extract jobs from current page, reloading it a bounded number of
+                # times if it only repeats jobs we already have
+                for attempt in range(self.page_retries + 1):
+                    if attempt:
+                        delay = self.retry_backoff * 2 ** (attempt - 1)
+                        print(f"🔁 Page {page} only had duplicates, reloading in {delay:.1f}s ({attempt}/{self.page_retries})")
+                        time.sleep(delay)
+                        previous_first_card = self.readiness.first_card()
+                        self.readiness.network.begin_navigation()
+                        self.driver.refresh()
+                        self.readiness.wait_for_page(previous_first_card)
+                    
+                    jobs = self.extract_jobs_from_page()
+                    new_jobs = self.split_new_jobs(page, jobs)
+                    if new_jobs or not jobs:
+                        break
                 
-                # Extract jobs from current page
-                jobs_found = self.extract_jobs_from_page()
-                if jobs_found == 0:
+                if not jobs:
                     print("⚠️ No more jobs found, stopping")
                     break
-                
-                # Check if we're getting new jobs (not duplicates)
-                current_total = len(self.jobs_data)
-                if current_total == total_jobs_before:
-                    # Try to force page refresh and wait longer
-                    self.driver.refresh()
-                    time.sleep(5)  # Longer wait for refresh
-                    continue
-                
-                total_jobs_before = current_total
-                
-
-    
-                # Try to go to next page (this will also detect if we're on the last page)
+                if not new_jobs:
+                    print(f"⚠️ Page {page} still only has duplicates, pagination looks stuck - stopping")
+                    break
+                yield page, new_jobs
                 
                 # Try to go to next page
                 if not self.go_to_next_page():
@@ -103,93 +464,399 @@ class SimpleWuzzufScraper:
                 
                 page += 1
                 # Respectful delay
-                delay = random.uniform(2, 4)
+                delay = random.uniform(*self.delay_range)
                 print(f"⏳ Waiting {delay:.1f} seconds...")
                 time.sleep(delay)
                 
         except Exception as e:
             print(f"❌ Error during search: {e}")
         finally:
-            self.driver.quit()
+            self.finish_search()
+    
+    def iter_pages_http(self, keyword="engineering", location="", max_pages=3):
+        """Yield the jobs on each results page, fetched one by one by URL (over HTTP, or from the page cache)"""
+        print(f"🔍 Searching: {keyword} in {location or 'All locations'}")
+        print(f"📡 URL: {self.build_search_url(keyword, location)}")
+        
+        try:
+            for page in range(1, max_pages + 1):
+                print(f"📄 Scraping page {page}...")
+                
+                try:
+                    jobs = self.fetch_page_jobs(keyword, location, page)
+                except Exception as e:
+                    print(f"❌ Error fetching page: {e}")
+                    break
+                
+                if not jobs:
+                    print("⚠️ No more jobs found, stopping")
+                    break
+                print(f"Found {len(jobs)} job cards")
+                new_jobs = self.split_new_jobs(page, jobs)
+                if not new_jobs:
+                    print(f"⚠️ Page {page} only has duplicates, pagination looks stuck - stopping")
+                    break
+                yield page, new_jobs
+                
+                if page < max_pages and not self.last_page_cached:
+                    # Respectful delay, nothing to be respectful about for cached pages
+                    delay = random.uniform(*self.delay_range)
+                    print(f"⏳ Waiting {delay:.1f} seconds...")
+                    time.sleep(delay)
+                    
+        except Exception as e:
+            print(f"❌ Error during search: {e}")
+        finally:
+            self.finish_search()
+    
+    def iter_pages_parallel(self, keyword="engineering", location="", max_pages=3):
+        """Yield the jobs on each results page, splitting the pages across a pool of workers
+        
+        Pages are yielded in order as soon as they and every page before them are done.
+        """
+        print(f"🔍 Searching: {keyword} in {location or 'All locations'}")
+        print(f"🧵 Scraping {max_pages} pages with {self.workers} parallel workers")
+        
+        throttle = HostThrottle(self.max_per_host)
+        if self.pool is not None and self.fetch_mode == "browser":
+            # Every worker keeps a pooled driver for the whole run
+            self.pool.ensure_capacity(self.workers)
+        local = threading.local()
+        worker_scrapers = []
+        workers_lock = threading.Lock()
+        state = {'last_page': max_pages}  # Lowest page known to be past the end of the results
+        
+        def scrape(page):
+            if page > state['last_page']:
+                return page, []
+            
+            # Each worker thread keeps its own driver or HTTP session
+            if not hasattr(local, 'scraper'):
+                local.scraper = self.create_worker()
+                with workers_lock:
+                    worker_scrapers.append(local.scraper)
+            
+            print(f"📄 Scraping page {page}...")
+            try:
+                with throttle.for_url(self.base_url):
+                    jobs = local.scraper.fetch_page_jobs(keyword, location, page)
+            except Exception as e:
+                print(f"❌ Error fetching page {page}: {e}")
+                jobs = []
+            
+            if not jobs:
+                with workers_lock:
+                    state['last_page'] = min(state['last_page'], page)
+            
+            # Respectful delay, applied per worker (not needed after a cached page)
+            if not local.scraper.last_page_cached:
+                time.sleep(random.uniform(*self.delay_range))
+            return page, jobs
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                # map() returns results in page order, stop at the first page with no jobs
+                for page, jobs in executor.map(scrape, range(1, max_pages + 1)):
+                    if not jobs:
+                        print(f"⚠️ No more jobs found after page {page - 1}, stopping")
+                        state['last_page'] = min(state['last_page'], page)
+                        break
+                    print(f"Found {len(jobs)} job cards on page {page}")
+                    new_jobs = self.split_new_jobs(page, jobs)
+                    if not new_jobs:
+                        print(f"⚠️ Page {page} only has duplicates, pagination looks stuck - stopping")
+                        state['last_page'] = min(state['last_page'], page)
+                        break
+                    yield page, new_jobs
+                
+        except Exception as e:
+            print(f"❌ Error during search: {e}")
+        finally:
+            for worker in worker_scrapers:
+                worker.close()
+            self.finish_search()
+    
+    def create_worker(self):
+        """Create a single-page worker scraper with the same settings (headless in browser mode)"""
+        return SimpleWuzzufScraper(
+            headless=True if self.fetch_mode == "browser" else self.headless,
+            extraction_mode=self.extraction_mode,
+            fetch_mode=self.fetch_mode,
+            base_url=self.base_url,
+            browser_fallback=self.browser_fallback,
+            ready_timeout=self.ready_timeout,
+            network_idle_timeout=self.network_idle_timeout,
+            pagination=self.pagination,
+            delay_range=self.delay_range,
+            pool=self.pool,
+            browser_profile=self.browser_profile,
+            only_new=self.only_new,
+            seen_index=self.seen_index or False,
+            page_retries=self.page_retries,
+            retry_backoff=self.retry_backoff,
+            enricher=False,  # Pages are enriched once they reach iter_pages
+            page_cache=self.page_cache or False
+        )
+    
+    def fetch_page_jobs(self, keyword, location, page):
+        """Fetch one results page with the configured fetch mode and return its jobs"""
+        page_url = self.build_search_url(keyword, location, page)
+        self.last_page_cached = False
+        if self.page_cache is not None:
+            html = self.page_cache.get(page_url, self.fetch_mode)
+            if html is None and self.page_cache.replay:
+                # Offline, a page cached by the other fetch mode is better than none
+                other_modes = [mode for mode in FETCH_MODES if mode != self.fetch_mode]
+                html = next(filter(None, (self.page_cache.get(page_url, mode) for mode in other_modes)), None)
+            if html is not None:
+                print(f"🗃️ Page {page} loaded from the page cache")
+                self.last_page_cached = True
+                return parse_jobs_html(html, base_url=self.base_url, card_filter=self.drop_known_cards)
+            if self.page_cache.replay:
+                print(f"📼 Page {page} is not in the page cache (replay only)")
+                return []
+        
+        if self.fetch_mode == "browser":
+            self.ensure_driver()
+            jobs = self.scrape_page(keyword, location, page)
+            if jobs:
+                self.cache_page(page_url, self.driver.page_source)
+            return jobs
+        
+        html = self.http.fetch(page_url)
+        skipped_before = self.skipped_known
+        jobs = parse_jobs_html(html, base_url=self.base_url, card_filter=self.drop_known_cards)
+        all_known = not jobs and self.skipped_known > skipped_before
+        if not jobs and not all_known and self.browser_fallback and needs_browser(html):
+            print("🌐 Page needs client-side rendering, falling back to Chrome...")
+            jobs = self.fetch_page_with_browser(page_url)
+            if jobs:
+                html = self.driver.page_source  # Cache the rendered page instead of the empty shell
+        if jobs or all_known:
+            self.cache_page(page_url, html)
+        return jobs
+    
+    def cache_page(self, page_url, html):
+        """Store a fetched results page in the page cache, if there is one"""
+        if self.page_cache is not None:
+            self.page_cache.put(page_url, self.fetch_mode, html)
+    
+    def fetch_page_with_browser(self, page_url):
+        """Render a single page in Chrome and extract its jobs, starting Chrome on first use"""
+        try:
+            self.ensure_driver()
+            self.readiness.navigate(page_url)
+            self.readiness.wait_for_page()  # Wait for dynamic content to load
+            job_cards, card_selector = self.find_job_cards()
+            if not job_cards:
+                return []
+            return self.extract_page_jobs(job_cards, card_selector)
+        except Exception as e:
+            print(f"❌ Error rendering page in Chrome: {e}")
+            return []
+    
+    def record_page_wait(self, page):
+        """Record the time spent waiting for a page to become ready"""
+        if self.readiness is None:
+            return
+        waited = self.readiness.take_waited()
+        self.page_wait_times[page] = self.page_wait_times.get(page, 0.0) + waited
+        print(f"⏱️ Page {page} ready after {waited:.1f}s of waiting")
+        self.record_page_network(page)
+    
+    def record_page_network(self, page):
+        """Record requests and bytes loaded and blocked while loading a page"""
+        monitor = self.readiness.network
+        stats = monitor.take_stats()
+        if not monitor.available:
+            return
+        self.page_network_stats[page] = stats
+        message = f"📶 Page {page}: {stats['requests_loaded']} requests, {stats['bytes_loaded'] / 1024:.1f} KB loaded"
+        if stats['requests_blocked']:
+            blocked = ", ".join(f"{count} {kind}" for kind, count in sorted(stats['blocked_by_type'].items()))
+            message += f", {stats['requests_blocked']} requests saved ({blocked}), ~{stats['bytes_blocked'] / 1024:.1f} KB saved"
+            if stats['blocked_unsized']:
+                # Sizes are learned from resources loaded unblocked, e.g. by a default-profile run
+                message += f" ({stats['blocked_unsized']} of unknown size)"
+        print(message)
+    
+    def finish_search(self):
+        """Release resources at the end of a search unless the scraper is being reused"""
+        if self.close_after_search:
+            self.close()
+    
+    def reset(self):
+        """Clear collected data so the scraper can run another search"""
+        self.jobs_data = []
+        self.page_wait_times = {}
+        self.page_network_stats = {}
+        self.skipped_known = 0
+        self.seen_keys = set()
+        self.page_dedup_stats = {}
+    
+    def close(self, discard=False):
+        """Quit (or return to the pool) the browser and close HTTP connections
+        
+        discard: quit a pooled driver instead of returning it, used when a
+        scrape is aborted while the driver may still be busy
+        """
+        if self.driver is not None:
+            driver, self.driver = self.driver, None
+            pages = self.readiness.page_loads if self.readiness else 0
+            self.readiness = None
+            try:
+                if self.pool is None:
+                    driver.quit()
+                elif discard:
+                    self.pool.discard(driver)
+                else:
+                    self.pool.release(driver, pages=pages)
+            except Exception:
+                pass
+        if self.http is not None:
+            self.http.close()
+        if self.enricher is not None:
+            self.enricher.close()
     
     def extract_jobs_from_page(self):
         """Extract jobs from current page"""
         try:
-            # Wait for job cards to load with correct Wuzzuf selectors
-            try:
-                # Try the main job card selector
-                job_cards = self.wait.until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div[class*='css-pkv5jc']"))
-                )
-            except:
-                # Fallback to alternative selectors if the main one doesn't work
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='css-'], article, .job-card")
+            job_cards, card_selector = self.find_job_cards()
             
             if not job_cards:
-                return 0
+                return []
             
             print(f"Found {len(job_cards)} job cards")
-            jobs_extracted = 0
-            
-            for job_card in job_cards:
-                try:
-                    job_info = self.extract_single_job(job_card)
-                    if job_info:
-                        self.jobs_data.append(job_info)
-                        jobs_extracted += 1
-                        print(f"📋 {job_info['title'][:50]}...")
-                except Exception as e:
-                    print(f"⚠️ Error extracting job: {e}")
-                    continue
             
-            return jobs_extracted
+            return self.extract_page_jobs(job_cards, card_selector)
             
         except Exception as e:
             print(f"❌ Error extracting jobs: {e}")
-            return 0
+            return []
+    
+    def find_job_cards(self):
+        """Wait for job cards and return them with the selector that matched"""
+        try:
+            # Try the main job card selector
+            job_cards = self.wait.until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+            )
+            return job_cards, JOB_CARD_SELECTOR
+        except:
+            # Fallback to alternative selectors if the main one doesn't work
+            job_cards = self.driver.find_elements(By.CSS_SELECTOR, JOB_CARD_FALLBACK_SELECTOR)
+            return job_cards, JOB_CARD_FALLBACK_SELECTOR
+    
+    def extract_page_jobs(self, job_cards, card_selector):
+        """Extract all job cards on the current page using the configured extraction mode"""
+        if self.extraction_mode == "javascript":
+            return self.extract_jobs_with_javascript(card_selector)
+        if self.extraction_mode == "html":
+            return self.extract_jobs_from_html()
+        
+        # Read just the job URL of each card and only extract the new ones
+        job_cards = self.drop_known(
+            job_cards, lambda card: self.safe_extract(card, JOB_URL_SELECTORS, extract_href=True)
+        )
+        jobs = []
+        for job_card in job_cards:
+            try:
+                job_info = self.extract_single_job(job_card)
+                if job_info:
+                    jobs.append(job_info)
+            except Exception as e:
+                print(f"⚠️ Error extracting job: {e}")
+                continue
+        return jobs
+    
+    def drop_known(self, items, link_of):
+        """Drop cards (or raw jobs) whose job URL is already in the seen-job index, in only_new mode"""
+        if not self.only_new or self.seen_index is None or not items:
+            return items
+        links = [link_of(item) for item in items]
+        known = self.seen_index.known(links)
+        kept = [item for item, link in zip(items, links) if job_url_key(link) not in known]
+        skipped = len(items) - len(kept)
+        if skipped:
+            self.skipped_known += skipped
+            if kept:
+                print(f"⏭️ Skipped {skipped} already seen jobs")
+            else:
+                print(f"⏭️ All {skipped} jobs on this page were already seen")
+        return kept
+    
+    def drop_known_cards(self, cards):
+        """card_filter for parse_jobs_html that skips already seen parsed cards"""
+        return self.drop_known(cards, lambda card: card_job_url(card, self.base_url))
+    
+    def extract_jobs_with_javascript(self, card_selector):
+        """Extract all job cards with a single execute_script round trip"""
+        try:
+            wanted = None
+            if self.only_new and self.seen_index is not None:
+                # Read just the job URLs first and only extract the cards not seen before
+                links = self.driver.execute_script(EXTRACT_JOBS_SCRIPT, card_selector, EXTRACT_JOBS_CONFIG, True) or []
+                kept = self.drop_known(list(enumerate(links)), lambda item: item[1])
+                if not kept:
+                    return []
+                if len(kept) < len(links):
+                    wanted = [position for position, _ in kept]
+            raw_jobs = self.driver.execute_script(
+                EXTRACT_JOBS_SCRIPT, card_selector, EXTRACT_JOBS_CONFIG, False, wanted
+            ) or []
+        except Exception as e:
+            print(f"❌ Error running extraction script: {e}")
+            return []
+        
+        scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return [
+            {
+                'title': raw['title'],
+                'company': raw['company'],
+                'location': raw['location'],
+                'job_type': raw['job_type'],
+                'experience_level': raw['experience_level'],
+                'skills': list(raw['skills']),
+                'posting_date': raw['posting_date'],
+                'application_link': raw['application_link'],
+                'job_url': raw['job_url'],
+                'scraped_at': scraped_at
+            }
+            for raw in raw_jobs
+        ]
+    
+    def extract_jobs_from_html(self):
+        """Extract all job cards by parsing the page source once"""
+        try:
+            return parse_jobs_html(self.driver.page_source, base_url=self.base_url, card_filter=self.drop_known_cards)
+        except Exception as e:
+            print(f"❌ Error parsing page source: {e}")
+            return []
     
     def extract_single_job(self, job_card):
         """Extract information from a single job card"""
         try:
             # Extract basic info with correct Wuzzuf selectors
-            title = self.safe_extract(job_card, [
-                "h2 a[class*='css-193uk2c']",  # Primary title selector
-                "h2 a",                        # Fallback title selector
-                "h2", "h3", ".job-title", ".title"  # Additional fallbacks
-            ])
-            
-            company = self.safe_extract(job_card, [
-                "a[class*='css-ipsyv7']",    # Primary company selector
-                ".company-name", ".company", ".employer"  # Fallbacks
-            ])
-            
-            location = self.safe_extract(job_card, [
-                "span[class*='css-16x61xq']",  # Primary location selector
-                ".location", ".job-location", ".place"  # Fallbacks
-            ])
+            title = self.safe_extract(job_card, TITLE_SELECTORS)
+            
+            company = self.safe_extract(job_card, COMPANY_SELECTORS)
+            
+            location = self.safe_extract(job_card, LOCATION_SELECTORS)
             
             # Extract additional details using safe_extract
-            job_type = self.safe_extract(job_card, [
-                "span[class*='css-uc9rga eoyjyou0']",# Primary selector
-                "div[class*='css-5jhz9n']",     
-            ])
+            job_type = self.safe_extract(job_card, JOB_TYPE_SELECTORS)
             
             experience = self.extract_experience_smart(job_card)
                    
             skills = self.extract_skills_comprehensive(job_card)
             
-            posting_date = self.safe_extract(job_card, [    
-                "div[class*='css-eg55jf']",   # Primary date selector
-                ".date", ".posted-date", ".time-ago"  # Fallbacks
-            ])
+            posting_date = self.safe_extract(job_card, POSTING_DATE_SELECTORS)
             
-            application_link = self.safe_extract(job_card, [
-                "a[class*='css-o171kl']",
-                "h2 a[class*='css-193uk2c']",          # Job title link (most reliable)
-                "a[href*='/jobs/']",                    # Job-specific links
-                "a[href*='wuzzuf.net']",                # Wuzzuf domain links
-                "a[href^='http']"                       # Any HTTP link as fallback
-            ], extract_href=True)  # Extract href attribute instead of text
+            application_link = self.safe_extract(
+                job_card, APPLICATION_LINK_SELECTORS, extract_href=True
+            )  # Extract href attribute instead of text
+            
+            job_url = self.safe_extract(job_card, JOB_URL_SELECTORS, extract_href=True)  # Identifies the posting
             
             return {
                 'title': title,
@@ -200,6 +867,7 @@ class SimpleWuzzufScraper:
                 'skills': skills,
                 'posting_date': posting_date,
                 'application_link': application_link,
+                'job_url': job_url,
                 'scraped_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
@@ -226,35 +894,35 @@ class SimpleWuzzufScraper:
             except:
                 continue
         if extract_href:
-            return "Not available"
+            return DEFAULT_LINK
         else:
-            return "Not specified"
+            return DEFAULT_TEXT
     
     def extract_experience_smart(self, job_card):
         """Smart extraction of experience level using proven strategies"""
         try:
 
-            span_elements = job_card.find_elements(By.CSS_SELECTOR, "span:not([class])")
+            span_elements = job_card.find_elements(By.CSS_SELECTOR, EXPERIENCE_SPAN_SELECTOR)
             
             for span in span_elements:
                 text = span.text.strip()
                 if text and len(text) > 0:
                     # Check if this looks like experience information
-                    if any(keyword in text.lower() for keyword in ['yrs', 'years', 'exp', 'experience', 'level', '-']):
+                    if any(keyword in text.lower() for keyword in EXPERIENCE_KEYWORDS):
                         return text
             
             # Strategy 2: Look for anchor elements with css-o171kl class 
-            css_o171kl_anchors = job_card.find_elements(By.CSS_SELECTOR, "a.css-o171kl")
+            css_o171kl_anchors = job_card.find_elements(By.CSS_SELECTOR, EXPERIENCE_ANCHOR_SELECTOR)
             
             if len(css_o171kl_anchors) >= 2:
                 second_anchor = css_o171kl_anchors[1]  # Second occurrence
                 text = second_anchor.text.strip()
                 if text:
                     return text
-            return "Not specified"
+            return DEFAULT_TEXT
             
         except Exception as e:
-            return "Not specified"
+            return DEFAULT_TEXT
     
     def extract_skills_comprehensive(self, job_card):
         """Comprehensive extraction of all skills using proven strategies"""
@@ -262,25 +930,25 @@ class SimpleWuzzufScraper:
             all_skills = []
             
             # Strategy 1: Collect ALL skills from css-5x9pm1 class (primary skills - 100% success rate)
-            css_5x9pm1_elements = job_card.find_elements(By.CSS_SELECTOR, "a[class*='css-5x9pm1']")
+            css_5x9pm1_elements = job_card.find_elements(By.CSS_SELECTOR, PRIMARY_SKILL_SELECTOR)
             
             for elem in css_5x9pm1_elements:
                 skill_text = elem.text.strip()
                 if skill_text and skill_text not in all_skills:
                     # Filter out non-skill text (like job titles)
-                    if len(skill_text) < 50 and not any(exclude in skill_text.lower() for exclude in ['full time', 'part time', 'contract', 'remote', 'on-site']):
+                    if len(skill_text) < SKILL_MAX_LENGTH and not any(exclude in skill_text.lower() for exclude in SKILL_EXCLUDES):
                         all_skills.append(skill_text)
             
             # Strategy 2: Collect ALL skills from css-o171kl class (secondary skills - 100% success rate)
-            css_o171kl_elements = job_card.find_elements(By.CSS_SELECTOR, "a[class*='css-o171kl']")
+            css_o171kl_elements = job_card.find_elements(By.CSS_SELECTOR, SECONDARY_SKILL_SELECTOR)
             
             for elem in css_o171kl_elements:
                 skill_text = elem.text.strip()
                 if skill_text and skill_text not in all_skills:
                     # Filter out non-skill text and job categories
-                    if (len(skill_text) < 50 and 
-                        not any(exclude in skill_text.lower() for exclude in ['full time', 'part time', 'contract', 'remote', 'on-site']) and
-                        not any(category in skill_text.lower() for category in ['entry level', 'experienced', 'senior', 'junior'])):
+                    if (len(skill_text) < SKILL_MAX_LENGTH and 
+                        not any(exclude in skill_text.lower() for exclude in SKILL_EXCLUDES) and
+                        not any(category in skill_text.lower() for category in SKILL_CATEGORY_EXCLUDES)):
                         all_skills.append(skill_text)
             
             return all_skills
@@ -291,41 +959,64 @@ class SimpleWuzzufScraper:
 
     
     def go_to_next_page(self):
-        """Navigate to next page by finding the button with the right arrow SVG path"""
+        """Navigate to the next results page, by URL first and by the next button as a fallback"""
+        if self.pagination == "url":
+            if self.go_to_page(self.current_page + 1):
+                return True
+            # The browser is now on the failed page, the next button must be clicked on this one
+            print("↪️ Direct page URL returned no jobs, trying the next button...")
+            if not self.go_to_page(self.current_page):
+                print(f"⚠️ Could not return to page {self.current_page}, stopping pagination")
+                return False
+        return self.click_next_page_button()
+    
+    def go_to_page(self, page):
+        """Navigate straight to a results page of the current search by its URL"""
         try:
-            # Find the button containing the specific right arrow SVG path
-            next_button = None
-            
-            # Look for buttons with the exact SVG path for right arrow
-            target_path = "M9.213 5L7.5 6.645 13.063 12 7.5 17.355 9.213 19l7.287-7z"
+            self.ensure_driver()
+            page_url = self.build_search_url(self.current_keyword, self.current_location, page)
+            previous_first_card = self.readiness.first_card()
+            self.readiness.navigate(page_url)
+            self.readiness.wait_for_page(previous_first_card)  # Wait for page load
             
-            # Find all buttons that might contain SVG elements
-            all_buttons = self.driver.find_elements(By.CSS_SELECTOR, "button")
+            if self.readiness.first_card() is None:
+                return False
+            print(f"✅ Loaded page {page} directly: {page_url}")
+            return True
             
-            for button in all_buttons:
-                try:
-                    # Look for SVG elements within the button
-                    svg_elements = button.find_elements(By.CSS_SELECTOR, "svg")
-                    for svg in svg_elements:
-                        # Look for path elements within the SVG
-                        path_elements = svg.find_elements(By.CSS_SELECTOR, "path")
-                        for path in path_elements:
-                            path_d = path.get_attribute('d')
-                            if path_d == target_path:
-                                next_button = button
-                                break
-                        if next_button:
-                            break
-                    if next_button:
-                        break
-                except:
-                    continue
+        except Exception as e:
+            print(f"⚠️ Direct navigation to page {page} failed: {e}")
+            return False
+    
+    def scrape_page(self, keyword, location, page):
+        """Load any results page directly and return its jobs without storing them"""
+        self.current_keyword = keyword
+        self.current_location = location
+        if not self.go_to_page(page):
+            return []
+        job_cards, card_selector = self.find_job_cards()
+        if not job_cards:
+            return []
+        print(f"Found {len(job_cards)} job cards")
+        return self.extract_page_jobs(job_cards, card_selector)
+    
+    def click_next_page_button(self):
+        """Navigate to next page by clicking the button with the right arrow SVG path"""
+        try:
+            # Single lookup for the button containing the specific right arrow SVG path
+            next_buttons = self.driver.find_elements(
+                By.XPATH,
+                f"//button[.//*[local-name()='path' and @d='{NEXT_PAGE_ARROW_PATH}']]"
+            )
+            next_button = next_buttons[0] if next_buttons else None
             
             if next_button and next_button.is_enabled() and next_button.is_displayed():
                 print("✅ Found next page button with right arrow SVG")
                 try:
+                    previous_first_card = self.readiness.first_card()
+                    self.readiness.network.begin_navigation()
                     self.driver.execute_script("arguments[0].click();", next_button)
-                    time.sleep(5)  # Wait for page load
+                    self.readiness.wait_for_page(previous_first_card)  # Wait for page load
                     return True
                 except Exception as e:
                     print(f"⚠️ Button click failed: {e}")
@@ -346,30 +1037,22 @@ class SimpleWuzzufScraper:
             return
         
         try:
-            # Create Data directory if it doesn't exist
-            data_dir = Path("Data")
-            data_dir.mkdir(exist_ok=True)
-            
-            # Create session folder with timestamp and keyword
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_keyword = filename_prefix.replace(' ', '_').replace('/', '_').replace('\\', '_')
-            session_folder = data_dir / f"scraping_session_{timestamp}_{safe_keyword}"
-            session_folder.mkdir(exist_ok=True)
-            
-            # Save to CSV in session folder
-            csv_filename = f"wuzzuf_jobs_{safe_keyword}_{timestamp}.csv"
-            csv_path = session_folder / csv_filename
-            self.save_to_csv(str(csv_path))
-            
-            # Save to JSON in session folder
-            json_filename = f"wuzzuf_jobs_{safe_keyword}_{timestamp}.json"
-            json_path = session_folder / json_filename
-            self.save_to_json(str(json_path))
+            session_folder, safe_keyword, timestamp = create_session_folder(filename_prefix)
+            
+            # Save each enabled format in session folder
+            files = []
+            for output_format in self.output_formats:
+                if output_format == "sqlite":
+                    self.save_to_store()
+                    continue
+                filename = f"wuzzuf_jobs_{safe_keyword}_{timestamp}.{output_format}"
+                self.save_as(output_format, str(session_folder / filename))
+                files.append(filename)
             
             # Create summary file in session folder
             summary_filename = f"scraping_summary_{safe_keyword}_{timestamp}.txt"
             summary_path = session_folder / summary_filename
-            self.create_summary_file(str(summary_path), safe_keyword, timestamp)
+            self.create_summary_file(str(summary_path), safe_keyword, timestamp, files)
             
             print(f"💾 Data saved to session folder: {session_folder}")
             
@@ -382,117 +1065,245 @@ class SimpleWuzzufScraper:
             self.save_data_fallback(filename_prefix)
             return "."
     
+    def open_stream(self, filename_prefix="wuzzuf_jobs", batch_size=25):
+        """Create a session folder and sinks (CSV, JSON Lines, Parquet) that write jobs as they are scraped
+        
+        Pass the returned sinks to search_jobs(sinks=...) and call close_stream()
+        when done, even after an error or interruption, to keep everything so far.
+        """
+        session_folder, safe_keyword, timestamp = create_session_folder(filename_prefix)
+        sink_types = {"csv": (CsvSink, "csv"), "json": (JsonLinesSink, "jsonl"), "parquet": (ParquetSink, "parquet")}
+        sinks = []
+        for output_format in self.output_formats:
+            if output_format == "sqlite":
+                try:
+                    sinks.append(SqliteSink(path=self.store_path))
+                except Exception as e:
+                    print(f"⚠️ Not writing to the job store: {e}")
+                continue
+            sink_type, extension = sink_types[output_format]
+            try:
+                sinks.append(sink_type(session_folder / f"wuzzuf_jobs_{safe_keyword}_{timestamp}.{extension}", batch_size))
+            except ImportError as e:
+                print(f"⚠️ Not writing {output_format}: {e}")
+        self.stream = {
+            'folder': session_folder, 'keyword': safe_keyword, 'timestamp': timestamp, 'sinks': sinks
+        }
+        print(f"📝 Streaming jobs to: {session_folder}")
+        return sinks
+    
+    def close_stream(self, update_index=True):
+        """Finish the streamed files, write the session summary and return the session folder
+
+        update_index=False leaves the search index refresh to the caller, e.g.
+        the GUI runs it off the Tk thread.
+        """
+        with self.stream_lock:
+            stream, self.stream = self.stream, None
+        if stream is None:
+            return None
+        
+        for sink in stream['sinks']:
+            try:
+                sink.close()
+            except Exception as e:
+                print(f"❌ Error finishing {sink.path.name}: {e}")
+        
+        if update_index and configured_search_index() and any(isinstance(sink, SqliteSink) for sink in stream['sinks']):
+            update_search_index(self.store_path)
+        
+        saved = max((sink.count for sink in stream['sinks']), default=len(self.jobs_data))
+        summary_path = stream['folder'] / f"scraping_summary_{stream['keyword']}_{stream['timestamp']}.txt"
+        files = [sink.path.name for sink in stream['sinks'] if not isinstance(sink, SqliteSink)]
+        write_summary_file(self.jobs_data, str(summary_path), stream['keyword'], stream['timestamp'], files)
+        print(f"💾 {saved} jobs saved to session folder: {stream['folder']}")
+        return str(stream['folder'])
+    
     def save_to_csv(self, filename):
         """Save to CSV file"""
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                if self.jobs_data:
-                    writer = csv.DictWriter(f, fieldnames=self.jobs_data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(self.jobs_data)
-            print(f"✅ CSV saved: {filename}")
-        except Exception as e:
-            print(f"❌ Error saving CSV: {e}")
+        write_jobs_csv(self.jobs_data, filename)
     
     def save_to_json(self, filename):
         """Save to JSON file"""
+        write_jobs_json(self.jobs_data, filename)
+    
+    def save_to_parquet(self, filename):
+        """Save to Parquet file"""
+        write_jobs_parquet(self.jobs_data, filename)
+    
+    def save_to_store(self):
+        """Upsert every job into the SQLite job store in one transaction"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.jobs_data, f, indent=2, ensure_ascii=False)
-            print(f"✅ JSON saved: {filename}")
+            with JobStore(self.store_path) as store:
+                inserted, updated = store.upsert_jobs(self.jobs_data)
+            print(f"✅ Job store updated: {inserted} new, {updated} updated ({self.store_path})")
         except Exception as e:
-            print(f"❌ Error saving JSON: {e}")
+            print(f"❌ Error saving to job store: {e}")
+            return
+        if configured_search_index():
+            update_search_index(self.store_path)
+    
+    def save_as(self, output_format, filename):
+        """Save to a file in one of OUTPUT_FORMATS"""
+        writers = {"csv": self.save_to_csv, "json": self.save_to_json, "parquet": self.save_to_parquet}
+        writers[output_format](filename)
     
     def save_data_fallback(self, filename_prefix="wuzzuf_jobs"):
         """Fallback method to save data in current directory"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Save to CSV
-        csv_filename = f"{filename_prefix}_{timestamp}.csv"
-        self.save_to_csv(csv_filename)
-        
-        # Save to JSON
-        json_filename = f"{filename_prefix}_{timestamp}.json"
-        self.save_to_json(json_filename)
+        for output_format in self.output_formats:
+            if output_format == "sqlite":
+                self.save_to_store()
+            else:
+                self.save_as(output_format, f"{filename_prefix}_{timestamp}.{output_format}")
         
         print(f"💾 Data saved to current directory: {len(self.jobs_data)} jobs")
     
-    def create_summary_file(self, summary_path, keyword, timestamp):
+    def create_summary_file(self, summary_path, keyword, timestamp, files=None):
         """Create a comprehensive summary file for the scraping session"""
-        try:
-            # Create summary content
-            summary_content = f"""Wuzzuf Job Scraping Summary
+        write_summary_file(self.jobs_data, summary_path, keyword, timestamp, files)
+
+
+def build_search_url(base_url, keyword, location="", page=1):
+    """Build the search results URL for a given page (1-based)"""
+    search_url = f"{base_url}/search/jobs?q={keyword.replace(' ', '+')}"
+    if location:
+        search_url += f"&l={location.replace(' ', '+')}"
+    if page > 1:
+        search_url += f"&start={page - 1}"
+    return search_url
+
+
+def create_session_folder(filename_prefix, data_dir="Data"):
+    """Create Data/scraping_session_<timestamp>_<keyword> and return it with the keyword and timestamp"""
+    # Create Data directory if it doesn't exist
+    data_dir = Path(data_dir)
+    data_dir.mkdir(exist_ok=True)
+    
+    # Create session folder with timestamp and keyword
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_keyword = filename_prefix.replace(' ', '_').replace('/', '_').replace('\\', '_')
+    session_folder = data_dir / f"scraping_session_{timestamp}_{safe_keyword}"
+    session_folder.mkdir(exist_ok=True)
+    return session_folder, safe_keyword, timestamp
+
+
+def write_summary_file(jobs, summary_path, keyword, timestamp, files=None):
+    """Write the summary file for a scraping session
+    
+    files: data file names listed in the summary, defaults to the CSV and JSON files
+    """
+    if files is None:
+        files = [f"wuzzuf_jobs_{keyword}_{timestamp}.csv", f"wuzzuf_jobs_{keyword}_{timestamp}.json"]
+    file_labels = {".csv": "CSV Data", ".json": "JSON Data", ".jsonl": "JSON Lines Data", ".parquet": "Parquet Data"}
+    files_created = "\n".join(f"- {file_labels.get(Path(name).suffix, 'Data')}: {name}" for name in files)
+    try:
+        # Create summary content
+        summary_content = f"""Wuzzuf Job Scraping Summary
 ========================================
 
 Session Information:
 - Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - Keyword: {keyword}
-- Total Jobs Found: {len(self.jobs_data)}
+- Total Jobs Found: {len(jobs)}
 - Session Folder: {Path(summary_path).parent}
 
 Files Created:
-- CSV Data: wuzzuf_jobs_{keyword}_{timestamp}.csv
-- JSON Data: wuzzuf_jobs_{keyword}_{timestamp}.json
+{files_created}
 - Summary: scraping_summary_{keyword}_{timestamp}.txt
 
 Data Overview:
-- Companies: {len(set(job.get('company', '') for job in self.jobs_data if job.get('company') and job.get('company') != 'Not specified'))}
-- Locations: {len(set(job.get('location', '') for job in self.jobs_data if job.get('location') and job.get('location') != 'Not specified'))}
-- Experience Levels: {len(set(job.get('experience_level', '') for job in self.jobs_data if job.get('experience_level') and job.get('experience_level') != 'Not specified'))}
+- Companies: {len(set(job.get('company', '') for job in jobs if job.get('company') and job.get('company') != 'Not specified'))}
+- Locations: {len(set(job.get('location', '') for job in jobs if job.get('location') and job.get('location') != 'Not specified'))}
+- Experience Levels: {len(set(job.get('experience_level', '') for job in jobs if job.get('experience_level') and job.get('experience_level') != 'Not specified'))}
 
 Top Companies (by job count):
 """
-            
-            # Count company occurrences
-            company_counts = {}
-            for job in self.jobs_data:
-                company = job.get('company', 'Unknown')
-                if company and company != 'Not specified':
-                    company_counts[company] = company_counts.get(company, 0) + 1
-            
-            # Add top companies to summary
-            if company_counts:
-                sorted_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)
-                for i, (company, count) in enumerate(sorted_companies[:10], 1):
-                    summary_content += f"{i:2d}. {company}: {count} jobs\n"
-            else:
-                summary_content += "No company data available\n"
-            
-            summary_content += f"""
+        
+        # Count company occurrences
+        company_counts = {}
+        for job in jobs:
+            company = job.get('company', 'Unknown')
+            if company and company != 'Not specified':
+                company_counts[company] = company_counts.get(company, 0) + 1
+        
+        # Add top companies to summary
+        if company_counts:
+            sorted_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)
+            for i, (company, count) in enumerate(sorted_companies[:10], 1):
+                summary_content += f"{i:2d}. {company}: {count} jobs\n"
+        else:
+            summary_content += "No company data available\n"
+        
+        summary_content += f"""
 
 Top Locations (by job count):
 """
-            
-            # Count location occurrences
-            location_counts = {}
-            for job in self.jobs_data:
-                location = job.get('location', 'Unknown')
-                if location and location != 'Not specified':
-                    location_counts[location] = location_counts.get(location, 0) + 1
-            
-            # Add top locations to summary
-            if location_counts:
-                sorted_locations = sorted(location_counts.items(), key=lambda x: x[1], reverse=True)
-                for i, (location, count) in enumerate(sorted_locations[:10], 1):
-                    summary_content += f"{i:2d}. {location}: {count} jobs\n"
-            else:
-                summary_content += "No location data available\n"
-            
-            summary_content += f"""
+        
+        # Count location occurrences
+        location_counts = {}
+        for job in jobs:
+            location = job.get('location', 'Unknown')
+            if location and location != 'Not specified':
+                location_counts[location] = location_counts.get(location, 0) + 1
+        
+        # Add top locations to summary
+        if location_counts:
+            sorted_locations = sorted(location_counts.items(), key=lambda x: x[1], reverse=True)
+            for i, (location, count) in enumerate(sorted_locations[:10], 1):
+                summary_content += f"{i:2d}. {location}: {count} jobs\n"
+        else:
+            summary_content += "No location data available\n"
+        
+        summary_content += f"""
 
 Generated by Wuzzuf Job Scraper Pro
 Session completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-            
-            # Write summary file
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write(summary_content)
-            
-            print(f"📄 Created summary: {Path(summary_path).name}")
-            
-        except Exception as e:
-            print(f"❌ Error creating summary file: {e}")
-    
+        
+        # Write summary file
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(summary_content)
+        
+        print(f"📄 Created summary: {Path(summary_path).name}")
+        
+    except Exception as e:
+        print(f"❌ Error creating summary file: {e}")
+
+
+def write_jobs_csv(jobs, filename):
+    """Write a list of job dicts to a CSV file"""
+    try:
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            if jobs:
+                writer = csv.DictWriter(f, fieldnames=jobs[0].keys())
+                writer.writeheader()
+                writer.writerows(jobs)
+        print(f"✅ CSV saved: {filename}")
+    except Exception as e:
+        print(f"❌ Error saving CSV: {e}")
+
+
+def write_jobs_json(jobs, filename):
+    """Write a list of job dicts to a JSON file"""
+    try:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(jobs, f, indent=2, ensure_ascii=False)
+        print(f"✅ JSON saved: {filename}")
+    except Exception as e:
+        print(f"❌ Error saving JSON: {e}")
+
+
+def write_jobs_parquet(jobs, filename):
+    """Write a list of job dicts to a typed Parquet file (needs pyarrow)"""
+    try:
+        with ParquetSink(filename) as sink:
+            for job in jobs:
+                sink.write(job)
+        print(f"✅ Parquet saved: {filename}")
+    except Exception as e:
+        print(f"❌ Error saving Parquet: {e}")
 
 
 def main():
@@ -502,20 +1313,40 @@ def main():
     
     try:
         # Import configuration
-        from simple_config import SEARCH_KEYWORD, LOCATION, MAX_PAGES, HEADLESS_MODE, OUTPUT_PREFIX
+        from simple_config import (
+            SEARCH_KEYWORD, LOCATION, MAX_PAGES, HEADLESS_MODE, OUTPUT_PREFIX,
+            EXTRACTION_MODE, FETCH_MODE, READY_TIMEOUT, NETWORK_IDLE_TIMEOUT, PAGINATION,
+            DELAY_BETWEEN_PAGES, PARALLEL_WORKERS, MAX_CONCURRENT_PER_HOST, BROWSER_PROFILE,
+            STREAM_BATCH_SIZE, PAGE_RETRIES, RETRY_BACKOFF
+        )
         
         # Initialize scraper
-        scraper = SimpleWuzzufScraper(headless=HEADLESS_MODE)
-        
-        # Search for engineering jobs
-        scraper.search_jobs(
-            keyword=SEARCH_KEYWORD,
-            location=LOCATION,
-            max_pages=MAX_PAGES
+        scraper = SimpleWuzzufScraper(
+            headless=HEADLESS_MODE,
+            extraction_mode=EXTRACTION_MODE,
+            fetch_mode=FETCH_MODE,
+            ready_timeout=READY_TIMEOUT,
+            network_idle_timeout=NETWORK_IDLE_TIMEOUT,
+            pagination=PAGINATION,
+            delay_range=DELAY_BETWEEN_PAGES,
+            workers=PARALLEL_WORKERS,
+            max_per_host=MAX_CONCURRENT_PER_HOST,
+            browser_profile=BROWSER_PROFILE,
+            page_retries=PAGE_RETRIES,
+            retry_backoff=RETRY_BACKOFF
         )
         
-        # Save the data to organized folders
-        session_folder = scraper.save_data(OUTPUT_PREFIX)
+        # Search for engineering jobs, writing each page to disk as it is scraped
+        sinks = scraper.open_stream(OUTPUT_PREFIX, batch_size=STREAM_BATCH_SIZE)
+        try:
+            scraper.search_jobs(
+                keyword=SEARCH_KEYWORD,
+                location=LOCATION,
+                max_pages=MAX_PAGES,
+                sinks=sinks
+            )
+        finally:
+            session_folder = scraper.close_stream()
         
         print("✅ Scraping completed successfully!")
         print(f"📁 Data saved to: {session_folder}")
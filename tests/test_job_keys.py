@@ -0,0 +1,155 @@
+"""
+Job identity checks on the recorded search pages in benchmark_pages/
+Most cards share a category link like /a/Entry-Level-Jobs-in-Egypt as their
+application link, so every dedup layer has to key on the job URL instead
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from simple_wuzzuf_scraper import SimpleWuzzufScraper
+from wuzzuf_campaign import CampaignRunner
+from wuzzuf_enrichment import JobEnricher, detail_url
+from wuzzuf_http import RecordedPageServer
+from wuzzuf_parser import job_key
+from wuzzuf_sessions import SessionCatalog
+from wuzzuf_store import JobStore, SeenJobIndex
+
+CORPUS_DIR = Path(__file__).parent.parent / "benchmark_pages"
+CATEGORY_LINK = "https://wuzzuf.net/a/Entry-Level-Jobs-in-Egypt"
+
+
+def golden_jobs():
+    jobs = []
+    for path in sorted(CORPUS_DIR.glob("search_page_*.golden.json")):
+        jobs += json.loads(path.read_text(encoding='utf-8'))
+    return jobs
+
+
+def category_link_jobs():
+    """Two different postings whose application link is the same category page"""
+    return [
+        {'title': "Data Engineer", 'company': "Valeo", 'location': "Cairo, Egypt", 'posting_date': "1 day ago",
+         'application_link': CATEGORY_LINK, 'job_url': "https://wuzzuf.net/jobs/p/901x101-Data-Engineer-Cairo-Egypt?o=1",
+         'skills': ["Python"]},
+        {'title': "DevOps Engineer", 'company': "Elsewedy", 'location': "Giza, Egypt", 'posting_date': "2 days ago",
+         'application_link': CATEGORY_LINK, 'job_url': "https://wuzzuf.net/jobs/p/902x102-DevOps-Engineer-Giza-Egypt?o=2",
+         'skills': ["Docker"]},
+    ]
+
+
+def test_recorded_jobs_have_distinct_keys():
+    jobs = golden_jobs()
+    assert len(jobs) == 37
+    assert len({job_key(job) for job in jobs}) == len(jobs)
+
+
+def test_job_key_ignores_category_links():
+    first, second = category_link_jobs()
+    assert job_key(first) == "id:901x101"
+    assert job_key(first) != job_key(second)
+    # Jobs saved before job_url was extracted fall back to their fields, not the category link
+    del first['job_url'], second['job_url']
+    assert job_key(first) != job_key(second)
+
+
+def test_http_run_keeps_every_recorded_job():
+    with RecordedPageServer(CORPUS_DIR) as server:
+        scraper = SimpleWuzzufScraper(
+            fetch_mode="http",
+            base_url=server.url,
+            browser_fallback=False,
+            delay_range=(0, 0),
+            output_formats=(),
+            seen_index=False,
+            enricher=False,
+            page_cache=False
+        )
+        try:
+            jobs = list(scraper.iter_jobs("engineer", max_pages=3))
+        finally:
+            scraper.close()
+    assert len(jobs) == 37
+    assert all(stats['duplicates'] == 0 for stats in scraper.page_dedup_stats.values())
+
+
+def test_store_keeps_every_recorded_job(tmp_path):
+    with JobStore(tmp_path / "jobs.db") as store:
+        assert store.upsert_jobs(golden_jobs()) == (37, 0)
+        assert store.upsert_jobs(category_link_jobs()) == (2, 0)
+        assert store.count() == 39
+        assert all(job['job_url'].startswith("https://wuzzuf.net/jobs/p/") for job in store.query())
+
+
+def test_seen_index_only_skips_seen_job_urls(tmp_path):
+    index = SeenJobIndex(tmp_path / "jobs.db")
+    first, second = category_link_jobs()
+    assert index.add([first]) == 1
+    assert index.known([first['job_url'], second['job_url'], CATEGORY_LINK]) == {"id:901x101"}
+
+    # One recorded job seen before: only its card is skipped
+    index.add(golden_jobs()[:1])
+    with RecordedPageServer(CORPUS_DIR) as server:
+        scraper = SimpleWuzzufScraper(
+            fetch_mode="http",
+            base_url=server.url,
+            browser_fallback=False,
+            delay_range=(0, 0),
+            output_formats=(),
+            only_new=True,
+            seen_index=index,
+            enricher=False,
+            page_cache=False
+        )
+        try:
+            jobs = list(scraper.iter_jobs("engineer", max_pages=3))
+        finally:
+            scraper.close()
+    assert len(jobs) == 36
+    assert scraper.skipped_known == 1
+
+
+def test_enricher_reads_the_job_page_and_closes_without_waiting():
+    first, _ = category_link_jobs()
+    assert detail_url(first) == first['job_url']
+    del first['job_url']
+    assert detail_url(first) is None  # A category page has no details to read
+
+    fetched = []
+
+    def slow_fetch(url):
+        fetched.append(url)
+        time.sleep(1)
+        return "<html></html>"
+
+    enricher = JobEnricher(workers=2, cache=False, delay_range=(0, 0))
+    enricher.fetch = slow_fetch
+    worker = threading.Thread(target=enricher.enrich, args=(golden_jobs(),))
+    worker.start()
+    time.sleep(0.2)
+    started = time.perf_counter()
+    enricher.close()
+    assert time.perf_counter() - started < 0.5
+    worker.join(5)
+    assert not worker.is_alive()
+    assert len(fetched) == 2  # Queued jobs were cancelled
+    assert all("/jobs/p/" in url for url in fetched)
+
+
+def test_session_union_keeps_every_recorded_job(tmp_path):
+    session = tmp_path / "scraping_session_20260101_090000_engineer"
+    session.mkdir()
+    (session / "wuzzuf_jobs_engineer_20260101_090000.json").write_text(json.dumps(golden_jobs()), encoding='utf-8')
+    catalog = SessionCatalog(tmp_path)
+    assert len(catalog.load_union()) == 37
+
+
+def test_campaign_keeps_distinct_jobs_sharing_a_category_link():
+    first, second = category_link_jobs()
+    runner = CampaignRunner([("python", "", 1), ("devops", "", 1)], fetch_mode="http")
+    runner.results = {"python": [first], "devops": [second, dict(first)]}
+    jobs = runner.consolidated_jobs()
+    assert [job['title'] for job in jobs] == ["Data Engineer", "DevOps Engineer"]
+    assert [job['search_keywords'] for job in jobs] == ["python; devops", "devops"]
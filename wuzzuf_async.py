@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Asyncio Wuzzuf Scraper
+Fetches search pages with an async HTTP client so several searches, and the
+disk writes that save them, overlap in one event loop
+"""
+
+import asyncio
+import functools
+import random
+from urllib.parse import urlparse
+
+import httpx
+
+from simple_wuzzuf_scraper import (
+    SimpleWuzzufScraper, build_search_url, create_session_folder, configured_output_formats,
+    write_jobs_csv, write_jobs_json, write_jobs_parquet, write_summary_file,
+)
+from wuzzuf_campaign import search_label
+from wuzzuf_http import DEFAULT_USER_AGENT, needs_browser
+from wuzzuf_index import configured_search_index, update_search_index
+from wuzzuf_parser import parse_jobs_html
+from wuzzuf_store import JobStore, configured_store_path
+
+# Responses worth retrying, same as WuzzufHttpClient
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call (parsing, disk writes, Selenium) in the default thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+class AsyncWuzzufScraper:
+    """Async counterpart of SimpleWuzzufScraper's HTTP fetch mode
+
+    Pages are fetched over one pooled httpx.AsyncClient, at most max_per_host at
+    a time per host. Parsing and file writes run in worker threads so they never
+    block the loop. Pages that need client-side rendering fall back to a single
+    shared headless Chrome, also run in a worker thread.
+    """
+
+    def __init__(self, base_url="https://wuzzuf.net", browser_fallback=True, delay_range=(2, 4),
+                 max_per_host=2, timeout=15, retries=2, user_agent=DEFAULT_USER_AGENT,
+                 browser_profile="lean", output_formats=None, store_path=None):
+        self.base_url = base_url.rstrip('/')
+        self.browser_fallback = browser_fallback
+        self.delay_range = delay_range
+        self.max_per_host = max(1, max_per_host)
+        self.timeout = timeout
+        self.retries = retries
+        self.user_agent = user_agent
+        self.browser_profile = browser_profile
+        self.output_formats = tuple(configured_output_formats() if output_formats is None else output_formats)
+        self.store_path = configured_store_path() if store_path is None else store_path
+        self.jobs_data = []
+        self.client = None
+        self.host_limits = {}  # host -> asyncio.Semaphore
+        self.browser = None  # SimpleWuzzufScraper used only for the Chrome fallback
+        self.browser_lock = None
+
+    def get_client(self):
+        """Create the shared async client on first use, inside the running loop"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers={
+                    'User-Agent': self.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                },
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_per_host * 4, max_keepalive_connections=self.max_per_host * 4),
+                follow_redirects=True,
+            )
+            self.browser_lock = asyncio.Lock()
+        return self.client
+
+    def host_limit(self, url):
+        """Semaphore limiting concurrent requests to the URL's host"""
+        host = urlparse(url).netloc
+        if host not in self.host_limits:
+            self.host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return self.host_limits[host]
+
+    async def fetch(self, url):
+        """Fetch a page and return its HTML, retrying transient failures with backoff"""
+        client = self.get_client()
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.host_limit(url):
+                    response = await client.get(url)
+                if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                    raise httpx.HTTPStatusError("Retryable status", request=response.request, response=response)
+                response.raise_for_status()
+                return response.text
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retryable = isinstance(e, httpx.TransportError) or e.response.status_code in RETRY_STATUSES
+                if not retryable or attempt >= self.retries:
+                    raise
+                await asyncio.sleep(0.5 * (2 ** attempt))
+
+    async def fetch_page_jobs(self, keyword, location, page):
+        """Fetch and parse one results page"""
+        page_url = build_search_url(self.base_url, keyword, location, page)
+        html = await self.fetch(page_url)
+        jobs = await run_blocking(parse_jobs_html, html, base_url=self.base_url)
+        if not jobs and self.browser_fallback and needs_browser(html):
+            print("🌐 Page needs client-side rendering, falling back to Chrome...")
+            jobs = await self.fetch_page_with_browser(page_url)
+        return jobs
+
+    async def fetch_page_with_browser(self, page_url):
+        """Render a page in the shared Chrome fallback, one page at a time"""
+        async with self.browser_lock:
+            if self.browser is None:
+                self.browser = await run_blocking(
+                    SimpleWuzzufScraper,
+                    fetch_mode="http",
+                    base_url=self.base_url,
+                    close_after_search=False,
+                    browser_profile=self.browser_profile,
+                    seen_index=False
+                )
+            return await run_blocking(self.browser.fetch_page_with_browser, page_url)
+
+    async def iter_jobs(self, keyword="engineering", location="", max_pages=3):
+        """Yield each job as soon as its results page has been parsed"""
+        for page in range(1, max_pages + 1):
+            print(f"📄 Scraping page {page} of '{keyword}'...")
+            try:
+                jobs = await self.fetch_page_jobs(keyword, location, page)
+            except Exception as e:
+                print(f"❌ Error fetching page {page} of '{keyword}': {e}")
+                return
+
+            if not jobs:
+                print(f"⚠️ No more jobs found for '{keyword}', stopping")
+                return
+            print(f"Found {len(jobs)} job cards")
+            for job in jobs:
+                yield job
+
+            if page < max_pages:
+                # Respectful delay, only this search waits
+                await asyncio.sleep(random.uniform(*self.delay_range))
+
+    async def search_jobs(self, keyword="engineering", location="", max_pages=3):
+        """Run one search, add its jobs to jobs_data and return them"""
+        print(f"🔍 Searching: {keyword} in {location or 'All locations'}")
+        jobs = []
+        async for job in self.iter_jobs(keyword, location, max_pages):
+            jobs.append(job)
+            self.jobs_data.append(job)
+            print(f"📋 {job['title'][:50]}...")
+        return jobs
+
+    async def search_many(self, searches):
+        """Run (keyword, location, max_pages) searches concurrently, return {search label: jobs}"""
+        results = await asyncio.gather(
+            *(self.search_jobs(keyword, location, max_pages) for keyword, location, max_pages in searches),
+            return_exceptions=True
+        )
+        collected = {}
+        for (keyword, location, _), result in zip(searches, results):
+            label = search_label(keyword, location)
+            if isinstance(result, Exception):
+                print(f"❌ {label} failed: {result}")
+                result = []
+            collected[label] = result
+        return collected
+
+    async def save_data(self, filename_prefix="wuzzuf_jobs"):
+        """Save jobs_data to a session folder, writing every output format and the summary concurrently"""
+        if not self.jobs_data:
+            print("⚠️ No data to save!")
+            return
+
+        jobs = list(self.jobs_data)  # Snapshot, searches may still be adding jobs
+        session_folder, safe_keyword, timestamp = await run_blocking(create_session_folder, filename_prefix)
+        writers = {"csv": write_jobs_csv, "json": write_jobs_json, "parquet": write_jobs_parquet}
+        file_formats = [output_format for output_format in self.output_formats if output_format in writers]
+        files = [f"wuzzuf_jobs_{safe_keyword}_{timestamp}.{output_format}" for output_format in file_formats]
+        store_writes = [run_blocking(self.save_to_store, jobs)] if "sqlite" in self.output_formats else []
+        await asyncio.gather(
+            *(
+                run_blocking(writers[output_format], jobs, str(session_folder / filename))
+                for output_format, filename in zip(file_formats, files)
+            ),
+            *store_writes,
+            run_blocking(
+                write_summary_file, jobs,
+                str(session_folder / f"scraping_summary_{safe_keyword}_{timestamp}.txt"), safe_keyword, timestamp, files
+            ),
+        )
+        print(f"💾 Data saved to session folder: {session_folder}")
+        return str(session_folder)
+
+    def save_to_store(self, jobs):
+        """Upsert jobs into the SQLite job store (blocking, run in a worker thread)"""
+        try:
+            with JobStore(self.store_path) as store:
+                inserted, updated = store.upsert_jobs(jobs)
+            print(f"✅ Job store updated: {inserted} new, {updated} updated ({self.store_path})")
+        except Exception as e:
+            print(f"❌ Error saving to job store: {e}")
+            return
+        if configured_search_index():
+            update_search_index(self.store_path)
+
+    def reset(self):
+        """Clear collected data so the scraper can run another search"""
+        self.jobs_data = []
+
+    async def close(self):
+        """Close HTTP connections and the Chrome fallback"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+        if self.browser is not None:
+            browser, self.browser = self.browser, None
+            await run_blocking(browser.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class BlockingWuzzufScraper:
+    """Synchronous wrapper with SimpleWuzzufScraper's search_jobs/save_data/close interface
+
+    Owns a private event loop, so it can be used from a plain thread such as
+    the GUI's scraping worker.
+    """
+
+    def __init__(self, **options):
+        self.loop = asyncio.new_event_loop()
+        self.scraper = AsyncWuzzufScraper(**options)
+
+    @property
+    def jobs_data(self):
+        return self.scraper.jobs_data
+
+    def search_jobs(self, keyword="engineering", location="", max_pages=3):
+        return self.loop.run_until_complete(self.scraper.search_jobs(keyword, location, max_pages))
+
+    def search_many(self, searches):
+        return self.loop.run_until_complete(self.scraper.search_many(searches))
+
+    def save_data(self, filename_prefix="wuzzuf_jobs"):
+        return self.loop.run_until_complete(self.scraper.save_data(filename_prefix))
+
+    def reset(self):
+        self.scraper.reset()
+
+    def close(self):
+        if self.loop.is_closed():
+            return
+        self.loop.run_until_complete(self.scraper.close())
+        self.loop.close()
+
+
+async def run_campaign(searches, output_prefix="wuzzuf_jobs", **options):
+    """Run searches concurrently and save them as one session"""
+    async with AsyncWuzzufScraper(**options) as scraper:
+        await scraper.search_many(searches)
+        return await scraper.save_data(output_prefix)
+
+
+def main():
+    """Run the configured search, or every ENGINEERING_FIELDS search with --all"""
+    import sys
+    from simple_config import (
+        SEARCH_KEYWORD, LOCATION, MAX_PAGES, OUTPUT_PREFIX, DELAY_BETWEEN_PAGES,
+        MAX_CONCURRENT_PER_HOST, ENGINEERING_FIELDS
+    )
+
+    keywords = ENGINEERING_FIELDS if "--all" in sys.argv[1:] else [SEARCH_KEYWORD]
+    searches = [(keyword, LOCATION, MAX_PAGES) for keyword in keywords]
+    session_folder = asyncio.run(run_campaign(
+        searches,
+        output_prefix=OUTPUT_PREFIX,
+        delay_range=DELAY_BETWEEN_PAGES,
+        max_per_host=MAX_CONCURRENT_PER_HOST
+    ))
+    print(f"📁 Data saved to: {session_folder}")
+
+
+if __name__ == "__main__":
+    main()
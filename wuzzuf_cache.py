@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Page Cache for Wuzzuf Scraper
+On-disk cache of fetched pages keyed by URL and fetch mode, with a TTL, an LRU
+size cap and gzip-compressed entries. The replay mode serves everything from
+the cache so extraction can run fully offline.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_MODES = ("off", "readwrite", "replay")
+DEFAULT_CACHE_DIR = "Data/page_cache"
+CACHE_SUFFIX = ".html.gz"
+
+
+def cache_key(url, fetch_mode):
+    """File name stem of a page, the same URL fetched over HTTP and rendered in Chrome differ"""
+    return hashlib.sha1(f"{fetch_mode} {url}".encode('utf-8')).hexdigest()
+
+
+class CacheIndex:
+    """Cached pages in one directory and their total size, least recently used first
+
+    Shared by every PageCache of the directory (see cache_index), so the size
+    cap holds however many caches a run opens on it.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.entries = None  # key -> compressed size, least recently used first
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Index the directory on first use, ordered by last access (file mtime)"""
+        if self.entries is not None:
+            return
+        found = []
+        if self.directory.is_dir():
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(CACHE_SUFFIX):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name[:-len(CACHE_SUFFIX)], stat.st_size))
+        found.sort()
+        self.entries = OrderedDict((key, size) for _, key, size in found)
+        self.total_bytes = sum(self.entries.values())
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def cache_index(directory):
+    """The CacheIndex of a directory, the same object for every PageCache on it"""
+    directory = Path(directory)
+    with _indexes_lock:
+        return _indexes.setdefault(directory.resolve(), CacheIndex(directory))
+
+
+class PageCache:
+    """Gzip-compressed pages on disk, evicted least recently used first
+
+    get() returns None for missing pages and, outside replay mode, for pages
+    older than ttl seconds. Once the files take more than max_bytes the least
+    recently used ones are deleted. In replay mode pages never expire and
+    callers should treat a miss as the end of the data instead of fetching.
+    Safe to share between threads.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=24 * 3600, max_bytes=200 * 1024 * 1024, mode="readwrite"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode} (expected one of {CACHE_MODES})")
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.index = cache_index(self.directory)  # Shared with other caches of the directory
+        self.lock = self.index.lock
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    @property
+    def replay(self):
+        return self.mode == "replay"
+
+    def path_for(self, key):
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, url, fetch_mode):
+        """Cached HTML for the URL and fetch mode, or None"""
+        if self.mode == "off":
+            return None
+        key = cache_key(url, fetch_mode)
+        with self.lock:
+            self.index.load()
+            if key not in self.index.entries:
+                self.stats['misses'] += 1
+                return None
+            path = self.path_for(key)
+            try:
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    header = json.loads(f.readline())
+                    html = f.read()
+            except (OSError, ValueError, EOFError):
+                # Deleted or torn entry, forget it
+                self.drop(key)
+                self.stats['misses'] += 1
+                return None
+
+            if not self.replay and self.ttl is not None and time.time() - header.get('fetched_at', 0) > self.ttl:
+                self.drop(key)
+                self.stats['misses'] += 1
+                return None
+
+            # Mark as recently used, in memory and on disk for the next run
+            self.index.entries.move_to_end(key)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            self.stats['hits'] += 1
+            return html
+
+    def put(self, url, fetch_mode, html):
+        """Store a page, evicting the least recently used pages over max_bytes"""
+        if self.mode != "readwrite" or not html:
+            return
+        key = cache_key(url, fetch_mode)
+        header = json.dumps({'url': url, 'fetch_mode': fetch_mode, 'fetched_at': time.time()})
+        data = gzip.compress((header + "\n" + html).encode('utf-8'))
+
+        with self.lock:
+            self.index.load()
+            path = self.path_for(key)
+            temp_path = path.with_name(path.name + f".{threading.get_ident()}.tmp")
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                temp_path.write_bytes(data)
+                os.replace(temp_path, path)
+            except OSError as e:
+                print(f"⚠️ Could not cache page: {e}")
+                return
+            self.index.total_bytes += len(data) - self.index.entries.pop(key, 0)
+            self.index.entries[key] = len(data)
+            self.stats['stores'] += 1
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used pages until the cache fits in max_bytes"""
+        if self.max_bytes is None:
+            return
+        while self.index.total_bytes > self.max_bytes and len(self.index.entries) > 1:
+            oldest = next(iter(self.index.entries))
+            self.drop(oldest)
+            self.stats['evictions'] += 1
+
+    def drop(self, key):
+        self.index.total_bytes -= self.index.entries.pop(key, 0)
+        try:
+            self.path_for(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        """Delete every cached page"""
+        with self.lock:
+            self.index.load()
+            for key in list(self.index.entries):
+                self.drop(key)
+
+    def size(self):
+        """Number of cached pages and their compressed size in bytes"""
+        with self.lock:
+            self.index.load()
+            return len(self.index.entries), self.index.total_bytes
+
+
+def configured_page_cache(for_details=False):
+    """PageCache from simple_config, or None when it is off
+
+    Search pages follow PAGE_CACHE_MODE. Job detail pages (for_details) are
+    also cached when CACHE_DETAIL_PAGES is on, even if PAGE_CACHE_MODE is "off".
+    """
+    try:
+        from simple_config import (
+            PAGE_CACHE_MODE, PAGE_CACHE_DIR, PAGE_CACHE_TTL_HOURS, PAGE_CACHE_MAX_MB, CACHE_DETAIL_PAGES
+        )
+    except ImportError:
+        return PageCache() if for_details else None
+    mode = PAGE_CACHE_MODE
+    if mode == "off" and for_details and CACHE_DETAIL_PAGES:
+        mode = "readwrite"
+    if mode == "off":
+        return None
+    return PageCache(
+        directory=PAGE_CACHE_DIR,
+        ttl=PAGE_CACHE_TTL_HOURS * 3600 if PAGE_CACHE_TTL_HOURS else None,
+        max_bytes=PAGE_CACHE_MAX_MB * 1024 * 1024 if PAGE_CACHE_MAX_MB else None,
+        mode=mode
+    )
+
+
+def main():
+    """Show or clear the page cache: python wuzzuf_cache.py [--clear]"""
+    import sys
+
+    cache = configured_page_cache(for_details=True) or PageCache()
+    if "--clear" in sys.argv[1:]:
+        cache.clear()
+        print(f"🧹 Page cache cleared: {cache.directory}")
+        return
+    pages, size = cache.size()
+    print(f"🗃️ {pages} cached pages, {size / (1024 * 1024):.1f} MB in {cache.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Wuzzuf Campaign Runner
+Runs many searches across a shared pool of reusable scrapers and writes one
+consolidated, deduplicated dataset plus per-keyword breakdowns
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+from simple_wuzzuf_scraper import SimpleWuzzufScraper, write_jobs_csv, write_jobs_json
+from wuzzuf_driver import DriverPool
+from wuzzuf_parser import job_key
+
+
+def campaign_from_fields(fields, location="", max_pages=3):
+    """Build campaign searches for a list of keywords, e.g. ENGINEERING_FIELDS"""
+    return [(field, location, max_pages) for field in fields]
+
+
+def search_label(keyword, location=""):
+    """Label used for a search in breakdowns and file names"""
+    return f"{keyword} ({location})" if location else keyword
+
+
+class CampaignRunner:
+    """Schedule (keyword, location, max_pages) searches across a shared worker pool
+
+    Browsers come from a DriverPool; pass pool= to share one that outlives the
+    campaign, otherwise the runner creates one and shuts it down when done.
+    """
+
+    def __init__(self, searches, workers=2, output_dir="Data", pool=None, **scraper_options):
+        self.searches = list(searches)
+        self.workers = max(1, workers)
+        self.output_dir = Path(output_dir)
+        self.scraper_options = scraper_options
+        self.scraper_options.setdefault('headless', True)
+        self.owns_pool = pool is None and scraper_options.get('fetch_mode', 'browser') == 'browser'
+        # Each worker keeps its drivers for the whole campaign, one per parallel page worker
+        drivers_needed = self.workers * max(1, scraper_options.get('workers', 1))
+        if self.owns_pool:
+            pool = DriverPool(
+                size=drivers_needed,
+                headless=self.scraper_options['headless'],
+                profile=self.scraper_options.get('browser_profile', 'default')
+            )
+        elif pool is not None:
+            pool.ensure_capacity(drivers_needed)
+        self.pool = pool
+        self.results = {}  # search label -> list of jobs
+        self.local = threading.local()
+        self.scrapers = []
+        self.lock = threading.Lock()
+
+    def get_scraper(self):
+        """Return this worker thread's scraper, reusing its browser between searches"""
+        if not hasattr(self.local, 'scraper'):
+            self.local.scraper = SimpleWuzzufScraper(close_after_search=False, pool=self.pool, **self.scraper_options)
+            with self.lock:
+                self.scrapers.append(self.local.scraper)
+        return self.local.scraper
+
+    def run_search(self, keyword, location, max_pages):
+        """Run one search on the current worker's scraper"""
+        scraper = self.get_scraper()
+        scraper.reset()
+        scraper.search_jobs(keyword=keyword, location=location, max_pages=max_pages)
+        jobs = scraper.jobs_data
+        scraper.reset()
+        return jobs
+
+    def run(self):
+        """Run every search and return the jobs collected per search"""
+        print(f"🚀 Starting campaign: {len(self.searches)} searches on {self.workers} workers")
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(self.run_search, keyword, location, max_pages): search_label(keyword, location)
+                    for keyword, location, max_pages in self.searches
+                }
+                for future in as_completed(futures):
+                    label = futures[future]
+                    try:
+                        self.results[label] = future.result()
+                        print(f"✅ {label}: {len(self.results[label])} jobs")
+                    except Exception as e:
+                        self.results[label] = []
+                        print(f"❌ {label} failed: {e}")
+        finally:
+            self.close()
+
+        return self.results
+
+    def consolidated_jobs(self):
+        """Merge all searches into one list, keeping the first copy of each posting (by job_key)"""
+        merged = {}
+        for keyword, location, _ in self.searches:
+            label = search_label(keyword, location)
+            for job in self.results.get(label, []):
+                key = job_key(job)
+                if key not in merged:
+                    merged[key] = dict(job, search_keywords=label)
+                elif label not in merged[key]['search_keywords'].split('; '):
+                    merged[key]['search_keywords'] += f"; {label}"
+        return list(merged.values())
+
+    def save(self):
+        """Save the consolidated dataset, per-keyword files and a summary"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        campaign_folder = self.output_dir / f"campaign_{timestamp}"
+        breakdown_folder = campaign_folder / "by_keyword"
+        breakdown_folder.mkdir(parents=True, exist_ok=True)
+
+        all_jobs = self.consolidated_jobs()
+        write_jobs_csv(all_jobs, str(campaign_folder / f"campaign_jobs_{timestamp}.csv"))
+        write_jobs_json(all_jobs, str(campaign_folder / f"campaign_jobs_{timestamp}.json"))
+
+        for label, jobs in self.results.items():
+            safe_label = label.replace(' ', '_').replace('/', '_').replace('\\', '_').replace('(', '').replace(')', '')
+            write_jobs_csv(jobs, str(breakdown_folder / f"wuzzuf_jobs_{safe_label}.csv"))
+            write_jobs_json(jobs, str(breakdown_folder / f"wuzzuf_jobs_{safe_label}.json"))
+
+        self.create_summary_file(campaign_folder / f"campaign_summary_{timestamp}.txt", all_jobs)
+        print(f"💾 Campaign saved to: {campaign_folder}")
+        return str(campaign_folder)
+
+    def create_summary_file(self, summary_path, all_jobs):
+        """Write per-keyword counts and the deduplication result"""
+        total_scraped = sum(len(jobs) for jobs in self.results.values())
+        lines = [
+            "Wuzzuf Campaign Summary",
+            "========================================",
+            "",
+            f"- Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"- Searches: {len(self.searches)}",
+            f"- Jobs scraped: {total_scraped}",
+            f"- Unique jobs: {len(all_jobs)}",
+            f"- Duplicates removed: {total_scraped - len(all_jobs)}",
+            "",
+            "Jobs per search:",
+        ]
+        for keyword, location, max_pages in self.searches:
+            label = search_label(keyword, location)
+            lines.append(f"- {label}: {len(self.results.get(label, []))} jobs ({max_pages} pages)")
+
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        print(f"📄 Created summary: {Path(summary_path).name}")
+
+    def close(self):
+        """Return every worker's browser to the pool"""
+        for scraper in self.scrapers:
+            scraper.close()
+        self.scrapers = []
+        if self.owns_pool:
+            self.pool.shutdown()
+
+
+def main():
+    """Run a campaign over every field in ENGINEERING_FIELDS"""
+    from simple_config import (
+        ENGINEERING_FIELDS, LOCATION, MAX_PAGES, FETCH_MODE, EXTRACTION_MODE, CAMPAIGN_WORKERS, BROWSER_PROFILE
+    )
+
+    runner = CampaignRunner(
+        campaign_from_fields(ENGINEERING_FIELDS, LOCATION, MAX_PAGES),
+        workers=CAMPAIGN_WORKERS,
+        fetch_mode=FETCH_MODE,
+        extraction_mode=EXTRACTION_MODE,
+        browser_profile=BROWSER_PROFILE
+    )
+    runner.run()
+    runner.save()
+
+
+if __name__ == "__main__":
+    main()
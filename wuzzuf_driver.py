@@ -0,0 +1,377 @@
+"""
+Chrome Driver Setup for Wuzzuf Scraper
+Builds Chrome options, resolves and caches the ChromeDriver binary, starts
+drivers and keeps a pool of reusable drivers
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from wuzzuf_readiness import enable_network_logging
+
+# psutil is optional, without it drivers are only recycled by page count
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# Browser profiles
+BROWSER_PROFILES = ("default", "lean")
+
+# URL patterns the lean profile blocks through CDP: static assets the scraper never reads...
+LEAN_BLOCKED_RESOURCES = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",  # Images
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",                   # Fonts
+    "*.css",                                                          # Stylesheets
+    "*.mp4", "*.webm", "*.mp3",                                       # Media
+]
+
+# ...and third-party analytics, tracking and ad domains
+LEAN_BLOCKED_DOMAINS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+    "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*",
+    "*snap.licdn.com*", "*ads-twitter.com*", "*analytics.tiktok.com*",
+    "*bat.bing.com*", "*segment.io*", "*mixpanel.com*", "*intercom.io*",
+]
+
+
+def build_chrome_options(headless=False, profile="default"):
+    """Chrome options used by every scraper driver"""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-plugins")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    enable_network_logging(chrome_options)  # CDP network events for idle detection
+    
+    if profile == "lean":
+        # Don't decode images or show notifications, on top of the CDP URL blocking
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+    return chrome_options
+
+
+def apply_lean_profile(driver):
+    """Block non-essential resources and third-party domains through CDP"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_BLOCKED_RESOURCES + LEAN_BLOCKED_DOMAINS})
+    except Exception as e:
+        print(f"⚠️ Could not enable request blocking: {e}")
+
+
+# ChromeDriver paths resolved by ChromeDriverManager, keyed by Chrome major version
+DRIVER_CACHE_FILE = Path.home() / ".wuzzuf_scraper" / "chromedriver_cache.json"
+
+# Commands that print the installed Chrome version
+CHROME_VERSION_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+]
+
+_resolved_paths = {}  # In-process cache: (pinned path, offline) -> driver path
+_resolve_lock = threading.Lock()
+
+
+def load_driver_settings():
+    """Read the pinned driver path and offline flag from simple_config"""
+    try:
+        from simple_config import CHROMEDRIVER_PATH, OFFLINE_DRIVER
+        return CHROMEDRIVER_PATH, OFFLINE_DRIVER
+    except ImportError:
+        return "", False
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version string, or None if it can't be found"""
+    for command in CHROME_VERSION_COMMANDS:
+        if command[0] == "reg" and sys.platform != "win32":
+            continue
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+\.\d+\.\d+", output)
+        if match:
+            return match.group(0)
+    return None
+
+
+def read_driver_cache():
+    """Load the Chrome version -> ChromeDriver path cache"""
+    try:
+        return json.loads(DRIVER_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_driver_cache(cache):
+    """Save the Chrome version -> ChromeDriver path cache"""
+    try:
+        DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_FILE.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️ Could not save ChromeDriver cache: {e}")
+
+
+def resolve_chromedriver_path(pinned_path="", offline=False):
+    """Find the ChromeDriver binary, touching the network only when nothing is cached
+
+    Order: pinned path, in-process cache, on-disk cache for the installed Chrome
+    version, chromedriver on PATH (offline only), then ChromeDriverManager.
+    When the Chrome version can't be detected the on-disk cache is skipped.
+    """
+    if pinned_path:
+        if not os.path.isfile(pinned_path):
+            raise FileNotFoundError(f"Pinned ChromeDriver not found: {pinned_path}")
+        return pinned_path
+
+    with _resolve_lock:
+        memo_key = (pinned_path, offline)
+        if memo_key in _resolved_paths and os.path.isfile(_resolved_paths[memo_key]):
+            return _resolved_paths[memo_key]
+
+        chrome_version = detect_chrome_version()
+        # Without a version a cached driver can't be matched to Chrome (it may
+        # have been upgraded since), so the disk cache is neither read nor written
+        cache_key = chrome_version.split('.')[0] if chrome_version else None
+        cache = read_driver_cache()
+        path = cache.get(cache_key) if cache_key else None
+
+        if not (path and os.path.isfile(path)):
+            if offline:
+                path = shutil.which("chromedriver")
+                if not path:
+                    raise RuntimeError(
+                        f"Offline mode: no cached ChromeDriver for Chrome {chrome_version or '(unknown version)'}. "
+                        "Run once online or set CHROMEDRIVER_PATH."
+                    )
+            else:
+                # Auto-install ChromeDriver
+                path = ChromeDriverManager().install()
+                if cache_key:
+                    cache[cache_key] = path
+                    cache.pop("unknown", None)  # Written by older versions, never valid
+                    write_driver_cache(cache)
+
+        _resolved_paths[memo_key] = path
+        return path
+
+
+def create_chrome_driver(headless=False, driver_path=None, offline=None, profile="default"):
+    """Start a new Chrome driver and report how long startup took
+    
+    profile: "default", or "lean" to block images, fonts, CSS, media and
+    third-party analytics/ad requests
+
+    driver_path / offline default to CHROMEDRIVER_PATH / OFFLINE_DRIVER in simple_config.
+    The timings are stored on the driver as driver.startup_times.
+    """
+    pinned_path, offline_default = load_driver_settings()
+    driver_path = pinned_path if driver_path is None else driver_path
+    offline = offline_default if offline is None else offline
+
+    started = time.monotonic()
+    service = Service(resolve_chromedriver_path(driver_path, offline))
+    resolved = time.monotonic()
+    driver = webdriver.Chrome(service=service, options=build_chrome_options(headless, profile))
+    if profile == "lean":
+        apply_lean_profile(driver)
+    launched = time.monotonic()
+    driver.browser_profile = profile
+
+    driver.startup_times = {
+        'resolve_seconds': resolved - started,
+        'launch_seconds': launched - resolved,
+        'total_seconds': launched - started,
+    }
+    print(
+        f"⏱️ Chrome driver started in {launched - started:.2f}s "
+        f"(driver lookup {resolved - started:.2f}s, browser launch {launched - resolved:.2f}s)"
+    )
+    return driver
+
+
+# Longest a scraper waits for a pooled driver before giving up with an error
+POOL_ACQUIRE_TIMEOUT = 300
+
+
+class DriverPool:
+    """Long-lived Chrome drivers that scrapers borrow and return
+
+    Drivers are health-checked before being handed out, and recycled after
+    max_pages_per_driver pages or once the browser uses more than max_memory_mb.
+    """
+
+    def __init__(self, size=2, headless=False, max_pages_per_driver=50, max_memory_mb=1500, profile="default"):
+        self.size = size
+        self.headless = headless
+        self.profile = profile
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_memory_mb = max_memory_mb
+        self.idle = []
+        self.in_use = set()
+        self.page_counts = {}  # id(driver) -> pages loaded since it was started
+        self.startup_times = []  # Seconds each cold start took, to spot regressions
+        self.condition = threading.Condition()
+        self.closed = False
+
+    def acquire(self, timeout=None):
+        """Borrow a healthy driver, starting a new one if the pool is not full"""
+        with self.condition:
+            while True:
+                if self.closed:
+                    raise RuntimeError("Driver pool has been shut down")
+
+                while self.idle:
+                    driver = self.idle.pop()
+                    if self.is_healthy(driver):
+                        self.in_use.add(driver)
+                        return driver
+                    print("♻️ Replacing unhealthy Chrome driver")
+                    self._quit(driver)
+
+                if len(self.in_use) < self.size:
+                    break
+                if not self.condition.wait(timeout):
+                    raise TimeoutError(
+                        f"No Chrome driver became available within {timeout}s, all {self.size} pooled "
+                        f"drivers are in use (raise DRIVER_POOL_SIZE or lower the number of workers)"
+                    )
+
+            # Reserve the slot before starting Chrome outside the lock
+            placeholder = object()
+            self.in_use.add(placeholder)
+
+        try:
+            driver = create_chrome_driver(self.headless, profile=self.profile)
+        except Exception:
+            with self.condition:
+                self.in_use.discard(placeholder)
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.in_use.discard(placeholder)
+            self.in_use.add(driver)
+            self.page_counts[id(driver)] = 0
+            self.startup_times.append(driver.startup_times['total_seconds'])
+        print("✅ Chrome driver added to pool")
+        return driver
+
+    def ensure_capacity(self, size):
+        """Grow the pool to at least size drivers, for callers that keep one per worker"""
+        with self.condition:
+            if size > self.size:
+                print(f"🚗 Growing the driver pool from {self.size} to {size} drivers")
+                self.size = size
+                self.condition.notify_all()
+
+    def release(self, driver, pages=0):
+        """Return a borrowed driver, recycling it if it is worn out"""
+        with self.condition:
+            self.in_use.discard(driver)
+            self.page_counts[id(driver)] = self.page_counts.get(id(driver), 0) + pages
+
+            if self.closed or self.should_recycle(driver):
+                self._quit(driver)
+            else:
+                self.idle.append(driver)
+            self.condition.notify()
+
+    def discard(self, driver):
+        """Quit a borrowed driver instead of returning it, e.g. when a scrape is aborted"""
+        with self.condition:
+            self.in_use.discard(driver)
+            self._quit(driver)
+            self.condition.notify()
+
+    @contextmanager
+    def borrow(self, timeout=None):
+        """Borrow a driver for the duration of a with block"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def is_healthy(self, driver):
+        """Check that the browser still responds"""
+        try:
+            return driver.execute_script("return 1") == 1 and bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def should_recycle(self, driver):
+        """Recycle after too many pages or too much memory"""
+        if self.page_counts.get(id(driver), 0) >= self.max_pages_per_driver:
+            print("♻️ Recycling Chrome driver after page limit")
+            return True
+        memory_mb = browser_memory_mb(driver)
+        if memory_mb is not None and memory_mb >= self.max_memory_mb:
+            print(f"♻️ Recycling Chrome driver using {memory_mb:.0f} MB")
+            return True
+        return False
+
+    def shutdown(self):
+        """Quit all idle drivers; drivers still in use are quit when they are returned"""
+        with self.condition:
+            self.closed = True
+            for driver in self.idle:
+                self._quit(driver)
+            self.idle = []
+            self.condition.notify_all()
+
+    def _quit(self, driver):
+        self.page_counts.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+
+def browser_memory_mb(driver):
+    """Resident memory of ChromeDriver and its Chrome processes, or None without psutil"""
+    if psutil is None:
+        return None
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except Exception:
+        return None
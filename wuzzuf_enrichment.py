@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Job Detail Enrichment for Wuzzuf Scraper
+Optional stage that fetches each job's detail page concurrently and merges the
+description, requirements, salary and vacancies into the extracted records
+"""
+
+import random
+import re
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from wuzzuf_cache import configured_page_cache
+from wuzzuf_http import WuzzufHttpClient, HostThrottle
+from wuzzuf_parser import HTML_PARSER, JOB_ID_PATTERN, canonical_link, element_text
+from wuzzuf_selectors import (
+    DETAIL_SECTION_SELECTOR, DETAIL_HEADING_SELECTOR,
+    DETAIL_DESCRIPTION_HEADINGS, DETAIL_REQUIREMENTS_HEADINGS,
+    DETAIL_LABEL_SELECTOR, DETAIL_SALARY_LABELS, DETAIL_VACANCIES_LABELS,
+    DETAIL_VACANCIES_PATTERN, DEFAULT_TEXT,
+)
+
+DETAIL_FETCH_MODES = ("http", "browser")
+DETAIL_FIELDS = ("description", "requirements", "salary", "vacancies")
+
+
+def section_text(soup, headings):
+    """Text of the first section whose heading matches one of the headings, without the heading"""
+    for section in soup.select(DETAIL_SECTION_SELECTOR):
+        heading = section.select_one(DETAIL_HEADING_SELECTOR)
+        if heading is None:
+            continue
+        if element_text(heading).lower().rstrip(':') not in headings:
+            continue
+        heading_text = element_text(heading)
+        text = element_text(section)
+        if text.startswith(heading_text):
+            text = text[len(heading_text):].strip()
+        if text:
+            return text
+    return DEFAULT_TEXT
+
+
+def labelled_value(soup, labels):
+    """Value next to a "Label:" element, e.g. <span>Salary:</span><span>Confidential</span>"""
+    for label in soup.select(DETAIL_LABEL_SELECTOR):
+        if element_text(label).lower().rstrip(':').strip() not in labels:
+            continue
+        value = label.find_next_sibling()
+        if value is not None and element_text(value):
+            return element_text(value)
+        # Value written in the same parent as plain text
+        parent_text = element_text(label.parent)
+        label_text = element_text(label)
+        if parent_text.startswith(label_text) and parent_text[len(label_text):].strip():
+            return parent_text[len(label_text):].strip()
+    return DEFAULT_TEXT
+
+
+def detail_url(job):
+    """Job page to read the details from: job_url, or a job-page application link in older data
+
+    The application link is usually a category page (/a/...-Jobs-in-Egypt),
+    so it is only used when it points at a job. None when there is no job page.
+    """
+    link = job.get('job_url')
+    if canonical_link(link):
+        return link
+    link = job.get('application_link')
+    if JOB_ID_PATTERN.search(canonical_link(link)):
+        return link
+    return None
+
+
+def parse_job_details(html):
+    """Extract description, requirements, salary and vacancies from a job detail page"""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    details = {
+        'description': section_text(soup, DETAIL_DESCRIPTION_HEADINGS),
+        'requirements': section_text(soup, DETAIL_REQUIREMENTS_HEADINGS),
+        'salary': labelled_value(soup, DETAIL_SALARY_LABELS),
+        'vacancies': labelled_value(soup, DETAIL_VACANCIES_LABELS),
+    }
+    if details['vacancies'] == DEFAULT_TEXT:
+        match = re.search(DETAIL_VACANCIES_PATTERN, element_text(soup), re.I)
+        if match:
+            details['vacancies'] = match.group(1)
+    return details
+
+
+class JobEnricher:
+    """Fetch job detail pages concurrently and merge their fields into job records
+
+    Pages are fetched by a small thread pool, over one pooled HTTP session per
+    thread or with drivers borrowed from a DriverPool (fetch_mode="browser"),
+    with at most max_per_host requests to the same host at once. Don't pass the
+    pool the scraper holds its driver from while enriching: with no spare driver
+    the borrow times out. By default a small headless pool of its own is started.
+    Fetched pages go to a wuzzuf_cache.PageCache (None for the configured one, False for none),
+    so re-runs skip jobs already fetched; with a replay-only cache nothing is fetched.
+    """
+
+    def __init__(self, workers=4, fetch_mode="http", pool=None, max_per_host=2,
+                 cache=None, delay_range=(0.5, 1.5)):
+        if fetch_mode not in DETAIL_FETCH_MODES:
+            raise ValueError(f"Unknown detail fetch mode: {fetch_mode} (expected one of {DETAIL_FETCH_MODES})")
+        self.workers = max(1, workers)
+        self.fetch_mode = fetch_mode
+        self.pool = pool
+        self.owns_pool = False
+        self.throttle = HostThrottle(max_per_host)
+        if cache is None:
+            cache = configured_page_cache(for_details=True)
+        self.cache = cache or None
+        self.delay_range = delay_range
+        self.executor = None  # Kept across pages so each thread keeps its HTTP client
+        self.local = threading.local()  # One HTTP client per worker thread
+        self.clients = []
+        self.clients_lock = threading.Lock()
+        self.stats = {'fetched': 0, 'cached': 0, 'failed': 0}
+        self.stats_lock = threading.Lock()
+        self.closed = False  # Set by close(), fetches still running give up quietly
+
+    def enrich(self, jobs):
+        """Return copies of jobs with the detail fields added, in the same order"""
+        jobs = list(jobs)
+        if not jobs:
+            return jobs
+        self.closed = False
+        if self.workers == 1 or len(jobs) == 1:
+            enriched = [self.enrich_job(job) for job in jobs]
+        else:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="enrich")
+            try:
+                enriched = list(self.executor.map(self.enrich_job, jobs))
+            except CancelledError:
+                return jobs  # Closed while the page was being enriched
+        print(f"🔎 Enriched {len(jobs)} jobs ({self.stats['fetched']} fetched, "
+              f"{self.stats['cached']} cached, {self.stats['failed']} failed so far)")
+        return enriched
+
+    def enrich_job(self, job):
+        """Copy of a job with its detail page fields, or "Not specified" when they can't be read"""
+        enriched = dict(job)
+        for field in DETAIL_FIELDS:
+            enriched.setdefault(field, DEFAULT_TEXT)
+        link = detail_url(job)
+        if link is None:
+            return enriched
+        html = self.get_page(link)
+        if html is not None:
+            enriched.update(parse_job_details(html))
+        return enriched
+
+    def count(self, stat):
+        with self.stats_lock:
+            self.stats[stat] += 1
+
+    def get_page(self, url):
+        """Detail page HTML from the cache or the network, None if it could not be fetched"""
+        if self.cache is not None:
+            html = self.cache.get(url, self.fetch_mode)
+            if html is not None:
+                self.count('cached')
+                return html
+            if self.cache.replay:
+                return None
+        if self.closed:
+            return None
+        try:
+            with self.throttle.for_url(url):
+                html = self.fetch(url)
+                # Politeness delay while holding the host slot
+                time.sleep(random.uniform(*self.delay_range))
+        except Exception as e:
+            if self.closed:
+                return None  # Its client or driver pool was closed under it
+            self.count('failed')
+            print(f"⚠️ Could not fetch job details from {url}: {e}")
+            return None
+        self.count('fetched')
+        if self.cache is not None:
+            self.cache.put(url, self.fetch_mode, html)
+        return html
+
+    def fetch(self, url):
+        """Fetch a detail page with the configured fetch mode"""
+        if self.fetch_mode == "browser":
+            from wuzzuf_driver import POOL_ACQUIRE_TIMEOUT
+            with self.get_pool().borrow(timeout=POOL_ACQUIRE_TIMEOUT) as driver:
+                driver.get(url)
+                return driver.page_source
+        return self.get_client().fetch(url)
+
+    def get_client(self):
+        """HTTP client of the current worker thread"""
+        client = getattr(self.local, 'client', None)
+        if client is None:
+            client = WuzzufHttpClient(pool_size=2)
+            self.local.client = client
+            with self.clients_lock:
+                self.clients.append(client)
+        return client
+
+    def get_pool(self):
+        """Driver pool to borrow from, a small headless one is started if none was given"""
+        with self.clients_lock:
+            if self.pool is None:
+                from wuzzuf_driver import DriverPool
+                self.pool = DriverPool(size=min(self.workers, 2), headless=True, profile="lean")
+                self.owns_pool = True
+            return self.pool
+
+    def close(self):
+        """Stop the worker threads, close HTTP sessions and the driver pool if this enricher started it
+
+        Doesn't wait for fetches in progress (the GUI stops a scrape on the Tk
+        thread): queued jobs are cancelled and running ones give up quietly.
+        """
+        self.closed = True
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        with self.clients_lock:
+            clients, self.clients = self.clients, []
+        for client in clients:
+            client.close()
+        self.local = threading.local()
+        if self.owns_pool and self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+            self.owns_pool = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def configured_enricher(max_per_host=2, cache=None):
+    """JobEnricher set up from simple_config when ENRICH_DETAILS is on, else None
+
+    In browser mode it gets its own driver pool: the scraper keeps its driver
+    while a page is enriched, so borrowing from the scraper's pool could wait forever.
+    """
+    try:
+        from simple_config import ENRICH_DETAILS, DETAIL_WORKERS, DETAIL_FETCH_MODE
+    except ImportError:
+        return None
+    if not ENRICH_DETAILS:
+        return None
+    return JobEnricher(
+        workers=DETAIL_WORKERS, fetch_mode=DETAIL_FETCH_MODE, max_per_host=max_per_host, cache=cache
+    )
+
+
+def main():
+    """Enrich a saved JSON results file: python wuzzuf_enrichment.py <jobs.json> [output.json]"""
+    import json
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python wuzzuf_enrichment.py <jobs.json> [output.json]")
+        return
+    source = Path(sys.argv[1])
+    target = Path(sys.argv[2]) if len(sys.argv) > 2 else source.with_name(source.stem + "_enriched.json")
+    jobs = json.loads(source.read_text(encoding='utf-8'))
+
+    with JobEnricher() as enricher:
+        jobs = enricher.enrich(jobs)
+    target.write_text(json.dumps(jobs, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"✅ Enriched jobs saved to {target}")
+
+
+if __name__ == "__main__":
+    main()
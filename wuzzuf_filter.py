@@ -0,0 +1,184 @@
+"""
+Data Viewer Filter Engine
+Substring search over a DataFrame with cached lowercase columns, reuse of the
+previous result while a query is being typed, and background execution so
+stale keystrokes are dropped instead of queued
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+ALL_COLUMNS = ""  # Column value meaning "search every column"
+ROW_SEPARATOR = "\x1f"  # Joins the columns of a row, never typed in a query
+RESULT_CACHE_SIZE = 32  # Recent queries kept to go back to on backspace
+SCAN_CHUNK_ROWS = 50_000  # Rows scanned between checks for a newer query
+
+
+def lowercase_text(series):
+    """Lowercase display text of a column, lists joined like the table shows them"""
+    def to_text(value):
+        if isinstance(value, (list, tuple)):
+            return ", ".join(str(item) for item in value)
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return ""
+        return str(value)
+    return series.map(to_text).str.lower()
+
+
+class FrameState:
+    """One DataFrame with its caches, replaced whole by FilterEngine.set_frame"""
+
+    def __init__(self, df=None):
+        self.df = df
+        self.columns = {}  # column (or ALL_COLUMNS) -> lowercase text Series, indexed by row position
+        self.results = OrderedDict()  # (column, term) -> matching row positions
+        self.lock = threading.Lock()  # Guards the two caches, never held while scanning
+
+
+class FilterEngine:
+    """Find the rows of a DataFrame containing a search term
+
+    Lowercase text is computed once per column (and once for the whole row for
+    all-column searches) on first use. A query that extends a previous one, like
+    "pyt" -> "pyth", only scans the rows the previous query matched; recent
+    results are kept so deleting characters is instant too.
+    set_frame only swaps in a new FrameState, so the Tk thread never waits on a
+    running query; queries passed a generation stop between chunks once a newer
+    query or frame supersedes them.
+    """
+
+    def __init__(self):
+        self.state = FrameState()
+        self.generations = itertools.count(1)
+        self.generation = 0  # Bumped by every set_frame/submit, older queries give up
+
+    @property
+    def df(self):
+        return self.state.df
+
+    def set_frame(self, df):
+        """Use a new DataFrame, dropping every cache"""
+        self.state = FrameState(df)
+        self.generation = next(self.generations)
+
+    def superseded(self, generation):
+        return generation is not None and generation != self.generation
+
+    def column_text(self, state, column, generation=None):
+        """Cached lowercase text of a column, or of whole rows for ALL_COLUMNS
+
+        Built outside the cache lock; returns None if superseded meanwhile.
+        """
+        with state.lock:
+            text = state.columns.get(column)
+        if text is not None:
+            return text
+        if column == ALL_COLUMNS:
+            text = None
+            for name in state.df.columns:
+                if self.superseded(generation):
+                    return None
+                column_text = lowercase_text(state.df[name])
+                text = column_text if text is None else text + ROW_SEPARATOR + column_text
+            if text is None:
+                text = pd.Series([""] * len(state.df), dtype=object)
+        else:
+            text = lowercase_text(state.df[column])
+        text = text.reset_index(drop=True)
+        with state.lock:
+            return state.columns.setdefault(column, text)
+
+    def candidates(self, state, column, term):
+        """Row positions that can still match: the result of the longest cached sub-query"""
+        best = None
+        with state.lock:
+            for (cached_column, cached_term), positions in state.results.items():
+                if cached_column == column and cached_term in term:
+                    if best is None or len(positions) < len(best):
+                        best = positions
+        return best
+
+    def search(self, term, column=ALL_COLUMNS, generation=None, state=None):
+        """Positions of the rows containing term (case-insensitive), in DataFrame order
+
+        Returns None if the query's generation is superseded before it finishes.
+        """
+        state = state or self.state
+        if state.df is None:
+            return np.arange(0)
+        term = term.lower()
+        if column not in state.df.columns:
+            column = ALL_COLUMNS
+        if not term:
+            return np.arange(len(state.df))
+
+        key = (column, term)
+        with state.lock:
+            if key in state.results:
+                state.results.move_to_end(key)
+                return state.results[key]
+
+        text = self.column_text(state, column, generation)
+        if text is None:
+            return None
+        positions = self.candidates(state, column, term)
+        if positions is None:
+            positions = np.arange(len(text))
+        matches = []
+        for start in range(0, len(positions), SCAN_CHUNK_ROWS):
+            if self.superseded(generation):
+                return None
+            chunk = positions[start:start + SCAN_CHUNK_ROWS]
+            found = text.iloc[chunk].str.contains(term, regex=False).to_numpy(dtype=bool)
+            matches.append(chunk[found])
+        positions = np.concatenate(matches) if matches else positions
+
+        with state.lock:
+            state.results[key] = positions
+            if len(state.results) > RESULT_CACHE_SIZE:
+                state.results.popitem(last=False)
+        return positions
+
+    def filter(self, term, column=ALL_COLUMNS, generation=None):
+        """The matching rows as a DataFrame (the DataFrame itself for an empty term)
+
+        Returns None if the query's generation is superseded before it finishes.
+        """
+        state = self.state  # Positions and df must come from the same set_frame
+        positions = self.search(term, column, generation, state)
+        if positions is None:
+            return None
+        if state.df is None or len(positions) == len(state.df):
+            return state.df
+        return state.df.iloc[positions]
+
+    def submit(self, term, column, on_done, search=None):
+        """Filter in a background thread and call on_done(generation, df) unless a newer query came in
+
+        Returns the query's generation. on_done runs in the background thread,
+        so GUI callers should hand the result to the Tk thread (e.g. via a queue).
+        search: optional function (term, column) -> DataFrame used instead of
+        filter(), e.g. a lookup in the job store's search index.
+        """
+        generation = self.generation = next(self.generations)
+
+        def run():
+            if self.superseded(generation):
+                return  # Superseded before it started
+            try:
+                if search is not None:
+                    result = search(term, column)
+                else:
+                    result = self.filter(term, column, generation)
+            except Exception as e:
+                print(f"⚠️ Filter failed: {e}")
+                return
+            if not self.superseded(generation):
+                on_done(generation, result)
+
+        threading.Thread(target=run, daemon=True).start()
+        return generation
@@ -22,6 +22,19 @@ from tkinter import ttk
 
 # Import the scraper
 from simple_wuzzuf_scraper import SimpleWuzzufScraper
+from wuzzuf_driver import DriverPool
+from wuzzuf_store import JobStore, configured_store_path
+from wuzzuf_table import VirtualTable
+from wuzzuf_filter import FilterEngine
+from wuzzuf_index import JobIndex, FIELD_ALIASES, configured_search_index, update_search_index
+from wuzzuf_loader import BackgroundLoader, enable_copy_on_write
+from wuzzuf_sessions import SessionCatalog, latest_session_file
+
+# Most jobs a search index lookup shows in the Data Viewer
+JOB_SEARCH_LIMIT = 5000
+
+# Wait this long after the last keystroke before filtering
+FILTER_DEBOUNCE_MS = 250
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
@@ -54,12 +67,23 @@ class WuzzufScraperGUI:
 
         # Initialize application state variables
         self.scraper = None              # Active scraper instance
+        self.driver_pool = None          # Browsers kept alive between scraping runs
         self.scraping_thread = None      # Background scraping thread
         self.scraping_queue = queue.Queue()  # Communication queue for scraping updates
         
         # Data storage variables
         self.df = None                   # Original dataset
         self.filtered_df = None          # Filtered dataset for display
+        self.filter_engine = FilterEngine()  # Cached lowercase columns and recent results
+        self.filter_after_id = None      # Pending debounced filter
+        self.filter_generation = None    # Latest filter query, older results are ignored
+        self.job_index = None            # Search index, used while the job store is shown
+        self.loader = None               # Background file load in progress
+        self.session_catalog = SessionCatalog()  # Every Data/scraping_session_* folder
+        self.sessions_window = None      # Session browser dialog, while open
+        self.scanned_sessions = []       # Sessions listed in the browser by the last scan
+        self.sessions_source = None      # (label shown as the file, session names) of the opened sessions
+        enable_copy_on_write()           # filtered_df shares df's data until a filter narrows it
         
         # Build the user interface
         self.create_widgets()
@@ -69,6 +93,9 @@ class WuzzufScraperGUI:
         
         # Start background task monitoring
         self.monitor_scraping_queue()
+        
+        # Shut down pooled browsers when the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def create_widgets(self):
         """Build the main application interface"""
@@ -386,6 +413,53 @@ class WuzzufScraperGUI:
         )
         load_btn.pack(side="right", padx=(0, 15), pady=12)
         
+        store_btn = ctk.CTkButton(
+            file_input_frame,
+            text="🗄️ Job Store",
+            command=self.load_job_store,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            height=36,
+            width=110
+        )
+        store_btn.pack(side="right", padx=(0, 10), pady=12)
+        
+        sessions_btn = ctk.CTkButton(
+            file_input_frame,
+            text="📚 Sessions",
+            command=self.open_sessions_dialog,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            height=36,
+            width=110
+        )
+        sessions_btn.pack(side="right", padx=(0, 10), pady=12)
+        
+        # Load progress, shown while a file is read in the background
+        self.load_progress_frame = ctk.CTkFrame(file_section, fg_color="transparent")
+        
+        self.load_progress_bar = ctk.CTkProgressBar(self.load_progress_frame, height=12)
+        self.load_progress_bar.pack(side="left", fill="x", expand=True, padx=(15, 10))
+        self.load_progress_bar.set(0)
+        
+        self.load_progress_label = ctk.CTkLabel(
+            self.load_progress_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            width=200
+        )
+        self.load_progress_label.pack(side="left", padx=(0, 10))
+        
+        cancel_load_btn = ctk.CTkButton(
+            self.load_progress_frame,
+            text="✖ Cancel",
+            command=self.cancel_load,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=28,
+            width=80,
+            fg_color=("#dc3545", "#dc3545"),
+            hover_color=("#c82333", "#c82333")
+        )
+        cancel_load_btn.pack(side="right", padx=(0, 15))
+        
         # Data Search and Filtering Interface
         filter_section = self.create_section_frame(data_container, "🔍 Search & Filter")
         
@@ -412,7 +486,7 @@ class WuzzufScraperGUI:
             placeholder_text="Enter search term..."
         )
         self.search_entry.pack(side="left", padx=(0, 15), pady=12)
-        self.search_entry.bind('<KeyRelease>', self.filter_data)  # Auto-filter on typing
+        self.search_entry.bind('<KeyRelease>', self.schedule_filter)  # Auto-filter once typing pauses
         
         # Column-specific filtering dropdown
         column_label = ctk.CTkLabel(
@@ -430,7 +504,8 @@ class WuzzufScraperGUI:
             font=ctk.CTkFont(size=14),
             width=130,
             height=32,
-            state="readonly"
+            state="readonly",
+            command=lambda choice: self.schedule_filter()
         )
         self.column_combo.pack(side="left", padx=(0, 15), pady=12)
         
@@ -493,7 +568,9 @@ class WuzzufScraperGUI:
             width=12
         )
         v_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.tree.configure(yscrollcommand=v_scrollbar.set)
+        
+        # Only the visible rows are ever put in the Treeview, the scrollbar moves through the DataFrame
+        self.table = VirtualTable(self.tree, v_scrollbar, row_height=25)
         
         # Horizontal Scrollbar for column navigation
         h_scrollbar = ctk.CTkScrollbar(
@@ -649,8 +726,8 @@ class WuzzufScraperGUI:
     def scraping_worker(self, keyword, location, max_pages):
         """Worker function for scraping in separate thread"""
         try:
-            # Initialize scraper
-            self.scraper = SimpleWuzzufScraper(headless=False)
+            # Initialize scraper with a browser borrowed from the shared pool
+            self.scraper = SimpleWuzzufScraper(pool=self.get_driver_pool())
             
             # Store search parameters for potential saving when stopping
             self.scraper.current_keyword = keyword
@@ -668,66 +745,67 @@ class WuzzufScraperGUI:
             import builtins
             builtins.print = log_print
             
-            # Start scraping
-            self.scraper.search_jobs(
-                keyword=keyword,
-                location=location,
-                max_pages=max_pages
-            )
-            
-            # Restore print function
-            builtins.print = original_print
+            # Start scraping, every page is written to the session files as it is scraped
+            scraper = self.scraper
+            sinks = scraper.open_stream(f"wuzzuf_jobs_{keyword.replace(' ', '_')}")
+            try:
+                scraper.search_jobs(
+                    keyword=keyword,
+                    location=location,
+                    max_pages=max_pages,
+                    sinks=sinks
+                )
+            finally:
+                # Restore print function
+                builtins.print = original_print
+                # Already finished if the user pressed stop
+                session_folder = scraper.close_stream()
             
-            # Save data to files
-            if self.scraper.jobs_data:
-                # Save data using the scraper's save method (now returns session folder)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename_prefix = f"wuzzuf_jobs_{keyword.replace(' ', '_')}"
-                
-                session_folder = self.scraper.save_data(filename_prefix)
-                self.scraping_queue.put(('complete', (len(self.scraper.jobs_data), session_folder)))
+            if session_folder is None:
+                return
+            if scraper.jobs_data:
+                self.scraping_queue.put(('complete', (len(scraper.jobs_data), session_folder)))
             else:
                 self.scraping_queue.put(('error', 'No data collected'))
                 
         except Exception as e:
             self.scraping_queue.put(('error', str(e)))
     
+    def get_driver_pool(self):
+        """Return the driver pool shared by all scraping runs, starting it on first use"""
+        if self.driver_pool is None:
+            self.driver_pool = DriverPool(size=1, headless=False)
+        return self.driver_pool
+    
+    def on_close(self):
+        """Quit pooled browsers and close the window"""
+        self.cancel_load(quiet=True)
+        if self.driver_pool is not None:
+            self.driver_pool.shutdown()
+        self.close_job_index()
+        self.root.destroy()
+    
     def stop_scraping(self):
         """Stop the scraping process"""
         if self.scraper:
             try:
-                # Check if there's any data to save before stopping
-                if hasattr(self.scraper, 'jobs_data') and self.scraper.jobs_data:
-                    job_count = len(self.scraper.jobs_data)
-                    
-                    # Save the collected data
-                    try:
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        keyword = getattr(self.scraper, 'current_keyword', 'unknown')
-                        filename_prefix = f"wuzzuf_jobs_{keyword.replace(' ', '_')}"
-                        
-                        session_folder = self.scraper.save_data(filename_prefix)
-                        
-                        self.log(f"💾 Saved {job_count} jobs before stopping to: {session_folder}")
-                        
-                        # Show stopped message with save info
-                        messagebox.showinfo(
-                            "⏹️ Scraping Stopped", 
-                            f"Job scraping has been stopped by the user.\n\n"
-                            f"✅ Saved {job_count} jobs collected before stopping!\n"
-                            f"📁 Data saved to: {Path(session_folder).name}"
-                        )
-                        
-                    except Exception as save_error:
-                        self.log(f"⚠️ Warning: Could not save data before stopping: {save_error}")
-                        
-                        # Show stopped message without save info
-                        messagebox.showinfo(
-                            "⏹️ Scraping Stopped", 
-                            f"Job scraping has been stopped by the user.\n\n"
-                            f"⚠️ Could not save {job_count} collected jobs due to an error.\n"
-                            f"Error: {save_error}"
-                        )
+                # Jobs are already on disk, just finish the streamed files
+                job_count = len(self.scraper.jobs_data)
+                session_folder = self.scraper.close_stream(update_index=False)
+                if configured_search_index() and "sqlite" in self.scraper.output_formats:
+                    # Index the jobs saved before stopping without blocking the window
+                    threading.Thread(
+                        target=update_search_index, args=(self.scraper.store_path,), daemon=True
+                    ).start()
+                
+                if session_folder and job_count:
+                    self.log(f"💾 Kept {job_count} jobs scraped before stopping in: {session_folder}")
+                    messagebox.showinfo(
+                        "⏹️ Scraping Stopped", 
+                        f"Job scraping has been stopped by the user.\n\n"
+                        f"✅ Saved {job_count} jobs collected before stopping!\n"
+                        f"📁 Data saved to: {Path(session_folder).name}"
+                    )
                 else:
                     self.log("⏹️ Scraping stopped - no data collected yet")
                     
@@ -738,8 +816,8 @@ class WuzzufScraperGUI:
                         "No data was collected yet, so nothing to save."
                     )
                 
-                # Now quit the driver
-                self.scraper.driver.quit()
+                # Now quit the driver (it may still be busy, so don't return it to the pool)
+                self.scraper.close(discard=True)
                 self.log("⏹️ Scraping stopped by user")
 
                 
@@ -788,6 +866,21 @@ class WuzzufScraperGUI:
                                     self.progress_bar.set(progress)
                         except:
                             pass
+                elif message_type in ('load_first', 'load_progress', 'load_done', 'load_error'):
+                    loader, payload = data
+                    self.handle_load_message(message_type, loader, payload)
+                elif message_type == 'sessions':
+                    self.show_sessions(data)
+                elif message_type == 'job_store':
+                    self.show_job_store(data)
+                elif message_type == 'job_index':
+                    self.attach_job_index(*data)
+                elif message_type == 'filtered':
+                    generation, filtered_df = data
+                    if generation == self.filter_generation:
+                        self.filtered_df = filtered_df
+                        self.display_data()
+                        self.update_statistics()
                 elif message_type == 'complete':
                     # Handle new tuple format: (job_count, session_folder)
                     if isinstance(data, tuple):
@@ -872,18 +965,25 @@ class WuzzufScraperGUI:
     def load_latest_scraped_data(self):
         """Try to load the most recently scraped data file"""
         try:
-            # Look for the most recent CSV file
-            csv_files = [f for f in os.listdir('.') if f.startswith('wuzzuf_jobs_') and f.endswith('.csv')]
-            if csv_files:
-                # Sort by modification time (newest first)
-                csv_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-                latest_file = csv_files[0]
-                self.file_path_var.set(latest_file)
+            latest_file = self.latest_data_file()
+            if latest_file:
+                self.file_path_var.set(str(latest_file))
                 self.load_csv()
                 self.log(f"📁 Auto-loaded latest scraped data: {latest_file}")
         except Exception as e:
             self.log(f"⚠️ Could not auto-load scraped data: {e}")
     
+    def latest_data_file(self):
+        """Data file of the newest scraping session, else the newest wuzzuf_jobs_*.csv saved next to the app"""
+        latest_file = latest_session_file(self.session_catalog.data_dir)
+        if latest_file is not None:
+            return latest_file
+        # save_data falls back to the current directory when it can't create a session folder
+        csv_files = [f for f in os.listdir('.') if f.startswith('wuzzuf_jobs_') and f.endswith('.csv')]
+        if csv_files:
+            return max(csv_files, key=os.path.getmtime)
+        return None
+    
     def save_configuration(self):
         """Save the current configuration"""
         try:
@@ -909,161 +1009,357 @@ class WuzzufScraperGUI:
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
     
     def load_default_csv(self):
-        """Try to load the default Wuzzuf CSV file if it exists"""
-        default_files = [
-            'wuzzuf_jobs_20250826_032819.csv',
-            'wuzzuf_jobs_*.csv'
-        ]
-        
-        for pattern in default_files:
-            if '*' in pattern:
-                import glob
-                files = glob.glob(pattern)
-                if files:
-                    self.file_path_var.set(files[0])
-                    self.load_csv()
-                    break
-            elif os.path.exists(pattern):
-                self.file_path_var.set(pattern)
-                self.load_csv()
-                break
+        """Show the most recently scraped data on startup, if there is any"""
+        latest_file = self.latest_data_file()
+        if latest_file:
+            self.file_path_var.set(str(latest_file))
+            self.load_csv()
     
     def browse_file(self):
-        """Open file dialog to select CSV file"""
+        """Open file dialog to select a CSV or Parquet file"""
         filename = filedialog.askopenfilename(
-            title="Select CSV File",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            title="Select Data File",
+            filetypes=[("Job data", "*.csv *.parquet"), ("CSV files", "*.csv"), ("Parquet files", "*.parquet"), ("All files", "*.*")]
         )
         if filename:
             self.file_path_var.set(filename)
             self.load_csv()
     
     def load_csv(self):
-        """Load CSV file and display data"""
-        try:
-            file_path = self.file_path_var.get()
-            if not file_path:
-                messagebox.showerror("Error", "Please select a CSV file")
-                return
-            
-            self.df = pd.read_csv(file_path)
-            self.filtered_df = self.df.copy()
-            
-            # Update column selector
-            columns = list(self.df.columns)
-            self.column_combo.configure(values=columns)
-            if columns:
-                self.column_combo.set(columns[0])
-            
-            # Display data
-            self.display_data()
-            self.update_statistics()
-            
-
+        """Load the selected data file in the background, showing its first rows right away"""
+        file_path = self.file_path_var.get()
+        if not file_path:
+            messagebox.showerror("Error", "Please select a CSV file")
+            return
+        if self.sessions_source is not None and file_path == self.sessions_source[0]:
+            self.load_sessions()
+            return
+        if not os.path.exists(file_path):
+            messagebox.showerror("Error", f"Failed to load CSV file: {file_path} does not exist")
+            print("❌ Failed to load CSV file")
+            return
+        
+        self.start_load(file_path, Path(file_path).name)
+    
+    def start_load(self, file_path, name, chunks=None):
+        """Read data in the background, replacing any load in progress
+        
+        chunks: optional chunk source for BackgroundLoader instead of the file
+        """
+        self.cancel_load(quiet=True)
+        
+        # Messages carry the loader they came from, a replaced loader's are dropped
+        def post(message_type):
+            return lambda data: self.scraping_queue.put((message_type, (loader, data)))
+        
+        loader = BackgroundLoader(
+            file_path,
+            on_first=post('load_first'),
+            on_progress=post('load_progress'),
+            on_done=post('load_done'),
+            on_error=post('load_error'),
+            chunks=chunks
+        )
+        self.loader = loader
+        self.load_progress_bar.set(0)
+        self.load_progress_label.configure(text=f"Loading {name}...")
+        self.load_progress_frame.pack(fill="x", pady=(0, 12))
+        loader.start()
+        print(f"📥 Loading {name}...")
+    
+    def cancel_load(self, quiet=False):
+        """Stop the file load in progress, keeping whatever is already shown"""
+        if self.loader is None:
+            return
+        self.loader.cancel()
+        self.loader = None
+        self.load_progress_frame.pack_forget()
+        if not quiet:
+            print("⏹️ Loading cancelled")
+    
+    def handle_load_message(self, message_type, loader, data):
+        """Apply a background loader update on the Tk thread"""
+        if loader is not self.loader:
+            return  # Cancelled or replaced by a newer load
+        
+        if message_type == 'load_first':
+            # Rows to look at while the rest of the file is read
+            self.show_dataframe(data)
+        elif message_type == 'load_progress':
+            self.load_progress_bar.set(data)
+            self.load_progress_label.configure(text=f"Loading... {data:.0%}")
+        elif message_type == 'load_done':
+            self.loader = None
+            self.load_progress_frame.pack_forget()
+            if data is not self.df:  # A one-chunk file is already shown
+                self.show_dataframe(data)
+                if self.search_var.get().strip():
+                    self.filter_data()  # Search typed while loading covers the whole file now
             print(f"✅ Successfully loaded {len(self.df)} job records")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load CSV file: {str(e)}")
-
+        elif message_type == 'load_error':
+            self.loader = None
+            self.load_progress_frame.pack_forget()
+            messagebox.showerror("Error", f"Failed to load CSV file: {data}")
             print("❌ Failed to load CSV file")
     
-    def display_data(self):
-        """Display data in the treeview with enhanced scrolling"""
-        if self.filtered_df is None:
+    def open_sessions_dialog(self):
+        """Browse the scraping sessions and open any of them together as one dataset"""
+        if self.sessions_window is not None and self.sessions_window.winfo_exists():
+            self.sessions_window.focus()
             return
         
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        window = ctk.CTkToplevel(self.root)
+        window.title("📚 Scraping Sessions")
+        window.geometry("900x500")
+        window.transient(self.root)
+        self.sessions_window = window
+        
+        self.sessions_status = ctk.CTkLabel(window, text="Scanning sessions...", font=ctk.CTkFont(size=13))
+        self.sessions_status.pack(fill="x", padx=15, pady=(12, 6))
+        
+        tree_frame = ctk.CTkFrame(window)
+        tree_frame.pack(fill="both", expand=True, padx=15, pady=6)
+        columns = ('keyword', 'started', 'rows', 'scraped', 'format')
+        headings = ('Keyword', 'Started', 'Jobs', 'Scraped', 'Format')
+        widths = (200, 150, 70, 300, 70)
+        self.sessions_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", selectmode="extended")
+        for column, heading, width in zip(columns, headings, widths):
+            self.sessions_tree.heading(column, text=heading)
+            self.sessions_tree.column(column, width=width, minwidth=60)
+        self.sessions_tree.pack(side="left", fill="both", expand=True)
+        sessions_scrollbar = ctk.CTkScrollbar(tree_frame, orientation="vertical", command=self.sessions_tree.yview)
+        sessions_scrollbar.pack(side="right", fill="y")
+        self.sessions_tree.configure(yscrollcommand=sessions_scrollbar.set)
+        self.sessions_tree.bind("<Double-1>", lambda event: self.open_selected_sessions())
+        
+        button_frame = ctk.CTkFrame(window, fg_color="transparent")
+        button_frame.pack(fill="x", padx=15, pady=(6, 12))
+        self.sessions_open_buttons = []  # Enabled once a scan has listed the sessions
+        for text, command in (
+            ("📥 Open Selected", self.open_selected_sessions),
+            ("📚 Open All", lambda: self.open_sessions(None)),
+            ("🔄 Refresh", self.scan_sessions),
+        ):
+            button = ctk.CTkButton(
+                button_frame,
+                text=text,
+                command=command,
+                font=ctk.CTkFont(size=14, weight="bold"),
+                height=36,
+                width=140
+            )
+            button.pack(side="left", padx=(0, 10))
+            if command != self.scan_sessions:
+                self.sessions_open_buttons.append(button)
         
-        # Configure columns
-        columns = list(self.filtered_df.columns)
-        self.tree['columns'] = columns
-        self.tree['show'] = 'headings'
+        self.scan_sessions()
+    
+    def scan_sessions(self):
+        """Index the session folders in the background, files that did not change are not read again"""
+        self.sessions_status.configure(text="Scanning sessions...")
+        for button in self.sessions_open_buttons:
+            button.configure(state="disabled")
         
-        # Set column headings with better formatting
-        for col in columns:
-            # Clean column name for display
-            display_name = col.replace('_', ' ').title()
-            self.tree.heading(col, text=display_name)
-            
-            # Calculate optimal column width based on content
-            col_width = len(display_name) * 12  # Base width for header
-            
-            # Check data content width
-            if len(self.filtered_df) > 0:
-                data_width = self.filtered_df[col].astype(str).str.len().max() * 10
-                col_width = max(col_width, data_width)
-            
-            # Set reasonable bounds for column width
-            col_width = max(100, min(col_width, 400))
-            self.tree.column(col, width=col_width, minwidth=80)
-        
-        # Insert data rows with alternating row colors
-        for idx, row in self.filtered_df.head(2000).iterrows():  # Increased limit for better data viewing
-            values = []
-            for val in row:
-                if pd.isna(val):
-                    values.append('')
-                elif isinstance(val, list):
-                    # Handle list values (like skills) - show first few items
-                    if val:
-                        display_val = ', '.join(str(item) for item in val[:3])
-                        if len(val) > 3:
-                            display_val += f' (+{len(val)-3} more)'
-                        values.append(display_val)
-                    else:
-                        values.append('')
-                else:
-                    # Truncate long text values
-                    str_val = str(val)
-                    if len(str_val) > 100:
-                        str_val = str_val[:97] + '...'
-                    values.append(str_val)
-            
-            # Insert row with alternating colors
-            tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            self.tree.insert('', 'end', values=values, tags=(tag,))
+        def scan():
+            try:
+                self.scraping_queue.put(('sessions', self.session_catalog.scan()))
+            except Exception as e:
+                self.scraping_queue.put(('sessions', e))
+        
+        threading.Thread(target=scan, daemon=True).start()
+    
+    def show_sessions(self, sessions):
+        """Fill the session browser with the scanned sessions"""
+        if self.sessions_window is None or not self.sessions_window.winfo_exists():
+            return
+        if isinstance(sessions, Exception):
+            self.sessions_status.configure(text=f"❌ Could not scan sessions: {sessions}")
+            return
+        
+        self.scanned_sessions = sessions
+        for button in self.sessions_open_buttons:
+            button.configure(state="normal")
+        self.sessions_tree.delete(*self.sessions_tree.get_children())
+        for session in sessions:
+            if session['first_scraped']:
+                scraped = f"{session['first_scraped']} → {session['last_scraped']}"
+            else:
+                scraped = "-"
+            self.sessions_tree.insert('', 'end', iid=session['name'], values=(
+                session['keyword'], session['started'], session['rows'], scraped, session['format'] or "no data"
+            ))
+        total_rows = sum(session['rows'] for session in sessions)
+        self.sessions_status.configure(
+            text=f"{len(sessions)} sessions, {total_rows} jobs in {self.session_catalog.data_dir} "
+                 f"(select several to open them together, duplicates removed)"
+        )
+    
+    def open_selected_sessions(self):
+        names = list(self.sessions_tree.selection())
+        if not names:
+            messagebox.showwarning("Warning", "Select one or more sessions to open", parent=self.sessions_window)
+            return
+        self.open_sessions(names)
+    
+    def open_sessions(self, names):
+        """Load the scanned sessions (all if names is None) as one deduplicated dataset, newest copy of each job kept"""
+        sessions = [
+            session for session in self.scanned_sessions
+            if session['file'] and (names is None or session['name'] in names)
+        ]
+        if not sessions:
+            messagebox.showwarning("Warning", "The selected sessions have no data files", parent=self.sessions_window)
+            return
+        keywords = sorted({session['keyword'] for session in sessions})
+        name = f"{len(sessions)} sessions ({', '.join(keywords)})" if len(sessions) > 1 else sessions[0]['name']
+        
+        # The label is only shown in the file box, Load opens the sessions again instead of a file
+        self.sessions_source = (name, [session['name'] for session in sessions])
+        self.file_path_var.set(name)
+        self.load_sessions()
+        if self.sessions_window is not None:
+            self.sessions_window.destroy()
+            self.sessions_window = None
+    
+    def load_sessions(self):
+        """Read the opened sessions in the background, through the session catalog"""
+        name, names = self.sessions_source
+        self.start_load(
+            None,
+            name,
+            chunks=lambda cancel: self.session_catalog.iter_union(names, cancel)
+        )
+    
+    def load_job_store(self):
+        """Load every job from the SQLite job store, newest first, in the background
+        
+        The jobs come back as a 'job_store' message; the search index is brought
+        up to date afterwards and arrives as a 'job_index' message, searches
+        scan the loaded table until then.
+        """
+        store_path = configured_store_path()
+        if not os.path.exists(store_path):
+            messagebox.showwarning("Warning", f"No job store found at {store_path}\n\nRun a search first.")
+            return
+        self.cancel_load(quiet=True)
+        self.file_path_var.set(store_path)
+        
+        def load():
+            try:
+                with JobStore(store_path) as store:
+                    df = pd.DataFrame(store.query())
+                self.scraping_queue.put(('job_store', df))
+                
+                # Search the store through its full-text index instead of scanning the table
+                job_index = JobIndex(store_path)
+                try:
+                    indexed = job_index.refresh()
+                except Exception:
+                    job_index.close()
+                    raise
+                self.scraping_queue.put(('job_index', (df, job_index, indexed)))
+            except Exception as e:
+                self.scraping_queue.put(('job_store', e))
+        
+        threading.Thread(target=load, daemon=True).start()
+    
+    def show_job_store(self, df):
+        """Show the jobs read by load_job_store"""
+        if isinstance(df, Exception):
+            messagebox.showerror("Error", f"Failed to load job store: {str(df)}")
+            return
+        if self.loader is not None:
+            return  # A data file was opened meanwhile
+        self.show_dataframe(df)
+        print(f"✅ Loaded {len(df)} jobs from the job store, indexing for search...")
+    
+    def attach_job_index(self, df, job_index, indexed):
+        """Search through the job store's index, unless other data was loaded meanwhile"""
+        if self.df is not df:
+            job_index.close()
+            return
+        self.close_job_index()
+        self.job_index = job_index
+        print("✅ Job store search index ready"
+              + (f" ({indexed} newly indexed)" if indexed else ""))
+        if self.search_var.get().strip():
+            self.filter_data()  # Rank the search typed meanwhile through the index
+    
+    def close_job_index(self):
+        """Stop searching through the job store's index"""
+        if self.job_index is not None:
+            self.job_index.close()
+            self.job_index = None
+    
+    def search_job_index(self, term, column):
+        """Look the search term up in the job store's index, ranked by relevance
+        
+        The selected column scopes the query (like "skills:python") unless the
+        term already names fields; filter_data only uses the index for the
+        columns it covers (FIELD_ALIASES). At most JOB_SEARCH_LIMIT jobs are returned,
+        the DataFrame's 'truncated' attr tells whether more matched.
+        """
+        if not term.strip():
+            return self.df
+        if column in FIELD_ALIASES and ':' not in term:
+            term = f'{column}:"{term}"' if ' ' in term.strip() else f"{column}:{term}"
+        # One more than shown, to tell a full page of results from a cut-off one
+        jobs = self.job_index.search(term, limit=JOB_SEARCH_LIMIT + 1, prefix_last=True)
+        filtered_df = pd.DataFrame(jobs[:JOB_SEARCH_LIMIT], columns=self.df.columns)
+        filtered_df.attrs['truncated'] = len(jobs) > JOB_SEARCH_LIMIT
+        return filtered_df
+    
+    def show_dataframe(self, df):
+        """Show a newly loaded DataFrame in the table, filters and statistics"""
+        self.close_job_index()  # load_job_store opens it again for the store
+        self.df = df
+        self.filtered_df = self.df  # Same data until a filter narrows it
+        self.filter_engine.set_frame(self.df)
+        self.filter_generation = None  # Results for the previous data no longer apply
+        
+        # Update column selector
+        columns = list(self.df.columns)
+        self.column_combo.configure(values=columns)
+        if columns:
+            self.column_combo.set(columns[0])
+        
+        # Display data
+        self.display_data()
+        self.update_statistics()
+    
+    def display_data(self):
+        """Display data in the virtualized table, only the visible rows are rendered"""
+        if self.filtered_df is None:
+            return
+        
+        self.table.set_frame(self.filtered_df)
         
         # Configure alternating row colors
         self.tree.tag_configure('evenrow', background=self.colors['bg_secondary'])
         self.tree.tag_configure('oddrow', background=self.colors['bg_primary'])
         
-        # Update scrollbar ranges
-        self.tree.yview_moveto(0)  # Reset to top
-        self.tree.xview_moveto(0)  # Reset to left
-        
-        # Show data summary
-        total_rows = len(self.filtered_df)
-        displayed_rows = min(total_rows, 2000)
-        if total_rows > displayed_rows:
-            print(f"📊 Displaying {displayed_rows} of {total_rows} rows (use scrollbars to view more)")
-        else:
-            print(f"📊 Displaying all {total_rows} rows")
+        print(f"📊 Displaying {len(self.filtered_df)} rows")
     
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling for the treeview"""
         try:
             if event.num == 4:  # Linux scroll up
-                self.tree.yview_scroll(-1, "units")
+                self.table.scroll(-3)
             elif event.num == 5:  # Linux scroll down
-                self.tree.yview_scroll(1, "units")
+                self.table.scroll(3)
             else:  # Windows/Mac scroll
-                self.tree.yview_scroll(int(-1 * (event.delta / 120)), "units")
+                self.table.scroll(int(-3 * (event.delta / 120)))
         except:
-            # Fallback for different platforms
-            try:
-                self.tree.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            except:
-                pass
+            pass
+        return "break"  # The table scrolls itself, not the Treeview
     
     def select_all_rows(self, event=None):
-        """Select all rows in the treeview"""
+        """Select every row of the table, including the ones scrolled out of view"""
         try:
-            for item in self.tree.get_children():
-                self.tree.selection_add(item)
+            self.table.select_all()
         except:
             pass
+        return "break"
     
     def show_table_tooltip(self, event=None):
         """Show tooltip for table navigation"""
@@ -1095,35 +1391,41 @@ class WuzzufScraperGUI:
         """Hide table tooltip"""
         pass  # Tooltip auto-hides
     
+    def schedule_filter(self, event=None):
+        """Filter once typing pauses, cancelling the previously scheduled filter"""
+        if self.filter_after_id is not None:
+            self.root.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.root.after(FILTER_DEBOUNCE_MS, self.filter_data)
+    
     def filter_data(self, event=None):
-        """Filter data based on search term"""
+        """Filter data based on search term, in a background thread
+        
+        The result comes back through the scraping queue as a 'filtered'
+        message; results of queries that were superseded are dropped.
+        """
+        self.filter_after_id = None
         if self.df is None:
             return
         
-        search_term = self.search_var.get().lower()
         column = self.column_var.get()
-        
-        if not search_term:
-            self.filtered_df = self.df.copy()
-        else:
-            if column and column in self.df.columns:
-                # Filter by specific column
-                mask = self.df[column].astype(str).str.lower().str.contains(search_term, na=False)
-                self.filtered_df = self.df[mask]
-            else:
-                # Search across all columns
-                mask = self.df.astype(str).apply(lambda x: x.str.lower().str.contains(search_term, na=False)).any(axis=1)
-                self.filtered_df = self.df[mask]
-        
-        self.display_data()
-        self.update_statistics()
-        
+        # The index only covers some columns, the others are scanned like any loaded file
+        use_index = self.job_index is not None and column in FIELD_ALIASES
+        self.filter_generation = self.filter_engine.submit(
+            self.search_var.get(),
+            column,
+            lambda generation, filtered_df: self.scraping_queue.put(('filtered', (generation, filtered_df))),
+            search=self.search_job_index if use_index else None
+        )
     
     def clear_filters(self):
         """Clear all filters and show original data"""
+        if self.filter_after_id is not None:
+            self.root.after_cancel(self.filter_after_id)
+            self.filter_after_id = None
+        self.filter_generation = None  # Ignore filters still running
         self.search_var.set('')
         if self.df is not None:
-            self.filtered_df = self.df.copy()
+            self.filtered_df = self.df
             self.display_data()
             self.update_statistics()
 
@@ -1134,7 +1436,10 @@ class WuzzufScraperGUI:
             self.stats_text.delete("1.0", "end")
             return
         
-        stats_text = f"📊 Total Rows: {len(self.filtered_df)}\n"
+        stats_text = f"📊 Total Rows: {len(self.filtered_df)}"
+        if self.filtered_df.attrs.get('truncated'):
+            stats_text += f" (first {JOB_SEARCH_LIMIT} matches only, refine the search to see the rest)"
+        stats_text += "\n"
         stats_text += f"📋 Columns: {len(self.filtered_df.columns)}\n"
         
         # Show some sample data types
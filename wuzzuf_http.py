@@ -0,0 +1,160 @@
+"""
+Browserless HTTP Fetching for Wuzzuf
+Pooled keep-alive session for fetching search pages without Chrome, plus a local
+stand-in server that replays recorded pages for offline runs
+"""
+
+import re
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+# A server-rendered results page has plenty of visible text even with no jobs,
+# an empty client-side shell has next to none
+MIN_RENDERED_TEXT_LENGTH = 200
+
+
+class WuzzufHttpClient:
+    """Fetch pages over a pooled keep-alive requests session"""
+
+    def __init__(self, pool_size=4, timeout=15, retries=2, user_agent=DEFAULT_USER_AGENT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",)
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url):
+        """Fetch a page and return its HTML"""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+            response.encoding = 'utf-8'
+        return response.text
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class HostThrottle:
+    """Limit how many requests run against the same host at once"""
+
+    def __init__(self, max_per_host=2):
+        self.max_per_host = max_per_host
+        self.semaphores = {}
+        self.lock = threading.Lock()
+
+    def for_url(self, url):
+        """Return the semaphore guarding the URL's host"""
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.semaphores:
+                self.semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self.semaphores[host]
+
+
+def needs_browser(html):
+    """Check if a page with no job cards is an unrendered client-side shell"""
+    body = re.sub(r"<(script|style|noscript)\b.*?</\1>", " ", html, flags=re.S | re.I)
+    visible_text = re.sub(r"<[^>]+>", " ", body)
+    return len(" ".join(visible_text.split())) < MIN_RENDERED_TEXT_LENGTH
+
+
+class RecordedPageServer:
+    """Serve recorded search pages on localhost as a stand-in for wuzzuf.net
+
+    Page N of any search is read from search_page_N.html in the given directory,
+    so SimpleWuzzufScraper(base_url=server.url) runs fully offline.
+    """
+
+    def __init__(self, directory, host="127.0.0.1", port=0):
+        self.directory = Path(directory)
+        handler = self._make_handler(self.directory)
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def _make_handler(directory):
+        class RecordedPageHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                page_file = None
+
+                if parsed.path == "/search/jobs":
+                    page = int(query.get('start', ['0'])[0]) + 1
+                    page_file = directory / f"search_page_{page}.html"
+                else:
+                    candidate = (directory / parsed.path.lstrip('/')).resolve()
+                    try:
+                        candidate.relative_to(directory.resolve())
+                        page_file = candidate
+                    except ValueError:
+                        pass  # Outside the recorded pages directory
+
+                if page_file is None or not page_file.is_file():
+                    self.send_error(404)
+                    return
+
+                body = page_file.read_bytes()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep scraper output clean
+
+        return RecordedPageHandler
+
+    def start(self):
+        """Start serving in a background thread"""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Wuzzuf Job Search Index
+SQLite FTS5 full-text index over the title, company, location and skills of
+every job in the job store, with Arabic/English normalization, prefix queries,
+field-scoped queries like "skill:python location:cairo" and BM25 ranking
+"""
+
+import argparse
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+
+from wuzzuf_store import SELECT_JOBS, attach_skills, create_schema, configured_store_path
+from wuzzuf_selectors import DEFAULT_TEXT
+
+# The index lives in the job store file. Triggers on the store's tables mark
+# changed jobs, refresh() re-indexes only those.
+INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS job_search USING fts5(
+    title, company, location, skills,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS job_search_dirty (
+    job_id INTEGER PRIMARY KEY
+);
+
+CREATE TRIGGER IF NOT EXISTS job_search_job_insert AFTER INSERT ON jobs BEGIN
+    INSERT OR IGNORE INTO job_search_dirty (job_id) VALUES (new.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS job_search_job_update AFTER UPDATE ON jobs BEGIN
+    INSERT OR IGNORE INTO job_search_dirty (job_id) VALUES (new.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS job_search_job_delete AFTER DELETE ON jobs BEGIN
+    INSERT OR IGNORE INTO job_search_dirty (job_id) VALUES (old.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS job_search_skill_insert AFTER INSERT ON job_skills BEGIN
+    INSERT OR IGNORE INTO job_search_dirty (job_id) VALUES (new.job_id);
+END;
+"""
+
+SELECT_INDEX_ROWS = """
+SELECT j.id, j.title, c.name AS company, j.location,
+       (SELECT group_concat(s.name, ' ') FROM job_skills js JOIN skills s ON s.id = js.skill_id
+        WHERE js.job_id = j.id) AS skills
+FROM jobs j LEFT JOIN companies c ON c.id = j.company_id
+WHERE j.id IN ({placeholders})
+"""
+
+# Query prefixes -> indexed column
+FIELD_ALIASES = {
+    'title': 'title',
+    'company': 'company',
+    'location': 'location', 'loc': 'location', 'city': 'location',
+    'skill': 'skills', 'skills': 'skills',
+}
+INDEXED_FIELDS = ('title', 'company', 'location', 'skills')
+# bm25 weights in INDEXED_FIELDS order, a title match counts most
+FIELD_WEIGHTS = (10.0, 4.0, 2.0, 5.0)
+
+ARABIC_DIACRITICS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")  # Tashkeel and tatweel
+ARABIC_LETTERS = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ئ': 'ي',
+    'ؤ': 'و',
+    'ة': 'ه',
+})
+QUERY_PART_PATTERN = re.compile(r'(?:(\w+):)?(?:"([^"]*)"|(\S+))')
+TOKEN_PATTERN = re.compile(r"\w+")
+
+INDEX_BATCH_SIZE = 500
+
+
+def normalize_text(text):
+    """Lowercase text with Arabic letter variants unified and diacritics removed
+
+    Applied to both indexed text and queries, so "مُهَندس" matches "مهندس" and
+    "إدارة" matches "ادارة".
+    """
+    if not text or text == DEFAULT_TEXT:
+        return ""
+    text = unicodedata.normalize('NFKC', str(text))
+    text = ARABIC_DIACRITICS.sub('', text).translate(ARABIC_LETTERS)
+    return text.lower()
+
+
+def build_match_query(query, prefix_last=False):
+    """Turn a search box query into an FTS5 MATCH expression, or None if it has no terms
+
+    Words must all match (AND). "field:word" and field:"some words" scope a
+    word or phrase to title, company, location or skill(s); "word*" matches
+    any word starting with it, and prefix_last does that for the last word
+    (search as you type). Unknown field prefixes are searched as plain words.
+    """
+    clauses = []
+    for field, phrase, word in QUERY_PART_PATTERN.findall(query):
+        text = phrase if phrase else word
+        column = FIELD_ALIASES.get(field.lower()) if field else None
+        if field and column is None:
+            text = f"{field} {text}"
+        prefix = text.endswith('*')
+        tokens = TOKEN_PATTERN.findall(normalize_text(text))
+        if not tokens:
+            continue
+        # Words split by punctuation ("node.js") or quoted stay a phrase
+        match = '"' + " ".join(tokens) + '"'
+        if prefix:
+            match += "*"
+        clauses.append((column, match))
+
+    if not clauses:
+        return None
+    if prefix_last and not clauses[-1][1].endswith('*'):
+        column, match = clauses[-1]
+        clauses[-1] = (column, match + "*")
+    return " AND ".join(f"{column} : {match}" if column else match for column, match in clauses)
+
+
+class JobIndex:
+    """Full-text search over the job store
+
+    Opening the index adds it (and its change-tracking triggers) to the store
+    file if needed; refresh() then indexes whatever the store changed since the
+    last refresh, so it stays cheap after every save.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(configured_store_path() if path is None else path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.lock, self.conn:
+            create_schema(self.conn)  # Triggers need the store's tables
+            created = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'job_search'"
+            ).fetchone() is None
+            self.conn.executescript(INDEX_SCHEMA)
+            if created:
+                # Index every job already in the store
+                self.conn.execute("INSERT OR IGNORE INTO job_search_dirty (job_id) SELECT id FROM jobs")
+
+    def refresh(self):
+        """Re-index jobs added or changed since the last refresh, returns how many"""
+        with self.lock, self.conn:
+            job_ids = [row[0] for row in self.conn.execute("SELECT job_id FROM job_search_dirty")]
+            for start in range(0, len(job_ids), INDEX_BATCH_SIZE):
+                self._index(job_ids[start:start + INDEX_BATCH_SIZE])
+            self.conn.execute("DELETE FROM job_search_dirty")
+        return len(job_ids)
+
+    def rebuild(self):
+        """Index every job in the store from scratch"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM job_search")
+            self.conn.execute("INSERT OR IGNORE INTO job_search_dirty (job_id) SELECT id FROM jobs")
+        return self.refresh()
+
+    def _index(self, job_ids):
+        placeholders = ",".join("?" * len(job_ids))
+        self.conn.execute(f"DELETE FROM job_search WHERE rowid IN ({placeholders})", job_ids)
+        rows = self.conn.execute(SELECT_INDEX_ROWS.format(placeholders=placeholders), job_ids).fetchall()
+        self.conn.executemany(
+            "INSERT INTO job_search (rowid, title, company, location, skills) VALUES (?, ?, ?, ?, ?)",
+            [
+                (row['id'], *(normalize_text(row[field]) for field in INDEXED_FIELDS))
+                for row in rows
+            ]
+        )
+
+    def search(self, query, limit=100, prefix_last=False):
+        """Jobs matching the query as dicts (like JobStore.query), best match first"""
+        match = build_match_query(query, prefix_last)
+        if match is None:
+            return []
+        weights = ", ".join(str(weight) for weight in FIELD_WEIGHTS)
+        sql = (
+            f"WITH hits AS (SELECT rowid, bm25(job_search, {weights}) AS score FROM job_search "
+            f"WHERE job_search MATCH ? ORDER BY score LIMIT ?) "
+            f"{SELECT_JOBS.replace('FROM jobs j', 'FROM hits h JOIN jobs j ON j.id = h.rowid', 1)} "
+            f"ORDER BY h.score, j.scraped_at DESC"
+        )
+        with self.lock:
+            try:
+                rows = self.conn.execute(sql, (match, int(limit))).fetchall()
+            except sqlite3.OperationalError as e:
+                print(f"⚠️ Invalid search query {query!r}: {e}")
+                return []
+            return attach_skills(self.conn, rows)
+
+    def count(self):
+        """Number of indexed jobs"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM job_search").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def update_search_index(path=None):
+    """Index the jobs a save added to the store, printing what happened; never raises"""
+    try:
+        with JobIndex(path) as index:
+            indexed = index.refresh()
+        if indexed:
+            print(f"🔎 Search index updated: {indexed} jobs")
+        return indexed
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not update the search index: {e}")
+        return 0
+
+
+def configured_search_index():
+    """SEARCH_INDEX from simple_config"""
+    try:
+        from simple_config import SEARCH_INDEX
+        return SEARCH_INDEX
+    except ImportError:
+        return False
+
+
+def main():
+    """Search the job store from the command line"""
+    parser = argparse.ArgumentParser(description="Full-text search over the Wuzzuf job store")
+    parser.add_argument("query", nargs="*", help='Search words, e.g. backend "skill:python" location:cairo dev*')
+    parser.add_argument("--db", default=configured_store_path(), help="Path to the SQLite job store")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum jobs to show")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index every job before searching")
+    args = parser.parse_args()
+
+    with JobIndex(args.db) as index:
+        indexed = index.rebuild() if args.rebuild else index.refresh()
+        if indexed:
+            print(f"🔎 Indexed {indexed} jobs")
+        if not args.query:
+            print(f"🔎 {index.count()} jobs in the search index")
+            return
+        jobs = index.search(" ".join(args.query), args.limit)
+        print(f"🔎 {len(jobs)} matching jobs")
+        for job in jobs:
+            skills = ", ".join(job['skills'][:5])
+            print(f"📋 {job['title']} | {job['company']} | {job['location']} | {skills}")
+
+
+if __name__ == "__main__":
+    main()
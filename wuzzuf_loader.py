@@ -0,0 +1,159 @@
+"""
+Chunked Data File Loading for the Wuzzuf GUI
+Reads CSV, JSON Lines and Parquet job files a chunk at a time with explicit
+dtypes, reporting progress and stopping early when cancelled
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# pyarrow is optional, only Parquet files need it
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+DEFAULT_CHUNK_ROWS = 50_000
+
+# Every scraped field is text; reading them as str skips type inference per
+# chunk and keeps chunks consistent (a column of numbers-looking IDs stays text)
+JOB_TEXT_COLUMNS = (
+    'title', 'company', 'location', 'job_type', 'experience_level', 'skills',
+    'posting_date', 'application_link', 'job_url', 'scraped_at', 'first_seen',
+    'description', 'requirements', 'salary', 'vacancies',
+)
+
+
+def enable_copy_on_write():
+    """Let filtered views share memory with the loaded DataFrame until one is modified
+
+    Always on from pandas 3, opt-in before that.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return
+    try:
+        pd.set_option("mode.copy_on_write", True)
+    except (KeyError, AttributeError):
+        pass  # pandas too old for Copy-on-Write, filters just copy
+
+
+def csv_dtypes(path):
+    """Explicit dtypes for the job columns present in a CSV file's header"""
+    header = pd.read_csv(path, nrows=0).columns
+    return {column: str for column in header if column in JOB_TEXT_COLUMNS}
+
+
+def skills_as_lists(df):
+    """Keep Parquet skills as real lists (Arrow hands back arrays)"""
+    if 'skills' in df.columns:
+        df['skills'] = df['skills'].map(lambda skills: list(skills) if skills is not None else [])
+    return df
+
+
+def iter_data_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS, cancel=None):
+    """Yield (chunk DataFrame, fraction of the file read) for a CSV, JSON Lines, JSON or Parquet file
+
+    Stops without error as soon as the cancel event is set. JSON files hold one
+    array, so they come back as a single chunk.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == '.json':
+        yield pd.read_json(path, dtype=False), 1.0
+        return
+
+    if suffix == '.parquet':
+        if pq is None:
+            # Without pyarrow let pandas pick whatever engine it has, in one go
+            yield skills_as_lists(pd.read_parquet(path)), 1.0
+            return
+        parquet_file = pq.ParquetFile(str(path))
+        total_rows = parquet_file.metadata.num_rows or 1
+        rows_read = 0
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+            if cancel is not None and cancel.is_set():
+                return
+            rows_read += batch.num_rows
+            yield skills_as_lists(batch.to_pandas()), rows_read / total_rows
+        return
+
+    total_bytes = os.path.getsize(path) or 1
+    with open(path, 'rb') as f:
+        if suffix == '.jsonl':
+            reader = pd.read_json(f, lines=True, chunksize=chunk_rows, dtype=False)
+        else:
+            reader = pd.read_csv(f, chunksize=chunk_rows, dtype=csv_dtypes(path))
+        with reader:
+            for chunk in reader:
+                if cancel is not None and cancel.is_set():
+                    return
+                # The reader reads ahead, so this runs a little early until the last chunk
+                yield chunk, min(1.0, f.tell() / total_bytes)
+
+
+def load_data_file(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Read a whole job file into one DataFrame"""
+    chunks = [chunk for chunk, _ in iter_data_chunks(path, chunk_rows)]
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+
+class BackgroundLoader:
+    """Load a job file in a background thread, reporting to callbacks
+
+    on_first(df) gets the first chunk so the table can show rows right away,
+    on_progress(fraction) follows every chunk and on_done(df) gets the whole
+    file; on_error(message) replaces on_done if reading fails. Callbacks run in
+    the loader thread, GUI callers should pass them on to the Tk thread.
+    Nothing is reported after cancel().
+    chunks: optional function (cancel event) -> iterator of (chunk, fraction)
+    read instead of the file at path, e.g. SessionCatalog.iter_union.
+    """
+
+    def __init__(self, path, on_first, on_progress, on_done, on_error, chunk_rows=DEFAULT_CHUNK_ROWS, chunks=None):
+        self.path = path
+        self.chunks = chunks
+        self.on_first = on_first
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.chunk_rows = chunk_rows
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        chunks = []
+        try:
+            if self.chunks is not None:
+                source = self.chunks(self.cancelled)
+            else:
+                source = iter_data_chunks(self.path, self.chunk_rows, self.cancelled)
+            for chunk, fraction in source:
+                chunks.append(chunk)
+                if len(chunks) == 1:
+                    self.on_first(chunk)
+                self.on_progress(fraction)
+            if self.cancelled.is_set():
+                return
+            if not chunks:
+                df = pd.DataFrame()
+            else:
+                df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+            chunks = None  # Let the chunks go before the GUI builds its caches
+            if not self.cancelled.is_set():
+                self.on_done(df)
+        except Exception as e:
+            if not self.cancelled.is_set():
+                self.on_error(str(e))
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Offline Wuzzuf HTML Parser
+Extracts job listings from saved or live search page HTML without a browser
+"""
+
+import argparse
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from wuzzuf_selectors import (
+    JOB_CARD_SELECTOR, JOB_CARD_FALLBACK_SELECTOR,
+    TITLE_SELECTORS, COMPANY_SELECTORS, LOCATION_SELECTORS, JOB_TYPE_SELECTORS,
+    POSTING_DATE_SELECTORS, APPLICATION_LINK_SELECTORS, JOB_URL_SELECTORS,
+    EXPERIENCE_SPAN_SELECTOR, EXPERIENCE_ANCHOR_SELECTOR, EXPERIENCE_KEYWORDS,
+    PRIMARY_SKILL_SELECTOR, SECONDARY_SKILL_SELECTOR, SKILL_MAX_LENGTH,
+    SKILL_EXCLUDES, SKILL_CATEGORY_EXCLUDES, DEFAULT_TEXT, DEFAULT_LINK,
+)
+
+# Use lxml when it is installed, it is several times faster than the builtin parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+DEFAULT_BASE_URL = "https://wuzzuf.net"
+
+# Wuzzuf job URLs look like /jobs/p/<job id>-<title>-<company>-<city>
+JOB_ID_PATTERN = re.compile(r"/jobs/p/([a-z0-9]+)-")
+
+# Identify a posting that has no job URL (the posting date keeps apart
+# different openings sharing a title at the same company and location)
+JOB_KEY_FALLBACK_FIELDS = ('title', 'company', 'location', 'posting_date')
+
+
+def element_text(element):
+    """Return the visible text of an element with whitespace collapsed like Selenium's .text"""
+    if element is None:
+        return ""
+    return " ".join(element.get_text().split())
+
+
+def safe_extract(card, selectors, base_url=DEFAULT_BASE_URL, extract_href=False):
+    """Return the first non-empty text or href matched by the selectors, in order"""
+    for selector in selectors:
+        try:
+            found = card.select_one(selector)
+        except Exception:
+            continue
+        if found is None:
+            continue
+        if extract_href:
+            href = found.get('href')
+            if href and href.strip():
+                return urljoin(base_url, href.strip())
+        else:
+            text = element_text(found)
+            if text:
+                return text
+    return DEFAULT_LINK if extract_href else DEFAULT_TEXT
+
+
+def canonical_link(link):
+    """Normalize a job link for matching postings (no query/fragment, lowercase, no trailing slash)
+
+    Returns "" when the job has no link.
+    """
+    if not isinstance(link, str) or not link or link == DEFAULT_LINK:
+        return ""
+    return link.split('?')[0].split('#')[0].rstrip('/').lower()
+
+
+def job_url_key(link):
+    """Key of a job page URL: "id:<Wuzzuf job ID>", or the canonical URL when it has no ID
+
+    Returns "" when there is no link.
+    """
+    link = canonical_link(link)
+    match = JOB_ID_PATTERN.search(link)
+    return f"id:{match.group(1)}" if match else link
+
+
+def job_key(job):
+    """Key identifying the same posting across pages, searches, sessions and the job store
+
+    The job URL's key, else the application link's job ID (jobs saved before
+    job_url was extracted), else the JOB_KEY_FALLBACK_FIELDS joined by "|".
+    The application link itself is no key: for most cards it is a category
+    page like /a/Entry-Level-Jobs-in-Egypt shared by many postings.
+    """
+    key = job_url_key(job.get('job_url'))
+    if key:
+        return key
+    match = JOB_ID_PATTERN.search(canonical_link(job.get('application_link')))
+    if match:
+        return f"id:{match.group(1)}"
+    return "|".join(
+        job.get(field).lower() if isinstance(job.get(field), str) else ""
+        for field in JOB_KEY_FALLBACK_FIELDS
+    )
+
+
+def extract_experience(card):
+    """Extract the experience level using the same strategies as the Selenium path"""
+    for span in card.select(EXPERIENCE_SPAN_SELECTOR):
+        text = element_text(span)
+        if text and any(keyword in text.lower() for keyword in EXPERIENCE_KEYWORDS):
+            return text
+
+    anchors = card.select(EXPERIENCE_ANCHOR_SELECTOR)
+    if len(anchors) >= 2:
+        text = element_text(anchors[1])
+        if text:
+            return text
+    return DEFAULT_TEXT
+
+
+def extract_skills(card):
+    """Extract all skills from the primary and secondary skill links"""
+    all_skills = []
+
+    for elem in card.select(PRIMARY_SKILL_SELECTOR):
+        skill_text = element_text(elem)
+        if skill_text and skill_text not in all_skills:
+            if len(skill_text) < SKILL_MAX_LENGTH and not any(exclude in skill_text.lower() for exclude in SKILL_EXCLUDES):
+                all_skills.append(skill_text)
+
+    for elem in card.select(SECONDARY_SKILL_SELECTOR):
+        skill_text = element_text(elem)
+        if skill_text and skill_text not in all_skills:
+            if (len(skill_text) < SKILL_MAX_LENGTH and
+                not any(exclude in skill_text.lower() for exclude in SKILL_EXCLUDES) and
+                not any(category in skill_text.lower() for category in SKILL_CATEGORY_EXCLUDES)):
+                all_skills.append(skill_text)
+
+    return all_skills
+
+
+def extract_job(card, base_url=DEFAULT_BASE_URL, scraped_at=None):
+    """Extract a job dict from a parsed job card, same fields as SimpleWuzzufScraper.extract_single_job"""
+    return {
+        'title': safe_extract(card, TITLE_SELECTORS),
+        'company': safe_extract(card, COMPANY_SELECTORS),
+        'location': safe_extract(card, LOCATION_SELECTORS),
+        'job_type': safe_extract(card, JOB_TYPE_SELECTORS),
+        'experience_level': extract_experience(card),
+        'skills': extract_skills(card),
+        'posting_date': safe_extract(card, POSTING_DATE_SELECTORS),
+        'application_link': safe_extract(card, APPLICATION_LINK_SELECTORS, base_url, extract_href=True),
+        'job_url': safe_extract(card, JOB_URL_SELECTORS, base_url, extract_href=True),
+        'scraped_at': scraped_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def card_job_url(card, base_url=DEFAULT_BASE_URL):
+    """Read only the job URL of a card, to decide whether to extract it"""
+    return safe_extract(card, JOB_URL_SELECTORS, base_url, extract_href=True)
+
+
+def find_job_cards(soup):
+    """Return the job cards on a parsed page, falling back to the alternative selectors"""
+    job_cards = soup.select(JOB_CARD_SELECTOR)
+    if not job_cards:
+        job_cards = soup.select(JOB_CARD_FALLBACK_SELECTOR)
+    return job_cards
+
+
+def parse_jobs_html(html, base_url=DEFAULT_BASE_URL, scraped_at=None, card_filter=None):
+    """Parse every job card in a search results page
+
+    card_filter: optional function taking the list of cards and returning the
+    ones to extract, e.g. to skip cards whose card_job_url() is already known
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    scraped_at = scraped_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    cards = find_job_cards(soup)
+    if card_filter is not None:
+        cards = card_filter(cards)
+
+    jobs = []
+    for card in cards:
+        try:
+            jobs.append(extract_job(card, base_url, scraped_at))
+        except Exception as e:
+            print(f"⚠️ Error extracting job: {e}")
+    return jobs
+
+
+def parse_jobs_file(path, base_url=DEFAULT_BASE_URL, scraped_at=None):
+    """Parse a saved search results page"""
+    html = Path(path).read_text(encoding='utf-8')
+    if scraped_at is None:
+        # Archived pages keep the time they were saved, not the time they were re-parsed
+        scraped_at = datetime.fromtimestamp(Path(path).stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+    return parse_jobs_html(html, base_url, scraped_at)
+
+
+def main():
+    """Re-extract jobs from archived HTML pages"""
+    parser = argparse.ArgumentParser(description="Extract Wuzzuf jobs from saved search result pages")
+    parser.add_argument("files", nargs="+", help="Saved HTML pages")
+    parser.add_argument("-o", "--output", help="Write jobs to this JSON file instead of stdout")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="Base URL for relative job links")
+    args = parser.parse_args()
+
+    jobs = []
+    for file in args.files:
+        page_jobs = parse_jobs_file(file, args.base_url)
+        if args.output:
+            print(f"📄 {file}: {len(page_jobs)} jobs")
+        jobs.extend(page_jobs)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(jobs, f, indent=2, ensure_ascii=False)
+        print(f"✅ JSON saved: {args.output}")
+    else:
+        print(json.dumps(jobs, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Page Readiness Detection for Wuzzuf
+Waits on real page signals (job cards present, previous cards gone stale,
+network idle) instead of fixed sleeps, and records how long each wait took
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+from wuzzuf_selectors import JOB_CARD_SELECTOR
+
+
+# Sizes of resources seen loading, used to price the requests the lean profile blocks
+RESOURCE_SIZES_FILE = Path.home() / ".wuzzuf_scraper" / "resource_sizes.json"
+RESOURCE_SIZES_LIMIT = 5000  # URLs remembered, the oldest are dropped first
+
+
+class ResourceSizes:
+    """Bytes each resource took the last time it loaded, and the average per resource type
+
+    Blocked requests are never downloaded, so what they save is estimated from
+    the same URL (or, failing that, resources of the same type) loaded before,
+    e.g. by a default-profile run. Shared by every monitor in the process and
+    kept between runs in RESOURCE_SIZES_FILE.
+    """
+
+    def __init__(self, path=RESOURCE_SIZES_FILE):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.urls = {}   # URL without query -> bytes
+        self.types = {}  # CDP resource type -> [total bytes, loads]
+        self.dirty = False
+        try:
+            saved = json.loads(self.path.read_text(encoding='utf-8'))
+            self.urls = dict(saved.get('urls', {}))
+            self.types = dict(saved.get('types', {}))
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def url_key(url):
+        return url.split('?')[0].split('#')[0]
+
+    def learn(self, url, resource_type, size):
+        if not url or size <= 0:
+            return
+        with self.lock:
+            key = self.url_key(url)
+            self.urls.pop(key, None)  # Re-insert so the dict stays in last-seen order
+            self.urls[key] = size
+            if len(self.urls) > RESOURCE_SIZES_LIMIT:
+                del self.urls[next(iter(self.urls))]
+            total, loads = self.types.get(resource_type, (0, 0))
+            self.types[resource_type] = [total + size, loads + 1]
+            self.dirty = True
+
+    def estimate(self, url, resource_type):
+        """Likely bytes of a resource, None when nothing like it was seen loading"""
+        with self.lock:
+            size = self.urls.get(self.url_key(url or ''))
+            if size is not None:
+                return size
+            total, loads = self.types.get(resource_type, (0, 0))
+            return total // loads if loads else None
+
+    def save(self):
+        """Write the sizes to disk if new ones were learned"""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = json.dumps({'urls': self.urls, 'types': self.types})
+            self.dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(data, encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️ Could not save resource sizes: {e}")
+
+
+_resource_sizes = None
+_resource_sizes_lock = threading.Lock()
+
+
+def resource_sizes():
+    """The process-wide ResourceSizes, loaded on first use"""
+    global _resource_sizes
+    with _resource_sizes_lock:
+        if _resource_sizes is None:
+            _resource_sizes = ResourceSizes()
+        return _resource_sizes
+
+
+def enable_network_logging(chrome_options):
+    """Turn on Chrome's CDP performance log, which NetworkMonitor reads"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+class NetworkMonitor:
+    """Track in-flight requests and traffic from the CDP Network events in Chrome's performance log"""
+
+    def __init__(self, driver, sizes=None):
+        self.driver = driver
+        self.inflight = set()
+        self.requests = {}  # request ID -> (URL, resource type), until it finishes or fails
+        self.sizes = sizes or resource_sizes()
+        self.available = True
+        self.reset_stats()
+
+    def poll(self):
+        """Read new CDP events and update the set of in-flight requests"""
+        if not self.available:
+            return
+        try:
+            entries = self.driver.get_log('performance')
+        except (WebDriverException, ValueError):
+            # Performance logging not enabled for this driver
+            self.available = False
+            return
+
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            self.handle_event(message.get('method', ''), message.get('params', {}))
+
+    def handle_event(self, method, params):
+        """Update state from a single CDP event"""
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            self.inflight.add(request_id)
+            self.requests[request_id] = (params.get('request', {}).get('url', ''), params.get('type', 'Other'))
+        elif method == 'Network.loadingFinished':
+            self.inflight.discard(request_id)
+            url, resource_type = self.requests.pop(request_id, ('', 'Other'))
+            size = int(params.get('encodedDataLength', 0))
+            self.stats['requests_loaded'] += 1
+            self.stats['bytes_loaded'] += size
+            self.sizes.learn(url, resource_type, size)
+        elif method == 'Network.loadingFailed':
+            self.inflight.discard(request_id)
+            url, resource_type = self.requests.pop(request_id, ('', params.get('type', 'Other')))
+            if params.get('blockedReason'):
+                resource_type = params.get('type', resource_type)
+                self.stats['requests_blocked'] += 1
+                self.stats['blocked_by_type'][resource_type] = self.stats['blocked_by_type'].get(resource_type, 0) + 1
+                size = self.sizes.estimate(url, resource_type)
+                if size is None:
+                    self.stats['blocked_unsized'] += 1
+                else:
+                    self.stats['bytes_blocked'] += size
+
+    def reset_stats(self):
+        """Start counting traffic from zero"""
+        self.stats = {
+            'requests_loaded': 0, 'bytes_loaded': 0, 'requests_blocked': 0, 'blocked_by_type': {},
+            'bytes_blocked': 0,    # Estimated from ResourceSizes
+            'blocked_unsized': 0,  # Blocked requests with no size to go by
+        }
+
+    def take_stats(self):
+        """Return the traffic counted since the last call and start counting again"""
+        self.poll()
+        stats = self.stats
+        self.reset_stats()
+        self.sizes.save()
+        return stats
+
+    def begin_navigation(self):
+        """Forget requests of the page being left, so they can't keep the next page from looking idle
+
+        Traffic counted so far is kept for take_stats().
+        """
+        self.poll()
+        self.inflight.clear()
+        self.requests.clear()
+
+    def reset(self):
+        """Forget in-flight requests and traffic from previous pages"""
+        self.poll()
+        self.inflight.clear()
+        self.requests.clear()
+        self.reset_stats()
+
+    @property
+    def inflight_count(self):
+        return len(self.inflight)
+
+
+class PageReadiness:
+    """Condition-based waits with configurable upper bounds"""
+
+    def __init__(self, driver, timeout=10, network_idle_timeout=5, quiet_period=0.5, poll_interval=0.1):
+        self.driver = driver
+        self.timeout = timeout
+        self.network_idle_timeout = network_idle_timeout
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+        self.network = NetworkMonitor(driver)
+        self.waited = 0.0
+        self.page_loads = 0  # Navigations waited on, used to recycle pooled drivers
+
+    def first_card(self):
+        """Return the first job card on the page, used to detect when the page changes"""
+        try:
+            cards = self.driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR)
+            return cards[0] if cards else None
+        except WebDriverException:
+            return None
+
+    def wait_for_cards(self, previous_first_card=None):
+        """Wait until the previous cards are gone and new job cards are present"""
+        started = time.monotonic()
+        wait = WebDriverWait(self.driver, self.timeout, poll_frequency=self.poll_interval)
+
+        if previous_first_card is not None:
+            try:
+                wait.until(EC.staleness_of(previous_first_card))
+            except TimeoutException:
+                print("⚠️ Previous job cards did not go stale in time")
+
+        remaining = max(self.timeout - (time.monotonic() - started), self.poll_interval)
+        try:
+            WebDriverWait(self.driver, remaining, poll_frequency=self.poll_interval).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+            )
+        except TimeoutException:
+            print("⚠️ No job cards appeared before the timeout")
+
+        return self._record(started)
+
+    def wait_for_network_idle(self):
+        """Wait until no requests have been in flight for the quiet period"""
+        started = time.monotonic()
+        deadline = started + self.network_idle_timeout
+        idle_since = None
+
+        while time.monotonic() < deadline:
+            self.network.poll()
+            if not self.network.available:
+                self._wait_for_document_complete(deadline)
+                break
+
+            now = time.monotonic()
+            if self.network.inflight_count == 0:
+                idle_since = idle_since or now
+                if now - idle_since >= self.quiet_period:
+                    break
+            else:
+                idle_since = None
+            time.sleep(self.poll_interval)
+
+        return self._record(started)
+
+    def navigate(self, url):
+        """Load a URL in the driver, dropping requests of the previous page first"""
+        self.network.begin_navigation()
+        self.driver.get(url)
+
+    def wait_for_page(self, previous_first_card=None):
+        """Wait for new job cards and then for the network to settle"""
+        self.page_loads += 1
+        return self.wait_for_cards(previous_first_card) + self.wait_for_network_idle()
+
+    def take_waited(self):
+        """Return the time waited since the last call and reset the counter"""
+        waited, self.waited = self.waited, 0.0
+        return waited
+
+    def _wait_for_document_complete(self, deadline):
+        """Fallback idle signal when CDP network events are unavailable"""
+        while time.monotonic() < deadline:
+            try:
+                if self.driver.execute_script("return document.readyState") == "complete":
+                    return
+            except WebDriverException:
+                return
+            time.sleep(self.poll_interval)
+
+    def _record(self, started):
+        elapsed = time.monotonic() - started
+        self.waited += elapsed
+        return elapsed
@@ -0,0 +1,80 @@
+"""
+Wuzzuf CSS Selectors
+Single place for the selectors and text filters used to read job cards,
+shared by every extraction backend so they all follow the same fallback order
+"""
+
+# Job card containers
+JOB_CARD_SELECTOR = "div[class*='css-pkv5jc']"  # Main job card selector
+JOB_CARD_FALLBACK_SELECTOR = "div[class*='css-'], article, .job-card"  # Alternative selectors
+
+# Field selectors (tried in order, first non-empty match wins)
+TITLE_SELECTORS = [
+    "h2 a[class*='css-193uk2c']",  # Primary title selector
+    "h2 a",                        # Fallback title selector
+    "h2", "h3", ".job-title", ".title"  # Additional fallbacks
+]
+
+COMPANY_SELECTORS = [
+    "a[class*='css-ipsyv7']",    # Primary company selector
+    ".company-name", ".company", ".employer"  # Fallbacks
+]
+
+LOCATION_SELECTORS = [
+    "span[class*='css-16x61xq']",  # Primary location selector
+    ".location", ".job-location", ".place"  # Fallbacks
+]
+
+JOB_TYPE_SELECTORS = [
+    "span[class*='css-uc9rga eoyjyou0']",  # Primary selector
+    "div[class*='css-5jhz9n']",
+]
+
+POSTING_DATE_SELECTORS = [
+    "div[class*='css-eg55jf']",   # Primary date selector
+    ".date", ".posted-date", ".time-ago"  # Fallbacks
+]
+
+# Job page of a card, the identity of a posting (the category links are shared by many cards)
+JOB_URL_SELECTORS = [
+    "h2 a[class*='css-193uk2c']",          # Job title link
+    "h2 a",                                 # Fallback title link
+    "a[href*='/jobs/p/']"                   # Any job page link
+]
+
+APPLICATION_LINK_SELECTORS = [
+    "a[class*='css-o171kl']",
+    "h2 a[class*='css-193uk2c']",          # Job title link (most reliable)
+    "a[href*='/jobs/']",                    # Job-specific links
+    "a[href*='wuzzuf.net']",                # Wuzzuf domain links
+    "a[href^='http']"                       # Any HTTP link as fallback
+]
+
+# Experience level
+EXPERIENCE_SPAN_SELECTOR = "span:not([class])"
+EXPERIENCE_ANCHOR_SELECTOR = "a.css-o171kl"
+EXPERIENCE_KEYWORDS = ['yrs', 'years', 'exp', 'experience', 'level', '-']
+
+# Skills
+PRIMARY_SKILL_SELECTOR = "a[class*='css-5x9pm1']"
+SECONDARY_SKILL_SELECTOR = "a[class*='css-o171kl']"
+SKILL_MAX_LENGTH = 50
+SKILL_EXCLUDES = ['full time', 'part time', 'contract', 'remote', 'on-site']
+SKILL_CATEGORY_EXCLUDES = ['entry level', 'experienced', 'senior', 'junior']
+
+# Pagination (only used when the direct page URL fails)
+NEXT_PAGE_ARROW_PATH = "M9.213 5L7.5 6.645 13.063 12 7.5 17.355 9.213 19l7.287-7z"
+
+# Job detail pages (job_url)
+DETAIL_SECTION_SELECTOR = "section"              # Each block of the job page
+DETAIL_HEADING_SELECTOR = "h2, h3, h4"           # Block title, e.g. "Job Description"
+DETAIL_DESCRIPTION_HEADINGS = ['job description', 'about the job', 'description']
+DETAIL_REQUIREMENTS_HEADINGS = ['job requirements', 'requirements', 'qualifications']
+DETAIL_LABEL_SELECTOR = "span, strong, dt"       # "Salary:" style labels in the job details block
+DETAIL_SALARY_LABELS = ['salary']
+DETAIL_VACANCIES_LABELS = ['vacancies', 'open positions']
+DETAIL_VACANCIES_PATTERN = r"(\d+)\s+open positions?"  # Header text like "2 open positions"
+
+# Default values for missing fields
+DEFAULT_TEXT = "Not specified"
+DEFAULT_LINK = "Not available"
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Wuzzuf Session Catalog
+Indexes every Data/scraping_session_* folder (keyword, start time, job count,
+scraped time range) and opens any set of sessions as one deduplicated
+dataset, reusing cached metadata and frames for files that did not change
+"""
+
+import argparse
+import json
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from wuzzuf_loader import load_data_file
+from wuzzuf_parser import JOB_KEY_FALLBACK_FIELDS, job_key
+
+DEFAULT_DATA_DIR = "Data"
+CATALOG_FILE = "session_catalog.json"  # Cached metadata, kept in the data directory
+CATALOG_VERSION = 1
+SESSION_PATTERN = re.compile(r"^scraping_session_(\d{8}_\d{6})_(.*)$")
+DATA_FILE_GLOB = "wuzzuf_jobs_*"
+# Every session file holds the same jobs, read the fastest format available
+FORMAT_PREFERENCE = ('.parquet', '.jsonl', '.csv', '.json')
+FRAME_CACHE_ROWS = 1_000_000  # Rows of parsed session files kept in memory
+KEY_COLUMNS = ('job_url', 'application_link') + JOB_KEY_FALLBACK_FIELDS  # All job_key reads
+
+
+def session_data_file(folder):
+    """The session's data file in the preferred format, or None if it has none with data"""
+    files = {}
+    for path in Path(folder).glob(DATA_FILE_GLOB):
+        suffix = path.suffix.lower()
+        if suffix in FORMAT_PREFERENCE and path.stat().st_size > 0:
+            files[suffix] = path
+    for suffix in FORMAT_PREFERENCE:
+        if suffix in files:
+            return files[suffix]
+    return None
+
+
+def file_fingerprint(path):
+    """(size, modification time) of a file, changes whenever the file is rewritten"""
+    stat = Path(path).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def list_session_folders(data_dir=DEFAULT_DATA_DIR):
+    """Session folders in data_dir, newest first"""
+    data_dir = Path(data_dir)
+    if not data_dir.is_dir():
+        return []
+    folders = [path for path in data_dir.iterdir() if path.is_dir() and SESSION_PATTERN.match(path.name)]
+    # Names start with the timestamp, so they sort by start time
+    return sorted(folders, key=lambda path: path.name, reverse=True)
+
+
+def latest_session_file(data_dir=DEFAULT_DATA_DIR):
+    """Data file of the newest session that has one, or None"""
+    for folder in list_session_folders(data_dir):
+        path = session_data_file(folder)
+        if path is not None:
+            return path
+    return None
+
+
+def dedup_keys(df):
+    """Key per row identifying the same posting across sessions: wuzzuf_parser.job_key, as the scraper uses"""
+    columns = [column for column in KEY_COLUMNS if column in df.columns]
+    return pd.Series([job_key(row) for row in df[columns].to_dict('records')], index=df.index, dtype=object)
+
+
+class SessionCatalog:
+    """Every scraping session in a data directory, with cached metadata and frames
+
+    scan() lists the sessions; a session file is only parsed when its
+    fingerprint (size and modification time) differs from the cached one.
+    Parsed frames are kept in memory too, so opening sessions again or in a
+    different combination does not read unchanged files twice.
+    """
+
+    def __init__(self, data_dir=DEFAULT_DATA_DIR, catalog_path=None):
+        self.data_dir = Path(data_dir)
+        self.catalog_path = Path(catalog_path) if catalog_path else self.data_dir / CATALOG_FILE
+        self.lock = threading.RLock()
+        self.sessions = OrderedDict()  # folder name -> session dict, newest first
+        self.frames = OrderedDict()  # data file path -> (fingerprint, DataFrame), least recently used first
+        self.cached = self.load_catalog()
+
+    def load_catalog(self):
+        """Session metadata saved by an earlier scan, by folder name"""
+        try:
+            catalog = json.loads(self.catalog_path.read_text(encoding='utf-8'))
+            if catalog.get('version') == CATALOG_VERSION:
+                return catalog.get('sessions', {})
+        except (OSError, ValueError):
+            pass  # First scan, or an unreadable catalog that is simply rebuilt
+        return {}
+
+    def save_catalog(self):
+        try:
+            self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+            catalog = {'version': CATALOG_VERSION, 'sessions': dict(self.sessions)}
+            self.catalog_path.write_text(json.dumps(catalog, indent=2, ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️ Could not save the session catalog: {e}")
+
+    def scan(self):
+        """Index every session folder, returns the session dicts newest first
+
+        Each dict has name, folder, keyword, started, file, format, rows,
+        first_scraped, last_scraped and fingerprint.
+        """
+        with self.lock:
+            sessions = OrderedDict()
+            parsed = 0
+            for folder in list_session_folders(self.data_dir):
+                timestamp, keyword = SESSION_PATTERN.match(folder.name).groups()
+                path = session_data_file(folder)
+                fingerprint = file_fingerprint(path) if path is not None else None
+                cached = self.cached.get(folder.name)
+                if (cached and cached.get('file') == (path.name if path else None)
+                        and cached.get('fingerprint') == fingerprint):
+                    sessions[folder.name] = dict(cached, folder=str(folder))
+                    continue
+
+                session = {
+                    'name': folder.name,
+                    'folder': str(folder),
+                    'keyword': keyword.replace('_', ' '),
+                    'started': datetime.strptime(timestamp, "%Y%m%d_%H%M%S").strftime("%Y-%m-%d %H:%M:%S"),
+                    'file': path.name if path else None,
+                    'format': path.suffix.lstrip('.') if path else None,
+                    'rows': 0,
+                    'first_scraped': None,
+                    'last_scraped': None,
+                    'fingerprint': fingerprint,
+                }
+                if path is not None:
+                    try:
+                        df = self.frame(session)
+                        parsed += 1
+                    except Exception as e:
+                        print(f"⚠️ Could not read {path}: {e}")
+                        df = None
+                    if df is not None:
+                        session['rows'] = len(df)
+                        if 'scraped_at' in df.columns and len(df):
+                            scraped = df['scraped_at'].dropna().astype(str)
+                            if len(scraped):
+                                session['first_scraped'] = scraped.min()
+                                session['last_scraped'] = scraped.max()
+                sessions[folder.name] = session
+
+            changed = list(sessions.values()) != list(self.cached.values()) or parsed
+            self.sessions = sessions
+            self.cached = {name: dict(session) for name, session in sessions.items()}
+            if changed:
+                self.save_catalog()
+            if parsed:
+                print(f"📚 Indexed {parsed} changed session files")
+            return list(sessions.values())
+
+    def frame(self, session):
+        """The session's jobs as a DataFrame, parsed only if the file changed since last time"""
+        path = Path(session['folder']) / session['file']
+        fingerprint = file_fingerprint(path)
+        key = str(path)
+        with self.lock:
+            cached = self.frames.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self.frames.move_to_end(key)
+                return cached[1]
+
+        df = load_data_file(path)
+        with self.lock:
+            self.frames[key] = (fingerprint, df)
+            self.frames.move_to_end(key)
+            # Drop the least recently used frames over the row budget, but always keep this one
+            while len(self.frames) > 1 and sum(len(frame) for _, frame in self.frames.values()) > FRAME_CACHE_ROWS:
+                self.frames.popitem(last=False)
+        return df
+
+    def select(self, names=None):
+        """Session dicts for the given folder names (every session if None), newest first"""
+        with self.lock:
+            if not self.sessions:
+                self.scan()
+            if names is None:
+                return list(self.sessions.values())
+            wanted = set(names)
+            return [session for name, session in self.sessions.items() if name in wanted]
+
+    def iter_union(self, names=None, cancel=None):
+        """Yield (new rows, fraction done) for each session in turn, dropping jobs already yielded
+
+        Sessions are read newest first, so a job scraped more than once keeps
+        its latest copy. Works as a BackgroundLoader chunk source.
+        """
+        sessions = [session for session in self.select(names) if session['file']]
+        total = sum(session['rows'] for session in sessions) or 1
+        seen = set()
+        done = 0
+        for session in sessions:
+            if cancel is not None and cancel.is_set():
+                return
+            try:
+                df = self.frame(session)
+            except Exception as e:
+                print(f"⚠️ Skipping session {session['name']}: {e}")
+                continue
+            keys = dedup_keys(df)
+            new = ~keys.isin(seen) & ~keys.duplicated()
+            seen.update(keys[new])
+            done += session['rows']
+            yield df[new], min(1.0, done / total)
+
+    def load_union(self, names=None):
+        """The selected sessions as one deduplicated DataFrame"""
+        chunks = [chunk for chunk, _ in self.iter_union(names)]
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
+
+
+def main():
+    """List the scraping sessions, or export a merged dataset"""
+    parser = argparse.ArgumentParser(description="Catalog of Wuzzuf scraping sessions")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directory holding scraping_session_* folders")
+    parser.add_argument("--export", help="Write the deduplicated union of the sessions to this CSV or Parquet file")
+    parser.add_argument("--keyword", help="Only sessions whose keyword contains this text")
+    args = parser.parse_args()
+
+    catalog = SessionCatalog(args.data_dir)
+    sessions = catalog.scan()
+    if args.keyword:
+        sessions = [session for session in sessions if args.keyword.lower() in session['keyword'].lower()]
+    if not sessions:
+        print(f"📂 No scraping sessions in {args.data_dir}")
+        return
+
+    print(f"📚 {len(sessions)} sessions, {sum(session['rows'] for session in sessions)} jobs")
+    for session in sessions:
+        scraped = f"{session['first_scraped']} → {session['last_scraped']}" if session['first_scraped'] else "-"
+        print(f"📁 {session['started']} | {session['keyword']} | {session['rows']} jobs "
+              f"| {session['format'] or 'no data'} | {scraped}")
+
+    if args.export:
+        df = catalog.load_union([session['name'] for session in sessions])
+        if args.export.lower().endswith('.parquet'):
+            df.to_parquet(args.export, index=False)
+        else:
+            df.to_csv(args.export, index=False)
+        print(f"💾 Exported {len(df)} unique jobs to {args.export}")
+
+
+if __name__ == "__main__":
+    main()
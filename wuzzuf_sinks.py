@@ -0,0 +1,304 @@
+"""
+Job Sinks for Wuzzuf Scraper
+Destinations that receive jobs one at a time while a search is running, so
+results can be consumed or written out without keeping the whole run in memory
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# pyarrow is optional, only ParquetSink needs it
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Suffix of files still being written
+PARTIAL_SUFFIX = ".partial"
+# A .partial file untouched for this long is left over from a crash, not still streaming
+STALE_PARTIAL_SECONDS = 600
+
+
+class JobSink:
+    """Base class for job destinations
+
+    write() is called for every job as soon as it is extracted, flush() at the
+    end of every results page and close() once the caller is done with the sink.
+    """
+
+    def write(self, job):
+        raise NotImplementedError
+
+    def flush(self):
+        """Persist anything buffered since the last page"""
+
+    def close(self):
+        """Flush and release resources"""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ListSink(JobSink):
+    """Collect jobs in a list (what jobs_data does by default)"""
+
+    def __init__(self, jobs=None):
+        self.jobs = [] if jobs is None else jobs
+
+    def write(self, job):
+        self.jobs.append(job)
+
+
+class CallbackSink(JobSink):
+    """Call a function for every job, and optionally at every page boundary"""
+
+    def __init__(self, on_job, on_flush=None):
+        self.on_job = on_job
+        self.on_flush = on_flush
+
+    def write(self, job):
+        self.on_job(job)
+
+    def flush(self):
+        if self.on_flush is not None:
+            self.on_flush()
+
+
+class AtomicFileSink(JobSink):
+    """Append jobs to <path>.partial and rename it to <path> on close
+
+    Data is fsynced every batch_size jobs and at every page boundary, so after a
+    crash the .partial file holds every synced job; run_scraper finishes such
+    files on startup (see recover_partial_files).
+    Safe to close from another thread while a search is still writing.
+    """
+
+    def __init__(self, path, batch_size=25):
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + PARTIAL_SUFFIX)
+        self.batch_size = max(1, batch_size)
+        self.pending = 0  # Jobs written since the last fsync
+        self.count = 0
+        self.closed = False
+        self.lock = threading.Lock()
+        self.file = open(self.partial_path, 'w', newline='', encoding='utf-8')
+
+    def write(self, job):
+        with self.lock:
+            if self.closed:
+                return
+            self.write_job(job)
+            self.count += 1
+            self.pending += 1
+            if self.pending >= self.batch_size:
+                self._sync()
+
+    def write_job(self, job):
+        raise NotImplementedError
+
+    def flush(self):
+        with self.lock:
+            if not self.closed and self.pending:
+                self._sync()
+
+    def close(self):
+        """Sync, close and atomically move the file into place"""
+        with self.lock:
+            if self.closed:
+                return
+            self._sync()
+            self.file.close()
+            self.closed = True
+            os.replace(self.partial_path, self.path)
+
+    def _sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+
+class JsonLinesSink(AtomicFileSink):
+    """Write one JSON object per line"""
+
+    def write_job(self, job):
+        self.file.write(json.dumps(job, ensure_ascii=False) + "\n")
+
+
+class CsvSink(AtomicFileSink):
+    """Write CSV rows, with the header taken from the first job (or fieldnames) written once"""
+
+    def __init__(self, path, batch_size=25, fieldnames=None):
+        super().__init__(path, batch_size)
+        self.fieldnames = fieldnames
+        self.writer = None
+
+    def write_job(self, job):
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames or list(job.keys()), extrasaction='ignore')
+            self.writer.writeheader()
+        self.writer.writerow(job)
+
+
+def parquet_field(name):
+    """Arrow type for a job field: typed for the known fields, string otherwise"""
+    if name == 'skills':
+        return pa.field(name, pa.list_(pa.string()))
+    if name in ('company', 'location'):
+        return pa.field(name, pa.dictionary(pa.int32(), pa.string()))  # Few distinct values
+    if name == 'scraped_at':
+        return pa.field(name, pa.timestamp('ms'))
+    return pa.field(name, pa.string())
+
+
+def parquet_value(name, value):
+    """Convert a job value to what its Arrow column expects"""
+    if value is None:
+        return None
+    if name == 'skills':
+        return [str(skill) for skill in value] if isinstance(value, (list, tuple)) else [str(value)]
+    if name == 'scraped_at':
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.strptime(str(value), "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return None
+    return str(value)
+
+
+class ParquetSink(AtomicFileSink):
+    """Write a Parquet file with a typed schema, one row group per results page
+
+    skills is list<string>, company and location are dictionary-encoded and
+    scraped_at is a timestamp. The schema follows the first job's fields.
+    Rows are buffered until the next page boundary since Parquet can't append
+    single rows; batch_size is accepted for a common sink signature.
+    """
+
+    def __init__(self, path, batch_size=25):
+        if pa is None:
+            raise ImportError("ParquetSink needs pyarrow: pip install pyarrow")
+        super().__init__(path, batch_size)
+        self.file.close()  # ParquetWriter opens the file itself
+        self.rows = []
+        self.schema = None
+        self.writer = None
+
+    def write_job(self, job):
+        if self.schema is None:
+            self.schema = pa.schema([parquet_field(name) for name in job])
+            self.writer = pq.ParquetWriter(str(self.partial_path), self.schema, compression='snappy')
+        self.rows.append(job)
+
+    def write(self, job):
+        # Only write row groups at page boundaries, not every batch_size jobs
+        with self.lock:
+            if not self.closed:
+                self.write_job(job)
+                self.count += 1
+
+    def flush(self):
+        with self.lock:
+            if not self.closed:
+                self._sync()
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self._sync()
+            if self.writer is None:
+                # No jobs, write an empty file so readers still find one
+                self.schema = pa.schema([])
+                self.writer = pq.ParquetWriter(str(self.partial_path), self.schema)
+            self.writer.close()
+            self.closed = True
+            os.replace(self.partial_path, self.path)
+
+    def _sync(self):
+        if not self.rows:
+            return
+        columns = {
+            field.name: [parquet_value(field.name, row.get(field.name)) for row in self.rows]
+            for field in self.schema
+        }
+        arrays = []
+        for field in self.schema:
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(columns[field.name], type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(columns[field.name], type=field.type))
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        self.rows = []
+
+
+def complete_csv_text(text):
+    """Text of a CSV file cut after its last complete record
+
+    Quoted fields may hold newlines, so a record only counts as complete if the
+    text up to its newline parses without an open quote.
+    """
+    end = text.rfind("\n") + 1
+    while end > 0:
+        try:
+            for _ in csv.reader(text[:end].splitlines(keepends=True), strict=True):
+                pass
+            return text[:end]
+        except csv.Error:
+            end = text.rfind("\n", 0, end - 1) + 1  # Cut inside a quoted field, try the newline before
+    return ""
+
+
+def recover_partial_file(partial_path):
+    """Finish a .partial CSV or JSON Lines file left by a crashed run, dropping a torn last record
+
+    Returns the path of the recovered file. Parquet files can't be recovered
+    (the footer is only written on close) and raise ValueError.
+    """
+    partial_path = Path(partial_path)
+    final_path = partial_path.with_name(partial_path.name[:-len(PARTIAL_SUFFIX)])
+    suffix = final_path.suffix.lower()
+    if suffix == '.csv':
+        text = partial_path.read_text(encoding='utf-8', errors='replace')
+        data = complete_csv_text(text).encode('utf-8')
+    elif suffix == '.jsonl':
+        # JSON escapes newlines inside strings, every newline ends a record
+        data = partial_path.read_bytes()
+        data = data[:data.rfind(b"\n") + 1]
+    else:
+        raise ValueError(f"Can't recover {partial_path.name}: only CSV and JSON Lines files can be recovered")
+    partial_path.write_bytes(data)
+    os.replace(partial_path, final_path)
+    return final_path
+
+
+def recover_partial_files(directory="Data", min_age_seconds=STALE_PARTIAL_SECONDS):
+    """Recover every .partial file under directory that has not been written to for a while
+
+    Recently modified files may belong to a run that is still streaming and
+    are left alone. Returns the recovered paths.
+    """
+    recovered = []
+    directory = Path(directory)
+    if not directory.is_dir():
+        return recovered
+    now = time.time()
+    for partial_path in sorted(directory.rglob(f"*{PARTIAL_SUFFIX}")):
+        if now - partial_path.stat().st_mtime < min_age_seconds:
+            continue
+        try:
+            recovered.append(recover_partial_file(partial_path))
+            print(f"🩹 Recovered {recovered[-1]} from an interrupted run")
+        except (ValueError, OSError) as e:
+            print(f"⚠️ {e}")
+    return recovered
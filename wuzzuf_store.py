@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Wuzzuf Job Store
+One SQLite database holding every job ever scraped, keyed by wuzzuf_parser.job_key
+(the Wuzzuf job ID of the job URL), so questions like "all jobs seen for company X" need no CSV globbing
+"""
+
+import argparse
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from wuzzuf_parser import JOB_ID_PATTERN, job_key, job_url_key
+from wuzzuf_selectors import DEFAULT_TEXT
+from wuzzuf_sinks import JobSink
+
+DEFAULT_STORE_PATH = "Data/wuzzuf_jobs.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,              -- job_key: "id:<job ID>" (or title|company|location|posting_date without a job URL)
+    title TEXT,
+    company_id INTEGER REFERENCES companies(id),
+    location TEXT,
+    job_type TEXT,
+    experience_level TEXT,
+    posting_date TEXT,
+    application_link TEXT,
+    job_url TEXT,
+    first_seen TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,              -- Last time the job was scraped
+    times_seen INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills(id),
+    position INTEGER NOT NULL DEFAULT 0,   -- Order of the skill on the job card
+    PRIMARY KEY (job_id, skill_id)
+);
+
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    key TEXT PRIMARY KEY,                  -- job_url_key: Wuzzuf job ID of the job URL, or the canonical job URL
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at);
+CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill_id);
+"""
+
+UPSERT_JOB = """
+INSERT INTO jobs (url, title, company_id, location, job_type, experience_level,
+                  posting_date, application_link, job_url, first_seen, scraped_at)
+VALUES (:url, :title, :company_id, :location, :job_type, :experience_level,
+        :posting_date, :application_link, :job_url, :scraped_at, :scraped_at)
+ON CONFLICT(url) DO UPDATE SET
+    title = excluded.title,
+    company_id = excluded.company_id,
+    location = excluded.location,
+    job_type = excluded.job_type,
+    experience_level = excluded.experience_level,
+    posting_date = excluded.posting_date,
+    application_link = excluded.application_link,
+    job_url = COALESCE(excluded.job_url, jobs.job_url),
+    scraped_at = excluded.scraped_at,
+    times_seen = jobs.times_seen + 1
+"""
+
+# skills is filled in by attach_skills(), in card order
+SELECT_JOBS = """
+SELECT j.id, j.title, c.name AS company, j.location, j.job_type, j.experience_level,
+       NULL AS skills,
+       j.posting_date, j.application_link, j.job_url, j.scraped_at, j.first_seen, j.times_seen
+FROM jobs j LEFT JOIN companies c ON c.id = j.company_id
+"""
+
+
+SELECT_SKILLS = """
+SELECT js.job_id, s.name FROM job_skills js JOIN skills s ON s.id = js.skill_id
+WHERE js.job_id IN ({placeholders})
+ORDER BY js.job_id, js.position
+"""
+
+QUERY_BATCH_SIZE = 500  # Stay under SQLite's variable limit
+
+
+def create_schema(conn):
+    """Create the store's tables, adding columns that older stores lack"""
+    conn.executescript(SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(job_skills)")}
+    if 'position' not in columns:
+        conn.execute("ALTER TABLE job_skills ADD COLUMN position INTEGER NOT NULL DEFAULT 0")
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+    if 'job_url' not in columns:
+        conn.execute("ALTER TABLE jobs ADD COLUMN job_url TEXT")
+        rekey_job_urls(conn)
+
+
+def rekey_job_urls(conn):
+    """Move jobs stored under a job page link to their job_key, like new upserts use
+
+    Older stores keyed jobs by their canonical application link. Rows keyed by a
+    category link (/a/...) mixed several postings and keep their key.
+    """
+    rows = conn.execute("SELECT id, url FROM jobs WHERE url LIKE '%/jobs/p/%'").fetchall()
+    for job_id, url in rows:
+        if JOB_ID_PATTERN.search(url):
+            conn.execute("UPDATE OR IGNORE jobs SET url = ?, job_url = ? WHERE id = ?", (job_url_key(url), url, job_id))
+
+
+def attach_skills(conn, rows):
+    """Turn SELECT_JOBS rows into job dicts with their skills as a list, in card order"""
+    jobs = [dict(row) for row in rows]
+    skills = {}
+    job_ids = [job['id'] for job in jobs]
+    for start in range(0, len(job_ids), QUERY_BATCH_SIZE):
+        chunk = job_ids[start:start + QUERY_BATCH_SIZE]
+        for job_id, name in conn.execute(SELECT_SKILLS.format(placeholders=",".join("?" * len(chunk))), chunk):
+            skills.setdefault(job_id, []).append(name)
+    for job in jobs:
+        job['skills'] = skills.get(job['id'], [])
+    return jobs
+
+
+def configured_store_path():
+    """Store location from JOB_STORE_PATH in simple_config"""
+    try:
+        from simple_config import JOB_STORE_PATH
+        return JOB_STORE_PATH
+    except ImportError:
+        return DEFAULT_STORE_PATH
+
+
+class JobStore:
+    """SQLite store of every scraped job with companies and skills normalized out
+
+    Safe to share between threads; writes are serialized and each
+    upsert_jobs() call is a single transaction.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")  # Readers (the GUI) don't block the scraper
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        with self.lock, self.conn:
+            create_schema(self.conn)
+
+    def upsert_jobs(self, jobs):
+        """Insert or update jobs in one transaction, returns (new jobs, updated jobs)"""
+        inserted = updated = 0
+        with self.lock, self.conn:
+            for job in jobs:
+                key = job_key(job)
+                is_new = self.conn.execute("SELECT 1 FROM jobs WHERE url = ?", (key,)).fetchone() is None
+                row = {
+                    'url': key,
+                    'title': job.get('title'),
+                    'company_id': self._lookup_id('companies', job.get('company')),
+                    'location': job.get('location'),
+                    'job_type': job.get('job_type'),
+                    'experience_level': job.get('experience_level'),
+                    'posting_date': job.get('posting_date'),
+                    'application_link': job.get('application_link'),
+                    'job_url': job.get('job_url'),
+                    'scraped_at': str(job.get('scraped_at') or datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                }
+                self.conn.execute(UPSERT_JOB, row)
+                job_id = self.conn.execute("SELECT id FROM jobs WHERE url = ?", (key,)).fetchone()[0]
+
+                # Replace the job's skills with the latest ones
+                self.conn.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
+                skills = job.get('skills') or []
+                if isinstance(skills, str):
+                    skills = [skills]
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO job_skills (job_id, skill_id, position) VALUES (?, ?, ?)",
+                    [
+                        (job_id, self._lookup_id('skills', skill), position)
+                        for position, skill in enumerate(skills) if skill
+                    ]
+                )
+
+                if is_new:
+                    inserted += 1
+                else:
+                    updated += 1
+        return inserted, updated
+
+    def _lookup_id(self, table, name):
+        """Return the id of a company or skill, adding it if needed"""
+        if not name or name == DEFAULT_TEXT:
+            return None
+        self.conn.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+        return self.conn.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+
+    def query(self, company=None, location=None, skill=None, since=None, limit=None):
+        """Return stored jobs as dicts, newest first
+
+        company / location / skill match case-insensitively on part of the
+        name, since is a "YYYY-MM-DD[ HH:MM:SS]" lower bound on scraped_at.
+        """
+        conditions, params = [], []
+        if company:
+            conditions.append("c.name LIKE ?")
+            params.append(f"%{company}%")
+        if location:
+            conditions.append("j.location LIKE ?")
+            params.append(f"%{location}%")
+        if skill:
+            conditions.append(
+                "j.id IN (SELECT js.job_id FROM job_skills js JOIN skills s ON s.id = js.skill_id WHERE s.name LIKE ?)"
+            )
+            params.append(f"%{skill}%")
+        if since:
+            conditions.append("j.scraped_at >= ?")
+            params.append(since)
+
+        sql = SELECT_JOBS
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY j.scraped_at DESC, j.id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+            return attach_skills(self.conn, rows)
+
+    def count(self):
+        """Number of stored jobs"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class SeenJobIndex:
+    """Persistent set of job URLs already scraped, stored next to the jobs in the job store
+
+    Every call uses its own short-lived connection, so one index can be shared by
+    parallel workers and scrapers that open and close between searches.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        with self.connect() as conn:
+            create_schema(conn)
+
+    def connect(self):
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def known(self, links):
+        """Return the seen keys (job_url_key) among the given job URLs"""
+        keys = sorted({job_url_key(link) for link in links} - {""})
+        found = set()
+        with self.lock:
+            conn = self.connect()
+            try:
+                for start in range(0, len(keys), 500):  # Stay under SQLite's variable limit
+                    chunk = keys[start:start + 500]
+                    rows = conn.execute(
+                        f"SELECT key FROM seen_jobs WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                    ).fetchall()
+                    found.update(row[0] for row in rows)
+            finally:
+                conn.close()
+        return found
+
+    def contains(self, link):
+        key = job_url_key(link)
+        return bool(key) and key in self.known([link])
+
+    def add(self, jobs):
+        """Mark jobs as seen by their job URL in one transaction, returns how many were new
+
+        The application link is no identity (most cards link a shared category
+        page), and jobs without a job URL could never be looked up, so they are
+        not recorded.
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        keys = {job_url_key(job.get('job_url')) for job in jobs} - {""}
+        if not keys:
+            return 0
+        with self.lock:
+            conn = self.connect()
+            try:
+                with conn:
+                    before = conn.total_changes
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO seen_jobs (key, first_seen, last_seen) VALUES (?, ?, ?)",
+                        [(key, now, now) for key in keys]
+                    )
+                    new = conn.total_changes - before
+                    conn.executemany("UPDATE seen_jobs SET last_seen = ? WHERE key = ?", [(now, key) for key in keys])
+            finally:
+                conn.close()
+        return new
+
+    def count(self):
+        with self.lock:
+            conn = self.connect()
+            try:
+                return conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+            finally:
+                conn.close()
+
+
+def configured_only_new():
+    """ONLY_NEW_JOBS from simple_config"""
+    try:
+        from simple_config import ONLY_NEW_JOBS
+        return ONLY_NEW_JOBS
+    except ImportError:
+        return False
+
+
+def configured_seen_index(only_new=False):
+    """Seen-job index in the job store when only_new or TRACK_SEEN_JOBS is set, else None"""
+    try:
+        from simple_config import TRACK_SEEN_JOBS
+    except ImportError:
+        TRACK_SEEN_JOBS = False
+    if not (only_new or TRACK_SEEN_JOBS):
+        return None
+    return SeenJobIndex(configured_store_path())
+
+
+class SqliteSink(JobSink):
+    """Upsert jobs into a JobStore, one transaction per results page"""
+
+    def __init__(self, store=None, path=DEFAULT_STORE_PATH):
+        self.owns_store = store is None
+        self.store = JobStore(path) if store is None else store
+        self.path = self.store.path
+        self.rows = []
+        self.count = 0
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def write(self, job):
+        with self.lock:
+            if not self.closed:
+                self.rows.append(job)
+                self.count += 1
+
+    def flush(self):
+        with self.lock:
+            rows, self.rows = self.rows, []
+        if rows:
+            inserted, updated = self.store.upsert_jobs(rows)
+            print(f"🗄️ Job store: {inserted} new, {updated} updated")
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        if self.owns_store:
+            self.store.close()
+
+
+def main():
+    """Query the job store from the command line"""
+    parser = argparse.ArgumentParser(description="Query the Wuzzuf job store")
+    parser.add_argument("--db", default=configured_store_path(), help="Path to the SQLite job store")
+    parser.add_argument("--company", help="Company name contains")
+    parser.add_argument("--location", help="Location contains")
+    parser.add_argument("--skill", help="Skill contains")
+    parser.add_argument("--since", help="Scraped on or after (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=50, help="Maximum jobs to show")
+    args = parser.parse_args()
+
+    with JobStore(args.db) as store:
+        jobs = store.query(args.company, args.location, args.skill, args.since, args.limit)
+        print(f"🗄️ {store.count()} jobs in store, {len(jobs)} matching")
+        for job in jobs:
+            print(f"📋 {job['title']} | {job['company']} | {job['location']} | {job['scraped_at']}")
+
+
+if __name__ == "__main__":
+    main()
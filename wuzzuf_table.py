@@ -0,0 +1,209 @@
+"""
+Virtual Table for the Wuzzuf GUI
+Shows a DataFrame in a ttk.Treeview that only ever holds the rows on screen,
+so loading, filtering and scrolling cost the same for 100 rows or 1M rows
+"""
+
+import pandas as pd
+
+# Rows sampled to size the columns, instead of measuring every row
+WIDTH_SAMPLE_ROWS = 200
+MAX_CELL_LENGTH = 100
+MAX_LIST_ITEMS = 3
+
+
+def format_cell(value):
+    """Display text of a cell: lists shortened to a few items, long text truncated"""
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return ''
+        text = ', '.join(str(item) for item in value[:MAX_LIST_ITEMS])
+        if len(value) > MAX_LIST_ITEMS:
+            text += f' (+{len(value) - MAX_LIST_ITEMS} more)'
+        return text
+    try:
+        if pd.isna(value):
+            return ''
+    except (TypeError, ValueError):
+        pass  # Arrays and other values pd.isna can't reduce to one bool
+    text = str(value)
+    if len(text) > MAX_CELL_LENGTH:
+        text = text[:MAX_CELL_LENGTH - 3] + '...'
+    return text
+
+
+class VirtualTable:
+    """Render only the visible window of a DataFrame's rows in a Treeview
+
+    The Treeview keeps one item per visible line and those items are reused:
+    scrolling just rewrites their values from df.iloc[top:top + visible_rows].
+    The scrollbar is driven by the row position in the DataFrame instead of
+    the Treeview's own (tiny) contents. Selection is kept by DataFrame position
+    too and re-applied to the items on every render, so it stays with its rows
+    while they scroll.
+    """
+
+    def __init__(self, tree, scrollbar, row_height=25, even_tag='evenrow', odd_tag='oddrow'):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        self.even_tag = even_tag
+        self.odd_tag = odd_tag
+        self.df = None
+        self.columns = []
+        self.top = 0  # DataFrame position of the first visible row
+        self.visible_rows = 20
+        self.items = []  # Treeview item ids, one per visible line
+        self.all_selected = False  # Every row selected (Ctrl+A) except those in deselected
+        self.selected = set()  # DataFrame positions of selected rows, when not all_selected
+        self.deselected = set()  # DataFrame positions left out of the selection, when all_selected
+
+        self.scrollbar.configure(command=self.yview)
+        self.tree.bind("<Configure>", self.on_resize, add="+")
+        self.tree.bind("<<TreeviewSelect>>", self.on_select, add="+")
+        for key, rows in (("<Up>", -1), ("<Down>", 1)):
+            self.tree.bind(key, lambda event, rows=rows: self.scroll(rows) or "break")
+        self.tree.bind("<Prior>", lambda event: self.scroll(-self.visible_rows) or "break")
+        self.tree.bind("<Next>", lambda event: self.scroll(self.visible_rows) or "break")
+        self.tree.bind("<Home>", lambda event: self.scroll_to(0) or "break")
+        self.tree.bind("<End>", lambda event: self.scroll_to(self.row_count()) or "break")
+
+    def row_count(self):
+        return 0 if self.df is None else len(self.df)
+
+    def set_frame(self, df):
+        """Show a new DataFrame from the top; cost does not depend on its length"""
+        self.df = df
+        self.top = 0
+        self.clear_selection(render=False)  # Positions refer to the previous frame
+        columns = [] if df is None else list(df.columns)
+        if columns != self.columns:
+            self.set_columns(columns)
+        self.render()
+        self.tree.xview_moveto(0)
+
+    def set_columns(self, columns):
+        """Configure headings and widths, measuring only a sample of rows"""
+        self.columns = columns
+        self.clear_items()
+        self.tree['columns'] = columns
+        self.tree['show'] = 'headings'
+        sample = self.df.head(WIDTH_SAMPLE_ROWS) if self.df is not None else pd.DataFrame()
+        for col in columns:
+            display_name = col.replace('_', ' ').title()
+            self.tree.heading(col, text=display_name)
+            col_width = len(display_name) * 12  # Base width for header
+            if col in sample and len(sample) > 0:
+                data_width = sample[col].map(lambda value: len(format_cell(value))).max() * 10
+                col_width = max(col_width, data_width)
+            col_width = max(100, min(col_width, 400))
+            self.tree.column(col, width=col_width, minwidth=80)
+
+    def clear_items(self):
+        if self.items:
+            self.tree.delete(*self.items)
+        self.items = []
+
+    def render(self):
+        """Write the visible window of rows into the reused Treeview items"""
+        total = self.row_count()
+        self.top = max(0, min(self.top, total - self.visible_rows))
+        window = self.df.iloc[self.top:self.top + self.visible_rows] if total else None
+        rows = [] if window is None else list(window.itertuples(index=False, name=None))
+
+        # Grow or shrink the item pool to the number of rows shown
+        while len(self.items) < len(rows):
+            self.items.append(self.tree.insert('', 'end', values=()))
+        if len(self.items) > len(rows):
+            self.tree.delete(*self.items[len(rows):])
+            del self.items[len(rows):]
+
+        selected_items = []
+        for offset, (item, row) in enumerate(zip(self.items, rows)):
+            position = self.top + offset
+            tag = self.even_tag if position % 2 == 0 else self.odd_tag
+            self.tree.item(item, values=[format_cell(value) for value in row], tags=(tag,))
+            if self.is_selected(position):
+                selected_items.append(item)
+        # The items now show other rows, give them those rows' selection
+        self.tree.selection_set(selected_items)
+
+        self.tree.yview_moveto(0)  # The items always fit, keep the Treeview itself unscrolled
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + len(rows)) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def is_selected(self, position):
+        if self.all_selected:
+            return position not in self.deselected
+        return position in self.selected
+
+    def on_select(self, event=None):
+        """Copy the Treeview's selection of the visible items to the selected positions
+
+        Only rows on screen are touched, so rows selected before scrolling stay selected.
+        """
+        chosen = set(self.tree.selection())
+        for offset, item in enumerate(self.items):
+            position = self.top + offset
+            if self.all_selected:
+                if item in chosen:
+                    self.deselected.discard(position)
+                else:
+                    self.deselected.add(position)
+            elif item in chosen:
+                self.selected.add(position)
+            else:
+                self.selected.discard(position)
+
+    def select_all(self):
+        """Select every row of the DataFrame, not just the visible ones"""
+        self.all_selected = True
+        self.selected = set()
+        self.deselected = set()
+        self.render()
+
+    def clear_selection(self, render=True):
+        self.all_selected = False
+        self.selected = set()
+        self.deselected = set()
+        if render and self.df is not None:
+            self.render()
+
+    def selected_positions(self):
+        """DataFrame positions of the selected rows, in order"""
+        if self.all_selected:
+            return [position for position in range(self.row_count()) if position not in self.deselected]
+        return sorted(position for position in self.selected if position < self.row_count())
+
+    def scroll(self, rows):
+        """Move the window by a number of rows (negative scrolls up)"""
+        self.scroll_to(self.top + rows)
+
+    def scroll_to(self, top):
+        top = max(0, min(int(top), max(0, self.row_count() - self.visible_rows)))
+        if top != self.top:
+            self.top = top
+            self.render()
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")"""
+        if not args or self.df is None:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.row_count())
+        elif args[0] == "scroll":
+            amount = int(float(args[1]))
+            if len(args) > 2 and args[2] == "pages":
+                amount *= self.visible_rows
+            self.scroll(amount)
+
+    def on_resize(self, event):
+        """Fit the number of rendered rows to the new widget height"""
+        # One line is taken by the headings
+        visible_rows = max(1, event.height // self.row_height - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            if self.df is not None:
+                self.render()